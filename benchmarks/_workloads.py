@@ -0,0 +1,31 @@
+"""Cheap estimators and evaluators that isolate glassbox's own overhead."""
+import numpy as np
+from sklearn.base import BaseEstimator
+
+from glassbox.schemas import Evaluator
+
+
+class NoOpEstimator(BaseEstimator):
+    """Estimator whose fit and predict do no work."""
+
+    def __init__(self, alpha=1.0, depth=1):
+        self.alpha = alpha
+        self.depth = depth
+
+    def fit(self, X, y):
+        return self
+
+    def predict(self, X):
+        return np.zeros(len(X))
+
+
+class NoOpEvaluator(Evaluator):
+    """Return a score derived from the parameters without touching the data."""
+
+    def evaluate(self, model, X, y) -> float:
+        return float(model.alpha) / (1 + model.depth)
+
+
+def dataset(n_rows, n_features=10, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(n_rows, n_features)), rng.integers(0, 2, n_rows)
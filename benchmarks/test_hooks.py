@@ -0,0 +1,51 @@
+"""Cost of plugin dispatch and logging calls on the trial hot path."""
+import pytest
+
+from glassbox.logger import ConsoleSink, GlassboxLogger
+from glassbox.plugins.base import Plugin
+from glassbox.plugins.manager import PluginManager
+
+METRICS = {"score": 0.5, "step": 1, "trial_id": 1}
+
+
+class Counter(Plugin):
+    def __init__(self):
+        self.calls = 0
+
+    def on_epoch_end(self, metrics):
+        self.calls += 1
+
+
+@pytest.mark.parametrize("async_dispatch", [False, True], ids=["sync", "async"])
+def test_plugin_trigger(benchmark, async_dispatch):
+    pm = PluginManager(async_dispatch=async_dispatch, max_queue=1_000_000)
+    pm.register(Counter())
+    benchmark.group = "plugin trigger"
+    benchmark(pm.trigger, "on_epoch_end", metrics=METRICS)
+    pm.close()
+
+
+class NullSink(ConsoleSink):
+    def write(self, records):
+        pass
+
+
+@pytest.mark.parametrize(
+    "verbose,buffered", [(False, False), (True, False), (True, True)], ids=["disabled", "direct", "buffered"]
+)
+def test_logger_log(benchmark, verbose, buffered):
+    log = GlassboxLogger(use_wandb=False, verbose=verbose, buffered=buffered, flush_interval=60)
+    log.add_sink("console", NullSink())
+    params = {"alpha": 0.1, "depth": 3}
+    benchmark.group = "logger"
+    benchmark(
+        log.log,
+        "%s trial %s: params=%s score=%.4f duration=%.2fs",
+        "Grid",
+        1,
+        params,
+        0.5,
+        0.01,
+        to=["console"],
+    )
+    log.set_buffered(False)
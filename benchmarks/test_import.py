@@ -0,0 +1,16 @@
+"""Wall-clock time of ``import glassbox`` in a fresh interpreter."""
+import subprocess
+import sys
+
+from conftest import ROOT
+
+
+def test_import_glassbox(benchmark):
+    benchmark.group = "import"
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", "import glassbox"],),
+        kwargs={"check": True, "cwd": ROOT},
+        rounds=5,
+        warmup_rounds=1,
+    )
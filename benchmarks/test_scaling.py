@@ -0,0 +1,45 @@
+"""How search time grows with the number of trials and the data size."""
+import pytest
+
+from glassbox.core.evaluator import SklearnEvaluator
+from glassbox.core.search import Search
+from glassbox.core.space import Uniform
+from glassbox.logger import logger
+from sklearn.linear_model import Ridge
+
+from _workloads import NoOpEstimator, NoOpEvaluator, dataset
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    verbose = logger.verbose
+    logger.set_verbose(False)
+    yield
+    logger.set_verbose(verbose)
+
+
+@pytest.mark.parametrize("n_trials", [10, 100, 1000])
+def test_scaling_with_trials(benchmark, n_trials):
+    X, y = dataset(100)
+    benchmark.group = "scaling: trials"
+    benchmark.extra_info["n_trials"] = n_trials
+    benchmark.pedantic(
+        lambda: Search("random", {"alpha": Uniform(0.0, 1.0)}, n_trials=n_trials, seed=0).run(
+            NoOpEstimator(), X, y, NoOpEvaluator()
+        ),
+        rounds=3,
+    )
+
+
+@pytest.mark.parametrize("n_rows", [1_000, 10_000, 100_000])
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_scaling_with_data(benchmark, n_rows, n_jobs):
+    X, y = dataset(n_rows)
+    benchmark.group = f"scaling: rows (n_jobs={n_jobs})"
+    benchmark.extra_info["n_rows"] = n_rows
+    benchmark.pedantic(
+        lambda: Search("grid", {"alpha": [0.1, 1.0, 10.0, 100.0]}, n_jobs=n_jobs).run(
+            Ridge(), X, y, SklearnEvaluator()
+        ),
+        rounds=3,
+    )
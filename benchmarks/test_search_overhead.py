@@ -0,0 +1,41 @@
+"""Per-trial framework overhead of each search strategy."""
+import pytest
+
+from glassbox.core.search import Search
+from glassbox.core.space import IntRange, Uniform
+from glassbox.logger import logger
+
+from _workloads import NoOpEstimator, NoOpEvaluator, dataset
+
+N_TRIALS = 200
+X, y = dataset(100)
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    verbose = logger.verbose
+    logger.set_verbose(False)
+    yield
+    logger.set_verbose(verbose)
+
+
+def _run(search):
+    return search.run(NoOpEstimator(), X, y, NoOpEvaluator())
+
+
+@pytest.mark.parametrize("strategy", ["grid", "random", "optuna"])
+def test_per_trial_overhead(benchmark, strategy):
+    if strategy == "optuna":
+        optuna = pytest.importorskip("optuna")
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+    space = {"alpha": Uniform(0.0, 0.99, step=0.01), "depth": IntRange(1, 2)}
+    benchmark.group = "per-trial overhead"
+    benchmark.extra_info["n_trials"] = N_TRIALS
+    results = benchmark.pedantic(
+        lambda: _run(Search(strategy, space, n_trials=N_TRIALS, seed=0)),
+        rounds=5,
+        warmup_rounds=1,
+    )
+    assert len(results) == N_TRIALS
+    if benchmark.stats:  # None under --benchmark-disable
+        benchmark.extra_info["per_trial_us"] = benchmark.stats.stats.median / N_TRIALS * 1e6
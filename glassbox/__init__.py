@@ -1,14 +1,41 @@
-"""Glassbox package initialization."""
+"""Glassbox package initialization.
 
-from importlib.metadata import PackageNotFoundError, version
+Public names are resolved on first access through a module-level
+``__getattr__``, so ``import glassbox`` does not import scikit-learn,
+pydantic, rich or the search machinery until they are used.
+"""
 
-from glassbox.core.model_search import ModelSearch
+from importlib import import_module
 
-try:  # pragma: no cover - fallback when package metadata is missing
-    __version__ = version("glassbox")
-except PackageNotFoundError:  # pragma: no cover - fallback for local usage
-    __version__ = "0.0.0"
+_LAZY = {
+    "ModelSearch": "glassbox.core.model_search",
+    "Search": "glassbox.core.search",
+    "SearchSpace": "glassbox.core.space",
+    "TrialTable": "glassbox.core.trial_table",
+}
 
-__all__ = ["ModelSearch", "__version__"]
+__all__ = ["ModelSearch", "Search", "SearchSpace", "TrialTable", "__version__"]
 
-# (Leave empty or add package-level imports)
+
+def _version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:  # pragma: no cover - fallback when package metadata is missing
+        return version("glassbox")
+    except PackageNotFoundError:  # pragma: no cover - fallback for local usage
+        return "0.0.0"
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        value = _version()
+    elif name in _LAZY:
+        value = getattr(import_module(_LAZY[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
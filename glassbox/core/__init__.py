@@ -0,0 +1,39 @@
+"""Search engine of Glassbox; names are imported on first access."""
+
+from importlib import import_module
+
+_LAZY = {
+    "ModelSearch": "glassbox.core.model_search",
+    "Search": "glassbox.core.search",
+    "SklearnEvaluator": "glassbox.core.evaluator",
+    "CrossValidationEvaluator": "glassbox.core.evaluator",
+    "SearchSpace": "glassbox.core.space",
+    "Uniform": "glassbox.core.space",
+    "LogUniform": "glassbox.core.space",
+    "IntRange": "glassbox.core.space",
+    "TrialCache": "glassbox.core.cache",
+    "TrialJournal": "glassbox.core.journal",
+    "ModelStore": "glassbox.core.model_store",
+    "TrialTable": "glassbox.core.trial_table",
+    "TrialProfiler": "glassbox.core.profiling",
+    "SharedStudy": "glassbox.core.study",
+    "CoreBudget": "glassbox.utils.threads",
+    "MemoryAdmission": "glassbox.core.admission",
+    "MedianPruner": "glassbox.core.pruning",
+    "PercentilePruner": "glassbox.core.pruning",
+    "SuccessiveHalvingPruner": "glassbox.core.pruning",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,129 @@
+"""Memory-aware admission control for concurrent trials."""
+from __future__ import annotations
+
+import heapq
+import math
+from collections import OrderedDict
+from typing import Any, Dict, Sequence, Tuple
+
+from glassbox.logger import logger
+from glassbox.utils.proc import available_memory
+
+
+def _distance(a: Dict[str, Any], b: Dict[str, Any]) -> float:
+    """Dissimilarity of two configurations, between 0 and 1 per parameter.
+
+    Numbers differ by their relative difference, so ``n_estimators=100`` is
+    closer to ``200`` than to ``2000``; any other change counts fully.
+    """
+    total = 0.0
+    for key in a.keys() | b.keys():
+        x, y = a.get(key), b.get(key)
+        if x == y:
+            continue
+        numeric = all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in (x, y))
+        if numeric and x * y > 0:
+            total += abs(x - y) / max(abs(x), abs(y))
+        else:
+            total += 1.0
+    return total
+
+
+def _key(params: Dict[str, Any]) -> str:
+    return repr(sorted(params.items()))
+
+
+class MemoryAdmission:
+    """Only start trials whose projected memory fits under a ceiling.
+
+    The memory every finished trial added to its worker (its
+    ``rss_increase_mb`` metric: peak RSS above the RSS at trial start, not
+    counting the shared dataset) is remembered together with its parameters.
+    Repeated configurations keep their largest peak and only the ``history``
+    most recently seen configurations are kept. A new trial is estimated from
+    its own earlier peak if its configuration was seen, otherwise from the
+    ``neighbours`` most similar configurations: the largest of their peaks,
+    times ``margin``. Until a first peak is known, a trial is assumed to need
+    the whole ceiling and so runs alone.
+
+    Parameters
+    ----------
+    limit_mb:
+        Memory ceiling for all running trials together, in MB. Defaults to
+        ``headroom`` times the memory available when the search starts.
+    headroom:
+        Fraction of the available memory used when ``limit_mb`` is not set.
+    neighbours:
+        Number of similar earlier trials an estimate is based on.
+    margin:
+        Safety factor applied to estimates.
+    history:
+        Number of distinct configurations remembered.
+    """
+
+    def __init__(
+        self,
+        limit_mb: float | None = None,
+        *,
+        headroom: float = 0.8,
+        neighbours: int = 3,
+        margin: float = 1.2,
+        history: int = 256,
+    ) -> None:
+        if limit_mb is not None and limit_mb <= 0:
+            logger.log("limit_mb must be positive", level="error")
+            raise ValueError("limit_mb must be positive")
+        if neighbours < 1:
+            logger.log("neighbours must be at least 1", level="error")
+            raise ValueError("neighbours must be at least 1")
+        if history < 1:
+            logger.log("history must be at least 1", level="error")
+            raise ValueError("history must be at least 1")
+        self.limit_mb = limit_mb
+        self.headroom = headroom
+        self.neighbours = neighbours
+        self.margin = margin
+        self.history = history
+        self.limit = limit_mb if limit_mb is not None else math.inf
+        self._observed: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+
+    def start(self) -> None:
+        """Resolve the ceiling for the coming search."""
+        if self.limit_mb is not None:
+            self.limit = self.limit_mb
+            return
+        available = available_memory()
+        if available is None:
+            logger.log("MemoryAdmission: available memory unknown; not limiting trials", level="warning")
+            self.limit = math.inf
+        else:
+            self.limit = self.headroom * available / 2**20
+
+    def observe(self, params: Dict[str, Any], peak_mb: float) -> None:
+        """Remember the peak memory a configuration needed."""
+        key = _key(params)
+        seen = self._observed.pop(key, None)
+        peak = float(peak_mb) if seen is None else max(seen[1], float(peak_mb))
+        self._observed[key] = (dict(params), peak)
+        while len(self._observed) > self.history:
+            self._observed.popitem(last=False)
+
+    def estimate(self, configs: Sequence[Dict[str, Any]]) -> float:
+        """Projected peak MB of a task running *configs* one after another."""
+        if not self._observed:
+            return self.limit
+        peaks = []
+        for params in configs:
+            seen = self._observed.get(_key(params))
+            if seen is not None:
+                peaks.append(seen[1])
+                continue
+            nearest = heapq.nsmallest(
+                self.neighbours, self._observed.values(), key=lambda seen: _distance(params, seen[0])
+            )
+            peaks.append(max(peak for _, peak in nearest))
+        return self.margin * max(peaks)
+
+    def admits(self, estimate: float, reserved: float) -> bool:
+        """``True`` if a task of *estimate* MB fits next to *reserved* MB."""
+        return reserved + estimate <= self.limit
@@ -0,0 +1,84 @@
+"""Search-level budgets that end a sweep early."""
+from __future__ import annotations
+
+import math
+import time
+
+from glassbox.logger import logger
+
+
+class SearchBudget:
+    """Track a wall-clock limit, a target score and a patience budget.
+
+    Parameters
+    ----------
+    timeout:
+        Seconds after :meth:`start` at which no new trials are started.
+        Queued trials are cancelled and running ones stop at their next
+        checkpoint (pruning step or warm-start chain link).
+    target_score:
+        Stop once a completed trial scores at least this much.
+    patience:
+        Stop after this many consecutive completed trials that did not
+        improve the best score.
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = None,
+        target_score: float | None = None,
+        patience: int | None = None,
+    ) -> None:
+        if timeout is not None and timeout <= 0:
+            logger.log("timeout must be positive", level="error")
+            raise ValueError("timeout must be positive")
+        if patience is not None and patience < 1:
+            logger.log("patience must be at least 1", level="error")
+            raise ValueError("patience must be at least 1")
+        self.timeout = timeout
+        self.target_score = target_score
+        self.patience = patience
+        self.best = -math.inf
+        self.stale = 0
+        self.reason: str | None = None
+        self._deadline: float | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.timeout is not None or self.target_score is not None or self.patience is not None
+
+    def start(self) -> None:
+        self.best = -math.inf
+        self.stale = 0
+        self.reason = None
+        self._deadline = time.time() + self.timeout if self.timeout is not None else None
+
+    @property
+    def deadline(self) -> float | None:
+        """Wall-clock (``time.time()``) deadline passed to workers."""
+        return self._deadline
+
+    def remaining(self) -> float | None:
+        """Seconds until the deadline, ``None`` without a timeout."""
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.time())
+
+    def expired(self) -> bool:
+        """``True`` once the timeout has passed; records the reason."""
+        if self._deadline is not None and time.time() >= self._deadline:
+            self.reason = self.reason or "timeout"
+        return self.reason is not None
+
+    def update(self, score: float) -> bool:
+        """Account for a completed trial; ``True`` if the budget is used up."""
+        if score > self.best:
+            self.best = score
+            self.stale = 0
+        else:
+            self.stale += 1
+        if self.target_score is not None and self.best >= self.target_score:
+            self.reason = self.reason or "target_score"
+        elif self.patience is not None and self.stale >= self.patience:
+            self.reason = self.reason or "patience"
+        return self.expired()
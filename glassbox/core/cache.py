@@ -0,0 +1,244 @@
+"""Content-addressed on-disk cache of trial outcomes."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from glassbox.logger import logger
+from glassbox.schemas import Evaluator
+
+try:  # pragma: no cover - POSIX only
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+def _update_with_array(digest, array: np.ndarray) -> None:
+    array = np.ascontiguousarray(array)
+    digest.update(f"{array.dtype.str}{array.shape}".encode())
+    if array.dtype.hasobject:
+        digest.update(repr(array.tolist()).encode())
+    else:
+        digest.update(memoryview(array).cast("B"))
+
+
+def fingerprint(data: Any) -> str:
+    """Return a fast content hash of *data*.
+
+    NumPy buffers are hashed directly rather than pickled; pandas objects hash
+    their column buffers plus the column and index labels.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    pd = sys.modules.get("pandas")
+    if isinstance(data, np.ndarray):
+        _update_with_array(digest, data)
+    elif pd is not None and isinstance(data, pd.DataFrame):
+        digest.update(repr(list(data.columns)).encode())
+        _update_with_array(digest, data.index.to_numpy())
+        for name in data.columns:
+            _update_with_array(digest, data[name].to_numpy())
+    elif pd is not None and isinstance(data, pd.Series):
+        digest.update(repr(data.name).encode())
+        _update_with_array(digest, data.index.to_numpy())
+        _update_with_array(digest, data.to_numpy())
+    else:
+        _update_with_array(digest, np.asarray(data))
+    return digest.hexdigest()
+
+
+def _evaluator_config(evaluator: Evaluator) -> str:
+    cls = type(evaluator)
+    public = {k: v for k, v in vars(evaluator).items() if not k.startswith("_")}
+    return f"{cls.__module__}.{cls.__qualname__}{sorted(public.items(), key=lambda kv: kv[0])!r}"
+
+
+class TrialCache:
+    """Skip refitting ``(estimator, params, evaluator, data)`` combinations.
+
+    Entries are stored under *directory* as ``<key>.json`` (metrics and
+    duration) and, with ``store_models=True``, ``<key>.pkl`` (the fitted
+    estimator). Keys hash the estimator class, its full ``get_params()``, the
+    evaluator configuration and a fingerprint of ``X``/``y``. Writes go
+    through a temporary file and :func:`os.replace`, and eviction holds an
+    exclusive file lock, so several processes can share one directory.
+
+    Parameters
+    ----------
+    directory:
+        Cache location, created if missing.
+    max_bytes:
+        Evict the least recently used entries beyond this total size.
+    max_age:
+        Entries older than this many seconds are treated as misses and evicted.
+    store_models:
+        Also persist fitted estimators so hits can return them.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        *,
+        max_bytes: int | None = None,
+        max_age: float | None = None,
+        store_models: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.store_models = store_models
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+    @staticmethod
+    def data_key(X, y) -> str:
+        """Fingerprint the training data once per search."""
+        return f"{fingerprint(X)}:{fingerprint(y)}"
+
+    def key(
+        self,
+        model: Any,
+        params: Dict[str, Any],
+        evaluator: Evaluator,
+        data_key: str,
+        rows: List[int] | None = None,
+    ) -> str:
+        """Return the cache key of one trial."""
+        cls = type(model)
+        full_params = {**model.get_params(), **params}
+        parts = [
+            f"{cls.__module__}.{cls.__qualname__}",
+            repr(sorted(full_params.items(), key=lambda kv: kv[0])),
+            _evaluator_config(evaluator),
+            data_key,
+            "" if rows is None else fingerprint(np.asarray(rows)),
+        ]
+        return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.directory / key[:2] / f"{key}{suffix}"
+
+    def _expired(self, path: Path) -> bool:
+        return self.max_age is not None and time.time() - path.stat().st_mtime > self.max_age
+
+    def get(self, key: str) -> Tuple[Dict[str, float], float] | None:
+        """Return the stored ``(metrics, duration)`` for *key*, if any."""
+        path = self._path(key, ".json")
+        try:
+            if self._expired(path):
+                self.misses += 1
+                return None
+            entry = json.loads(path.read_text())
+            os.utime(path)  # refresh recency for LRU eviction
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["metrics"], entry["duration"]
+
+    def get_model(self, key: str) -> Any | None:
+        """Return the fitted estimator stored for *key*, if any."""
+        path = self._path(key, ".pkl")
+        try:
+            with path.open("rb") as fh:
+                return pickle.load(fh)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def put(
+        self,
+        key: str,
+        metrics: Dict[str, float],
+        duration: float,
+        model: Any | None = None,
+    ) -> None:
+        """Store a trial outcome (and optionally its fitted estimator)."""
+        if self.store_models and model is not None:
+            try:
+                self._atomic_write(self._path(key, ".pkl"), pickle.dumps(model))
+            except (pickle.PicklingError, TypeError, AttributeError) as exc:
+                logger.log(f"TrialCache: could not store model: {exc}", level="warning")
+        entry = {"metrics": metrics, "duration": duration}
+        self._atomic_write(self._path(key, ".json"), json.dumps(entry).encode())
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        if fcntl is None:  # pragma: no cover - Windows
+            yield
+            return
+        with open(self.directory / ".lock", "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def evict(self) -> int:
+        """Apply the age and size limits; returns the number of entries removed."""
+        if self.max_bytes is None and self.max_age is None:
+            return 0
+        removed = 0
+        with self._locked():
+            entries = []
+            now = time.time()
+            for path in self.directory.glob("*/*.json"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                model_path = path.with_suffix(".pkl")
+                size = stat.st_size + (model_path.stat().st_size if model_path.exists() else 0)
+                if self.max_age is not None and now - stat.st_mtime > self.max_age:
+                    removed += self._remove(path)
+                    continue
+                entries.append((stat.st_mtime, size, path))
+            if self.max_bytes is not None:
+                total = sum(size for _, size, _ in entries)
+                for _, size, path in sorted(entries):
+                    if total <= self.max_bytes:
+                        break
+                    removed += self._remove(path)
+                    total -= size
+        return removed
+
+    @staticmethod
+    def _remove(path: Path) -> int:
+        for victim in (path, path.with_suffix(".pkl")):
+            try:
+                victim.unlink()
+            except FileNotFoundError:
+                pass
+        return 1
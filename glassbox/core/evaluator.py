@@ -1,9 +1,16 @@
 """Model evaluation helpers."""
 from __future__ import annotations
 
-from typing import Any
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple
 
+import numpy as np
+
+from glassbox.core.parallel import resolve_n_jobs, take_rows
 from glassbox.schemas import Evaluator
+from glassbox.utils.shared_memory import resolve
 
 
 class SklearnEvaluator(Evaluator):
@@ -14,3 +21,158 @@ class SklearnEvaluator(Evaluator):
 
     def evaluate(self, model: Any, X, y) -> float:
         return float(model.score(X, y))
+
+
+class CrossValidationEvaluator(Evaluator):
+    """Score trials by k-fold cross-validation instead of on the training data.
+
+    Folds are computed once in :meth:`prepare` and reused by every trial of
+    the search. They are kept as one small fold number per sample (or, for
+    splitters whose test sets overlap, one train/test flag per fold and
+    sample) and shared with worker processes like the data, which expand
+    them to index arrays. The search hands over the unfitted estimator, so
+    each trial costs exactly one fit per fold. Folds are fitted on a thread
+    pool when ``n_jobs`` is not ``1``.
+
+    Parameters
+    ----------
+    cv:
+        Number of folds or any scikit-learn splitter. Integers use
+        ``StratifiedKFold`` for classification targets and ``KFold`` otherwise.
+    scoring:
+        ``None`` to use ``estimator.score``, a scikit-learn scoring name, or a
+        callable ``scorer(estimator, X, y)``.
+    n_jobs:
+        Number of folds fitted concurrently.
+    """
+
+    fits_model = True
+
+    def __init__(
+        self,
+        cv: Any = 5,
+        *,
+        scoring: str | Callable[..., float] | None = None,
+        n_jobs: int = 1,
+        shuffle: bool = True,
+        random_state: int | None = 0,
+        name: str = "cv",
+    ) -> None:
+        super().__init__(name)
+        self.cv = cv
+        self.scoring = scoring
+        self.n_jobs = n_jobs
+        self.shuffle = shuffle
+        self.random_state = random_state
+        self._folds: Dict[int, Any] = {}
+        self._splits: Dict[int, List[Tuple[np.ndarray, np.ndarray]]] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Index arrays are rebuilt from the compact folds after unpickling.
+        return {**self.__dict__, "_splits": {}}
+
+    def _splitter(self, y):
+        if not isinstance(self.cv, int):
+            return self.cv
+        from sklearn.model_selection import KFold, StratifiedKFold
+        from sklearn.utils.multiclass import type_of_target
+
+        random_state = self.random_state if self.shuffle else None
+        if y is not None and type_of_target(y) in ("binary", "multiclass"):
+            return StratifiedKFold(self.cv, shuffle=self.shuffle, random_state=random_state)
+        return KFold(self.cv, shuffle=self.shuffle, random_state=random_state)
+
+    def _encode(self, X, y) -> np.ndarray:
+        """Compute the folds for *X* as a compact array.
+
+        Splitters that partition the samples (every sample tested exactly
+        once, trained on in every other fold) give a 1-d array of fold
+        numbers. Anything else gives an ``(n_splits, n_samples)`` array that
+        is 1 for training and 2 for test rows.
+        """
+        n_samples = len(X)
+        splits = list(self._splitter(y).split(X, y))
+        tested = np.zeros(n_samples, dtype=np.intp)
+        for _, test in splits:
+            tested[test] += 1
+        if np.all(tested == 1) and all(len(train) + len(test) == n_samples for train, test in splits):
+            folds = np.empty(n_samples, dtype=np.min_scalar_type(max(len(splits) - 1, 0)))
+            for i, (_, test) in enumerate(splits):
+                folds[test] = i
+            return folds
+        roles = np.zeros((len(splits), n_samples), dtype=np.int8)
+        for i, (train, test) in enumerate(splits):
+            roles[i, train] = 1
+            roles[i, test] = 2
+        return roles
+
+    def splits(self, X, y) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Return cached ``(train, test)`` indices for data of this size."""
+        n_samples = len(X)
+        if n_samples not in self._splits:
+            if n_samples not in self._folds:
+                self._folds[n_samples] = self._encode(X, y)
+            folds = resolve(self._folds[n_samples])
+            if folds.ndim == 1:
+                self._splits[n_samples] = [
+                    (np.flatnonzero(folds != i), np.flatnonzero(folds == i))
+                    for i in range(int(folds.max()) + 1 if len(folds) else 0)
+                ]
+            else:
+                self._splits[n_samples] = [
+                    (np.flatnonzero(roles == 1), np.flatnonzero(roles == 2)) for roles in folds
+                ]
+        return self._splits[n_samples]
+
+    def prepare(self, X, y) -> None:
+        self._splits.clear()
+        self._folds = {len(X): self._encode(X, y)}
+
+    def shared(self, share: Callable[[Any], Any]) -> "CrossValidationEvaluator":
+        evaluator = copy.copy(self)
+        evaluator._folds = {n: share(folds) for n, folds in self._folds.items()}
+        evaluator._splits = {}
+        return evaluator
+
+    def _score(self, model: Any, X, y) -> float:
+        if self.scoring is None:
+            return float(model.score(X, y))
+        if callable(self.scoring):
+            return float(self.scoring(model, X, y))
+        from sklearn.metrics import get_scorer
+
+        return float(get_scorer(self.scoring)(model, X, y))
+
+    def _run_fold(self, model: Any, X, y, train, test) -> Tuple[float, float]:
+        from sklearn.base import clone
+
+        fold_model = clone(model)
+        start = perf_counter()
+        fold_model.fit(take_rows(X, train), take_rows(y, train))
+        fit_time = perf_counter() - start
+        return self._score(fold_model, take_rows(X, test), take_rows(y, test)), fit_time
+
+    def evaluate_metrics(self, model: Any, X, y) -> Dict[str, float]:
+        splits = self.splits(X, y)
+        workers = min(resolve_n_jobs(self.n_jobs), len(splits))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                folds = list(
+                    pool.map(lambda s: self._run_fold(model, X, y, *s), splits)
+                )
+        else:
+            folds = [self._run_fold(model, X, y, train, test) for train, test in splits]
+        scores = np.array([score for score, _ in folds])
+        fit_times = np.array([fit_time for _, fit_time in folds])
+        metrics = {
+            "score": float(scores.mean()),
+            "score_std": float(scores.std()),
+            "fit_time": float(fit_times.mean()),
+        }
+        for i, (score, fit_time) in enumerate(folds):
+            metrics[f"fold_{i}_score"] = float(score)
+            metrics[f"fold_{i}_fit_time"] = float(fit_time)
+        return metrics
+
+    def evaluate(self, model: Any, X, y) -> float:
+        return self.evaluate_metrics(model, X, y)["score"]
@@ -0,0 +1,124 @@
+"""Append-only journal of completed trials for crash-safe searches."""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, List
+
+from glassbox.logger import logger
+from glassbox.schemas import TrialResult
+
+
+class TrialJournal:
+    """Record every completed trial as one JSON line.
+
+    The first line is a header describing the search so that a journal is
+    never resumed by a different search; it also stores the seed of the
+    search, which a resumed run adopts (see :meth:`read_header`). Each trial line is flushed (and by
+    default ``fsync``-ed) as soon as the trial completes, so a crash loses at
+    most the trials that were still running. A torn last line from a crash is
+    ignored when the journal is loaded.
+
+    Parameters must be JSON-serializable to be resumed exactly; other values
+    are stored using their ``repr``.
+    """
+
+    def __init__(self, path: str | os.PathLike, *, fsync: bool = True) -> None:
+        self.path = Path(path)
+        self.fsync = fsync
+        self._fh: IO[str] | None = None
+
+    @staticmethod
+    def _encode(record: Dict[str, Any]) -> str:
+        return json.dumps(record, default=repr) + "\n"
+
+    def read_header(self) -> Dict[str, Any] | None:
+        """Return the header of an existing journal, if it has one."""
+        if not self.path.exists():
+            return None
+        with self.path.open() as fh:
+            try:
+                record = json.loads(fh.readline())
+            except ValueError:
+                return None
+        return record if record.get("type") == "header" else None
+
+    def load(self, header: Dict[str, Any]) -> List[TrialResult]:
+        """Return the trials completed by a previous run of the same search.
+
+        The seed is not compared, as a resumed run adopts the stored one.
+        """
+        if not self.path.exists():
+            return []
+        results: Dict[int, TrialResult] = {}
+        with self.path.open() as fh:
+            for lineno, line in enumerate(fh):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # torn write from a crash
+                if lineno == 0:
+                    expected = {k: v for k, v in json.loads(self._encode(header)).items() if k != "seed"}
+                    stored = {k: v for k, v in record.items() if k != "seed"}
+                    if record.get("type") != "header" or expected != stored:
+                        logger.log(f"Journal {self.path} belongs to a different search", level="error")
+                        raise ValueError(f"Journal {self.path} belongs to a different search")
+                    continue
+                if record.get("type") != "trial":
+                    continue
+                results[record["trial_id"]] = TrialResult(
+                    trial_id=record["trial_id"],
+                    params=record["params"],
+                    metrics=record["metrics"],
+                    duration=record["duration"],
+                    budget=record.get("budget"),
+                    state=record.get("state", "complete"),
+                    intermediate=record.get("intermediate", {}),
+                )
+        return [results[k] for k in sorted(results)]
+
+    def start(self, header: Dict[str, Any], completed: Iterable[TrialResult] = ()) -> None:
+        """Atomically rewrite the journal with *header* and *completed* trials.
+
+        Rewriting compacts duplicates and drops torn lines before new trials
+        are appended.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}-")
+        with os.fdopen(fd, "w") as fh:
+            fh.write(self._encode(header))
+            for result in completed:
+                fh.write(self._encode(self._trial_record(result)))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self.path)
+        self._fh = self.path.open("a")
+
+    @staticmethod
+    def _trial_record(result: TrialResult) -> Dict[str, Any]:
+        return {
+            "type": "trial",
+            "trial_id": result.trial_id,
+            "params": result.params,
+            "metrics": result.metrics,
+            "duration": result.duration,
+            "budget": result.budget,
+            "state": result.state,
+            "intermediate": result.intermediate,
+        }
+
+    def append(self, result: TrialResult) -> None:
+        """Durably record one completed trial."""
+        if self._fh is None:
+            raise RuntimeError("TrialJournal.start() must be called before append()")
+        self._fh.write(self._encode(self._trial_record(result)))
+        self._fh.flush()
+        if self.fsync:
+            os.fsync(self._fh.fileno())
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
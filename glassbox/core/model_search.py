@@ -1,18 +1,64 @@
 """High-level ModelSearch API."""
 from __future__ import annotations
 
-from typing import Any, List
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, List
 
-from glassbox.plugins import Plugin, PluginManager
-from glassbox.tracking.wandb_tracker import WandbTracker
+import numpy as np
+
+from glassbox.core.admission import MemoryAdmission
+from glassbox.core.budget import SearchBudget
+from glassbox.core.cache import TrialCache
+from glassbox.core.journal import TrialJournal
+from glassbox.core.model_store import ModelStore
+from glassbox.core.trial_table import TrialTable
+from glassbox.plugins.base import Plugin
+from glassbox.plugins.manager import PluginManager
+from glassbox.plugins.resource_monitor import ResourceMonitor
 from glassbox.utils.gpu import is_gpu_available, supports_gpu
+from glassbox.utils.threads import CoreBudget
 from glassbox.logger import logger
 from glassbox.core.search import Search
-from glassbox.schemas import Evaluator
+from glassbox.schemas import Evaluator, TrialResult
 
 
 class ModelSearch:
-    """Orchestrates hyperparameter search with optional tracking and plugins."""
+    """Orchestrates hyperparameter search with optional tracking and plugins.
+
+    Options that configure the search (``n_jobs``, ``executor``, ``cache``,
+    ``journal``, ``resume``, the budget, ``cores``, ``memory_limit`` and
+    ``model_store``) are applied to the ``Search`` only while :meth:`search`
+    runs and restored afterwards.
+
+    The fitted estimator of the best trial is kept in a
+    :class:`~glassbox.core.model_store.ModelStore` (``model_store``, by default
+    the search's own store or the single best model in memory) and returned
+    without refitting. Workers only send back models that can enter the store. If it is
+    not available, the final refit runs in the background while the tracker
+    and plugins shut down.
+
+    ``async_plugins=True`` delivers plugin hooks from a background thread so
+    slow plugins do not hold up trials; pending events are flushed at
+    ``on_training_end`` and the thread is stopped when :meth:`search`
+    returns. Exceptions raised by hooks then no longer abort the search;
+    they are logged and collected in ``plugin_manager.errors``.
+
+    With ``tracking="wandb"``, ``tracking="local"`` (a SQLite
+    ``LocalTracker`` in ``glassbox.db``) or a tracker instance, every
+    trial is sent to the tracker as soon as it completes.
+
+    ``timeout``, ``target_score`` and ``patience`` end the search early (see
+    :class:`~glassbox.core.search.Search`); the best trial found so far is
+    returned.
+
+    ``cores`` splits a CPU budget between concurrent trials (see
+    :class:`~glassbox.utils.threads.CoreBudget`) and ``memory_limit`` keeps
+    concurrent trials under a memory ceiling (see
+    :class:`~glassbox.core.admission.MemoryAdmission`).
+
+    Registering a :class:`~glassbox.plugins.resource_monitor.ResourceMonitor`
+    turns on per-trial resource sampling in the workers.
+    """
 
     def __init__(
         self,
@@ -21,21 +67,77 @@ class ModelSearch:
         evaluator: Evaluator,
         plugins: List[Plugin] | None = None,
         *,
-        tracking: str | None = None,
+        tracking: str | Any | None = None,
         enable_gpu: bool = False,
         verbose: bool = False,
         show_progress: bool = True,
+        n_jobs: int | None = None,
+        executor: Executor | None = None,
+        cache: TrialCache | None = None,
+        journal: TrialJournal | str | None = None,
+        resume: bool = False,
+        model_store: ModelStore | None = None,
+        async_plugins: bool = False,
+        timeout: float | None = None,
+        target_score: float | None = None,
+        patience: int | None = None,
+        cores: CoreBudget | int | None = None,
+        memory_limit: MemoryAdmission | float | None = None,
     ) -> None:
         self.model = model
         self.searcher = search
         self.evaluator = evaluator
-        self.tracker = WandbTracker() if tracking == "wandb" else None
+        if tracking is None or not isinstance(tracking, str):
+            self.tracker = tracking
+        elif tracking == "wandb":
+            from glassbox.tracking.wandb_tracker import WandbTracker
+
+            self.tracker = WandbTracker()
+        elif tracking == "local":
+            from glassbox.tracking.local_tracker import LocalTracker
+
+            self.tracker = LocalTracker()
+        else:
+            logger.log(f"Unknown tracking backend: {tracking}", level="error")
+            raise ValueError(f"Unknown tracking backend: {tracking}")
         self.enable_gpu = enable_gpu
         self.verbose = verbose
         self.show_progress = show_progress
-        self.plugin_manager = PluginManager()
+        # Applied to the searcher only while :meth:`search` runs, so the
+        # caller's ``Search`` is left as it was.
+        overrides: Dict[str, Any] = {}
+        if n_jobs is not None:
+            overrides["n_jobs"] = n_jobs
+        if executor is not None:
+            overrides["executor"] = executor
+        if cache is not None:
+            overrides["cache"] = cache
+        if journal is not None:
+            overrides["journal"] = journal if isinstance(journal, TrialJournal) else TrialJournal(journal)
+        if resume:
+            overrides["resume"] = True
+        if timeout is not None or target_score is not None or patience is not None:
+            overrides["budget"] = SearchBudget(timeout, target_score, patience)
+        if cores is not None:
+            overrides["cores"] = CoreBudget(cores) if isinstance(cores, int) else cores
+        if memory_limit is not None:
+            if not isinstance(memory_limit, MemoryAdmission):
+                memory_limit = MemoryAdmission(memory_limit)
+            overrides["memory_limit"] = memory_limit
+        if model_store is None:
+            model_store = self.searcher.model_store if self.searcher.model_store is not None else ModelStore(k=1)
+        self.model_store = overrides["model_store"] = model_store
+        self.results: TrialTable | None = None
+        self.plugin_manager = PluginManager(async_dispatch=async_plugins)
         for plugin in (plugins or [Plugin()]):
             self.plugin_manager.register(plugin)
+            if isinstance(plugin, ResourceMonitor) and self.searcher.resource_interval is None:
+                # Let workers measure each trial for the monitor.
+                overrides.setdefault("resource_interval", plugin.interval)
+        self._overrides = overrides
+        if self.tracker is not None:
+            # Trials are streamed to the tracker as they complete.
+            self.plugin_manager.register(self.tracker)
 
         logger.set_verbose(verbose)
 
@@ -48,25 +150,80 @@ class ModelSearch:
                 raise RuntimeError("Model does not appear to support GPU")
 
     def search(self, X, y):
-        if self.tracker:
-            self.tracker.start({"strategy": self.searcher.name})
-        self.plugin_manager.trigger("on_training_start")
-        results = self.searcher.run(
-            self.model,
-            X,
-            y,
-            evaluator=self.evaluator,
-            show_progress=self.show_progress,
-            plugin_manager=self.plugin_manager,
-        )
-        for res in results:
+        saved = {name: getattr(self.searcher, name) for name in self._overrides}
+        for name, value in self._overrides.items():
+            setattr(self.searcher, name, value)
+        try:
             if self.tracker:
-                self.tracker.log(res.trial_id, res.metrics)
-        if self.tracker:
-            self.tracker.finish()
-        self.plugin_manager.trigger("on_training_end")
-        best = max(results, key=lambda r: r.metrics.get("score", 0.0))
+                self.tracker.start({"strategy": self.searcher.name})
+            self.plugin_manager.trigger("on_training_start")
+            results = self.searcher.run(
+                self.model,
+                X,
+                y,
+                evaluator=self.evaluator,
+                show_progress=self.show_progress,
+                plugin_manager=self.plugin_manager,
+            )
+        except BaseException:
+            self.plugin_manager.close()
+            raise
+        finally:
+            for name, value in saved.items():
+                setattr(self.searcher, name, value)
+        self.results = results
+        best = self._best(results)
         logger.log(f"Best trial {best.trial_id} with params {best.params}")
-        best_model = self.model.__class__(**{**self.model.get_params(), **best.params})
-        best_model.fit(X, y)
+        best_model = self._stored_model(best)
+        refit = None
+        if best_model is None:
+            # Overlap the refit with tracker and plugin teardown.
+            pool = ThreadPoolExecutor(max_workers=1)
+            refit = pool.submit(self._refit, best.params, X, y)
+            pool.shutdown(wait=False)
+        try:
+            # Deliver queued trial events before the tracker closes its run.
+            self.plugin_manager.flush()
+            if self.tracker:
+                self.tracker.finish()
+            self.plugin_manager.trigger("on_training_end")
+        finally:
+            # Stop the dispatch thread so it does not outlive the search.
+            self.plugin_manager.close()
+            if refit is not None:
+                best_model = refit.result()
+            logger.flush()
         return best_model
+
+    @staticmethod
+    def _best(results: TrialTable) -> TrialResult:
+        if len(results) == 0:
+            # e.g. every trial ran out of memory and was skipped
+            logger.log("No trial completed", level="error")
+            raise RuntimeError("No trial completed")
+        mask = results.states == "complete"
+        if not mask.any():
+            mask[:] = True
+        budgets = results.budgets
+        if not np.isnan(budgets[mask]).all():
+            # Only compare trials that were trained on the full budget.
+            mask &= budgets == np.nanmax(budgets[mask])
+        candidates = results.filter(mask)
+        return candidates[int(candidates.best_indices(1)[0])]
+
+    def _stored_model(self, best):
+        """Return the already fitted model of *best*, if one was kept."""
+        stored = self.model_store.get(best.trial_id)
+        if stored is not None:
+            return stored
+        cache = self._overrides.get("cache", self.searcher.cache)
+        if cache is not None and cache.store_models:
+            # The search fingerprinted the data already; hashing it again costs a full pass.
+            key = cache.key(self.model, best.params, self.evaluator, self.searcher._data_key)
+            return cache.get_model(key)
+        return None
+
+    def _refit(self, params, X, y):
+        model = self.model.__class__(**{**self.model.get_params(), **params})
+        model.fit(X, y)
+        return model
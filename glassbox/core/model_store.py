@@ -0,0 +1,120 @@
+"""Bounded store of the best fitted trial models."""
+from __future__ import annotations
+
+import heapq
+import math
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from glassbox.logger import logger
+
+
+class ModelStore:
+    """Keep the fitted models of the top ``k`` trials by score.
+
+    Models live in memory by default, or are pickled under *directory* when
+    one is given. ``max_bytes`` bounds the pickled size of a single model;
+    larger models are not kept and the caller falls back to refitting.
+
+    Parameters
+    ----------
+    k:
+        Number of best trials whose models are retained.
+    max_bytes:
+        Skip models whose pickled size exceeds this many bytes.
+    directory:
+        Store models on disk instead of in memory.
+    """
+
+    def __init__(
+        self,
+        k: int = 1,
+        *,
+        max_bytes: int | None = None,
+        directory: str | os.PathLike | None = None,
+    ) -> None:
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        # Min-heap of (score, trial_id) so the worst kept trial is evicted first.
+        self._heap: List[Tuple[float, int]] = []
+        self._models: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def clear(self) -> None:
+        with self._lock:
+            for _, trial_id in self._heap:
+                self._discard(trial_id)
+            self._heap = []
+
+    def threshold(self) -> float:
+        """Score a model has to beat to be kept."""
+        with self._lock:
+            return -math.inf if len(self._heap) < self.k else self._heap[0][0]
+
+    def wants(self, score: float) -> bool:
+        """Return ``True`` if a model with *score* would be kept."""
+        return len(self._heap) < self.k or score > self._heap[0][0]
+
+    def offer(self, trial_id: int, score: float, model: Any) -> bool:
+        """Keep *model* if it ranks among the top ``k``; returns whether it did."""
+        with self._lock:
+            if model is None or not self.wants(score):
+                return False
+            payload = None
+            if self.max_bytes is not None or self.directory is not None:
+                try:
+                    payload = pickle.dumps(model)
+                except (pickle.PicklingError, TypeError, AttributeError) as exc:
+                    logger.log(f"ModelStore: cannot keep trial {trial_id}: {exc}", level="warning")
+                    return False
+                if self.max_bytes is not None and len(payload) > self.max_bytes:
+                    return False
+            if len(self._heap) >= self.k:
+                _, evicted = heapq.heappop(self._heap)
+                self._discard(evicted)
+            heapq.heappush(self._heap, (score, trial_id))
+            if self.directory is None:
+                self._models[trial_id] = model
+            else:
+                self._write(trial_id, payload)
+            return True
+
+    def get(self, trial_id: int) -> Any | None:
+        """Return the stored model of *trial_id*, or ``None``."""
+        with self._lock:
+            if self.directory is None:
+                return self._models.get(trial_id)
+            try:
+                with self._path(trial_id).open("rb") as fh:
+                    return pickle.load(fh)
+            except FileNotFoundError:
+                return None
+
+    def _path(self, trial_id: int) -> Path:
+        return self.directory / f"trial-{trial_id}.pkl"
+
+    def _write(self, trial_id: int, payload: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+        os.replace(tmp, self._path(trial_id))
+
+    def _discard(self, trial_id: int) -> None:
+        self._models.pop(trial_id, None)
+        if self.directory is not None:
+            try:
+                self._path(trial_id).unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,220 @@
+"""Executor helpers for running search trials concurrently."""
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, NamedTuple, Sequence, Tuple
+
+from glassbox.core.profiling import PhaseTimer, capture
+from glassbox.core.pruning import CurveHistory, Pruner, fit_with_pruning
+from glassbox.schemas import Evaluator
+from glassbox.utils.shared_memory import SharedArray, resolve
+from glassbox.utils.threads import CoreBudget, init_worker, thread_params
+
+
+class SerialExecutor(Executor):
+    """Executor that runs every task immediately in the calling thread.
+
+    Used when ``n_jobs=1`` so the sequential path shares the same scheduling
+    loop as the pooled backends without paying for a pool.
+    """
+
+    _max_workers = 1
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """Translate a joblib-style ``n_jobs`` value into a worker count.
+
+    Negative values count back from the number of CPUs, so ``-1`` means all
+    cores and ``-2`` all but one.
+    """
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer")
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def make_executor(n_jobs: int, backend: str = "process", cores: CoreBudget | None = None) -> Executor:
+    """Create an executor with ``n_jobs`` workers for the given *backend*.
+
+    With *cores*, process workers cap their native thread pools at their
+    share of the budget and, if it pins, every worker is bound to its own
+    CPU set. Thread pools share one process, so their limit is set by the
+    caller (see :func:`~glassbox.utils.threads.limit_threads`).
+    """
+    workers = resolve_n_jobs(n_jobs)
+    if workers == 1:
+        return SerialExecutor()
+    if backend not in ("process", "thread"):
+        raise ValueError(f"Unknown executor backend: {backend}")
+    kwargs: Dict[str, Any] = {}
+    if cores is not None:
+        threads = cores.threads_per_trial(workers) if backend == "process" else None
+        cpu_sets = None
+        if cores.pin:
+            cpu_sets = multiprocessing.Queue() if backend == "process" else queue.Queue()
+            for cpus in cores.cpu_sets(workers):
+                cpu_sets.put(cpus)
+        kwargs = {"initializer": init_worker, "initargs": (threads, cpu_sets)}
+    if backend == "process":
+        return ProcessPoolExecutor(max_workers=workers, **kwargs)
+    return ThreadPoolExecutor(max_workers=workers, **kwargs)
+
+
+def uses_processes(executor: Executor) -> bool:
+    """Return ``True`` if tasks submitted to *executor* leave this process."""
+    return isinstance(executor, ProcessPoolExecutor)
+
+
+def executor_workers(executor: Executor) -> int:
+    """Best-effort number of workers backing *executor*."""
+    return int(getattr(executor, "_max_workers", None) or os.cpu_count() or 1)
+
+
+def take_rows(data: Any, rows: Sequence[int]) -> Any:
+    """Select *rows* (a list or NumPy index array) from an array, pandas object or sequence."""
+    if hasattr(data, "iloc"):
+        return data.iloc[rows]
+    if hasattr(data, "shape"):
+        return data[rows]
+    return [data[i] for i in rows]
+
+
+def worker_id() -> Tuple[int, int]:
+    """``(pid, thread id)`` of the worker running the current trial."""
+    return os.getpid(), threading.get_ident()
+
+
+class KeepModel(NamedTuple):
+    """Which fitted models a worker sends back to the parent.
+
+    Only models scoring above ``threshold`` whose pickled size is at most
+    ``max_bytes`` are kept, and a warm-start chain keeps at most ``k`` of
+    its own. The parent sets the threshold from its
+    :class:`~glassbox.core.model_store.ModelStore` when the task is
+    submitted, so models the store would reject are never transferred.
+    """
+
+    threshold: float = -math.inf
+    max_bytes: int | None = None
+    k: int | None = None
+
+    def wants(self, model: Any, score: float) -> bool:
+        if not score > self.threshold:
+            return False
+        if self.max_bytes is None:
+            return True
+        try:
+            return len(pickle.dumps(model)) <= self.max_bytes
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+
+
+class TrialOutcome(NamedTuple):
+    """What a worker sends back to the parent for one trial.
+
+    ``timings`` holds the seconds spent per phase (see
+    :class:`~glassbox.core.profiling.PhaseTimer`) and is empty for cached or
+    resumed trials. ``profile`` is only set when profiling was requested and
+    ``resources`` only when resource sampling was.
+    """
+
+    metrics: Dict[str, float]
+    duration: float
+    model: Any | None = None
+    intermediate: Dict[int, float] = {}
+    state: str = "complete"
+    timings: Dict[str, float] = {}
+    worker: Tuple[int, int] = (0, 0)
+    profile: Dict[str, Any] | None = None
+    resources: Dict[str, float] = {}
+
+
+def fit_and_score(
+    model: Any,
+    params: Dict[str, Any],
+    X,
+    y,
+    evaluator: Evaluator,
+    rows: Sequence[int] | SharedArray | None = None,
+    *,
+    keep_model: KeepModel | None = None,
+    pruner: Pruner | None = None,
+    history: CurveHistory | None = None,
+    n_steps: int = 10,
+    profile: Tuple[bool, bool] = (False, False),
+    sample_interval: float | None = None,
+    deadline: float | None = None,
+    threads: int | None = None,
+) -> TrialOutcome:
+    """Build, fit and score one trial.
+
+    Defined at module level so it can be pickled into process pool workers.
+    *X* and *y* may be shared memory handles, which are attached read-only,
+    and *rows* (an index array or its shared handle) restricts the trial to a
+    subsample of the data. Evaluators with
+    ``fits_model`` set receive the unfitted estimator. The fitted model is
+    only sent back when *keep_model* wants it. With a *pruner* the model is
+    fitted in up to *n_steps* increments and scored after each one, and
+    stopped when a score falls below the *history*'s threshold for its step.
+    ``profile=(cpu, memory)`` runs the trial under cProfile and/or
+    tracemalloc. With a *sample_interval* the worker's process tree is
+    sampled during the trial (see :class:`~glassbox.utils.proc.ResourceSampler`).
+    A pruned fit stops at the first checkpoint after the wall-clock
+    *deadline* and is reported as ``"cancelled"``. *threads* caps thread-count
+    parameters such as ``n_jobs`` unless the trial's *params* set them.
+
+    The duration covers fitting and scoring; the time spent in each phase,
+    including construction and data handling, is returned as ``timings``.
+    """
+    timer = PhaseTimer()
+    with capture(*profile, sample_interval=sample_interval) as payload:
+        X, y = resolve(X), resolve(y)
+        if rows is not None:
+            rows = resolve(rows)
+            X, y = take_rows(X, rows), take_rows(y, rows)
+        with timer.phase("construct"):
+            defaults = model.get_params()
+            trial_model = model.__class__(**{**defaults, **thread_params(defaults, threads), **params})
+        intermediate: Dict[int, float] = {}
+        state = "complete"
+        if pruner is not None and not evaluator.fits_model:
+            metrics, intermediate, state = fit_with_pruning(
+                trial_model, X, y, evaluator, pruner, history, n_steps, timer, deadline
+            )
+        else:
+            if not evaluator.fits_model:
+                with timer.phase("fit"):
+                    trial_model.fit(X, y)
+            with timer.phase("evaluate"):
+                metrics = evaluator.evaluate_metrics(trial_model, X, y)
+    resources = payload.pop("resources", {})
+    duration = timer.timings["fit"] + timer.timings["evaluate"]
+    fitted = None
+    if keep_model is not None and state == "complete" and not evaluator.fits_model:
+        fitted = trial_model if keep_model.wants(trial_model, metrics["score"]) else None
+    return TrialOutcome(
+        metrics,
+        duration,
+        fitted,
+        intermediate,
+        state,
+        timer.finish(),
+        worker_id(),
+        payload or None,
+        resources,
+    )
@@ -0,0 +1,288 @@
+"""Per-trial phase timing and opt-in profiling."""
+from __future__ import annotations
+
+import cProfile
+import heapq
+import json
+import marshal
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Tuple
+
+from glassbox.utils.proc import ResourceSampler
+
+PHASES = ("construct", "fit", "evaluate", "overhead")
+
+# Only one cProfile profiler may be active per process (Python 3.12+), so
+# profiled trials on a thread pool take turns.
+_cpu_lock = threading.Lock()
+# tracemalloc is process-wide: it is started by the first tracing trial and
+# stopped when the last one finishes.
+_tracing_lock = threading.Lock()
+_tracers = 0
+_owns_tracing = False
+
+
+def _start_tracing() -> None:
+    global _tracers, _owns_tracing
+    with _tracing_lock:
+        if _tracers == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _owns_tracing = True
+        _tracers += 1
+
+
+def _stop_tracing() -> None:
+    global _tracers, _owns_tracing
+    with _tracing_lock:
+        _tracers -= 1
+        if _tracers == 0 and _owns_tracing:
+            tracemalloc.stop()
+            _owns_tracing = False
+
+
+class PhaseTimer:
+    """Accumulate wall-clock time per phase of one trial.
+
+    ``overhead`` is whatever part of the trial's total time was not spent in
+    a named phase: attaching shared data, subsampling rows, snapshotting the
+    model and building the outcome.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        self._entered = perf_counter()
+        self.offset: float | None = None
+        self.timings: Dict[str, float] = {"construct": 0.0, "fit": 0.0, "evaluate": 0.0}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        if self.offset is None:
+            self.offset = start - self._entered
+        try:
+            yield
+        finally:
+            self.timings[name] += perf_counter() - start
+
+    def finish(self) -> Dict[str, float]:
+        """Return the phase timings plus ``start``/``offset`` for timelines."""
+        total = perf_counter() - self._entered
+        timings = dict(self.timings)
+        timings["overhead"] = max(0.0, total - sum(self.timings.values()))
+        timings["start"] = self.started
+        timings["offset"] = self.offset or 0.0
+        return timings
+
+
+def phase_metrics(timings: Dict[str, float]) -> Dict[str, float]:
+    """Return the ``<phase>_time`` metrics recorded for a trial."""
+    return {f"{name}_time": timings[name] for name in PHASES if name in timings}
+
+
+@contextmanager
+def capture(
+    cpu: bool,
+    memory: bool,
+    memory_top: int = 10,
+    *,
+    sample_interval: float | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Profile the enclosed block; the yielded dict receives the payload.
+
+    ``cpu`` stores the cProfile statistics as ``"stats"`` and ``memory``
+    stores the traced peak and the largest allocation sites. Only one CPU
+    profile can run per process, so concurrent trials of a thread backend
+    are profiled one at a time. tracemalloc is process-wide, so with a
+    thread backend the memory numbers of concurrent trials overlap. A
+    *sample_interval* stores the
+    :class:`~glassbox.utils.proc.ResourceSampler` summary as ``"resources"``.
+    """
+    payload: Dict[str, Any] = {}
+    if sample_interval:
+        sampler = ResourceSampler(sample_interval).start()
+        try:
+            with capture(cpu, memory, memory_top) as payload:
+                yield payload
+        finally:
+            payload["resources"] = sampler.stop()
+        return
+    if not cpu and not memory:
+        yield payload
+        return
+    if cpu:
+        _cpu_lock.acquire()
+    profiler = cProfile.Profile() if cpu else None
+    if memory:
+        _start_tracing()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield payload
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                profiler.create_stats()
+                payload["stats"] = profiler.stats
+            if memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                top = tracemalloc.take_snapshot().statistics("lineno")[:memory_top]
+                payload["memory"] = {
+                    "peak": max(0, peak - baseline),
+                    "top": [(str(stat.traceback), stat.size) for stat in top],
+                }
+    finally:
+        if memory:
+            _stop_tracing()
+        if cpu:
+            _cpu_lock.release()
+
+
+class _LoadedStats:
+    """Adapter letting :class:`pstats.Stats` read a stats dictionary."""
+
+    def __init__(self, stats: Dict[Any, Any]) -> None:
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class TrialProfiler:
+    """Profile trials and keep the captures of the slowest ``top_n``.
+
+    Pass it as ``Search(..., profiler=TrialProfiler())``. Every trial is run
+    under cProfile (and tracemalloc with ``memory=True``) in its worker; on
+    a thread backend CPU-profiled trials therefore run one at a time. The
+    parent keeps the payloads of the ``top_n`` slowest trials only. Phase
+    timings of all trials are collected for :meth:`export_chrome_trace`,
+    whose timeline shows one row per worker so idle gaps between trials are
+    visible.
+    """
+
+    def __init__(
+        self, top_n: int = 5, *, cpu: bool = True, memory: bool = False, memory_top: int = 10
+    ) -> None:
+        self.top_n = top_n
+        self.cpu = cpu
+        self.memory = memory
+        self.memory_top = memory_top
+        self.spans: List[Dict[str, Any]] = []
+        self._slowest: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans = []
+            self._slowest = []
+
+    def record(
+        self,
+        trial_id: int,
+        params: Dict[str, Any],
+        timings: Dict[str, float],
+        worker: Tuple[int, int],
+        profile: Dict[str, Any] | None,
+    ) -> None:
+        """Add a finished trial's timings and, if among the slowest, its profile.
+
+        Trials are ranked by construction, fit and evaluation time; overhead
+        is left out because it includes the cost of profiling itself.
+        """
+        total = sum(timings.get(name, 0.0) for name in PHASES[:3])
+        with self._lock:
+            self.spans.append(
+                {"trial_id": trial_id, "params": params, "worker": worker, "timings": timings}
+            )
+            if not profile:
+                return
+            entry = (total, trial_id, profile)
+            if len(self._slowest) < self.top_n:
+                heapq.heappush(self._slowest, entry)
+            elif total > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def slowest(self) -> List[Tuple[int, float]]:
+        """``(trial_id, seconds)`` of the profiled trials, slowest first."""
+        return [(tid, total) for total, tid, _ in sorted(self._slowest, reverse=True)]
+
+    def _payload(self, trial_id: int) -> Dict[str, Any]:
+        for _, tid, payload in self._slowest:
+            if tid == trial_id:
+                return payload
+        raise KeyError(f"trial {trial_id} was not profiled")
+
+    def stats(self, trial_id: int) -> pstats.Stats:
+        """Return the cProfile statistics of a profiled trial."""
+        return pstats.Stats(_LoadedStats(self._payload(trial_id)["stats"]))
+
+    def memory_profile(self, trial_id: int) -> Dict[str, Any]:
+        """Return ``{"peak": bytes, "top": [(location, bytes), ...]}`` of a trial."""
+        return self._payload(trial_id)["memory"]
+
+    def dump(self, directory: str | os.PathLike) -> List[Path]:
+        """Write ``trial-<id>.prof`` (and ``.memory.json``) files for the slowest trials."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        written = []
+        for trial_id, _ in self.slowest():
+            payload = self._payload(trial_id)
+            if "stats" in payload:
+                path = directory / f"trial-{trial_id}.prof"
+                with path.open("wb") as fh:
+                    marshal.dump(payload["stats"], fh)
+                written.append(path)
+            if "memory" in payload:
+                path = directory / f"trial-{trial_id}.memory.json"
+                path.write_text(json.dumps(payload["memory"], indent=2))
+                written.append(path)
+        return written
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Return the trials as a Chrome trace (``chrome://tracing``/Perfetto) document."""
+        if not self.spans:
+            return {"traceEvents": []}
+        origin = min(span["timings"]["start"] for span in self.spans)
+        threads: Dict[Tuple[int, int], int] = {}
+        events: List[Dict[str, Any]] = []
+        for span in sorted(self.spans, key=lambda s: s["timings"]["start"]):
+            timings = span["timings"]
+            pid, ident = span["worker"]
+            tid = threads.setdefault((pid, ident), len(threads) + 1)
+            start = (timings["start"] - origin) * 1e6
+            total = sum(timings.get(name, 0.0) for name in PHASES) * 1e6
+            common = {"ph": "X", "pid": pid, "tid": tid, "cat": "trial"}
+            events.append(
+                {
+                    **common,
+                    "name": f"trial {span['trial_id']}",
+                    "ts": start,
+                    "dur": total,
+                    "args": {"params": repr(span["params"])},
+                }
+            )
+            cursor = start + timings.get("offset", 0.0) * 1e6
+            for name in ("construct", "fit", "evaluate"):
+                duration = timings.get(name, 0.0) * 1e6
+                events.append({**common, "name": name, "ts": cursor, "dur": duration})
+                cursor += duration
+        for (pid, ident), tid in threads.items():
+            events.append(
+                {"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": f"worker {pid}/{tid}"}}
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str | os.PathLike) -> Path:
+        """Write :meth:`chrome_trace` to *path* as JSON."""
+        path = Path(path)
+        path.write_text(json.dumps(self.chrome_trace()))
+        return path
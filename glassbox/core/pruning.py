@@ -0,0 +1,279 @@
+"""Intermediate evaluation and early stopping of losing trials."""
+from __future__ import annotations
+
+import heapq
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from glassbox.core.profiling import PhaseTimer
+from glassbox.schemas import Evaluator
+
+Curve = Dict[int, float]
+
+
+class Pruner(ABC):
+    """Decide whether a running trial should stop early.
+
+    A pruner turns the scores that finished trials reached at each step into
+    one threshold per step; a trial scoring below the threshold of a step is
+    pruned there. Thresholds are computed in the parent (see
+    :class:`CurveHistory`), so workers only receive one number per step.
+    Higher scores are better.
+    """
+
+    @abstractmethod
+    def thresholds(self, scores: Mapping[int, Sequence[float]], n_trials: int) -> Dict[int, float]:
+        """Return the pruning threshold per step.
+
+        *scores* holds the intermediate scores of the *n_trials* finished
+        trials by step. Steps without a threshold never prune.
+        """
+        raise NotImplementedError
+
+    def should_prune(self, step: int, score: float, thresholds: Mapping[int, float]) -> bool:
+        """Return ``True`` if *score* at *step* falls below the step's threshold."""
+        threshold = thresholds.get(step)
+        return threshold is not None and score < threshold
+
+
+class CurveHistory:
+    """Intermediate scores of finished trials, summarized for a pruner.
+
+    The search adds the curve of every finished trial. In-process workers
+    call :meth:`thresholds` at each step and so see every trial finished by
+    then; pickled into a process worker, the history only carries the
+    thresholds current at submission, not the curves.
+    """
+
+    def __init__(self, pruner: Pruner, curves: Iterable[Curve] = ()) -> None:
+        self.pruner = pruner
+        self.n_trials = 0
+        self._scores: Dict[int, List[float]] = {}
+        self._thresholds: Dict[int, float] | None = None
+        self._lock = threading.Lock()
+        for curve in curves:
+            self.add(curve)
+
+    def add(self, curve: Curve) -> None:
+        """Record the intermediate scores of a finished trial."""
+        with self._lock:
+            self.n_trials += 1
+            for step, score in curve.items():
+                self._scores.setdefault(step, []).append(score)
+            self._thresholds = None
+
+    def thresholds(self) -> Dict[int, float]:
+        """Return the pruner's current threshold per step."""
+        with self._lock:
+            if self._thresholds is None:
+                self._thresholds = self.pruner.thresholds(self._scores, self.n_trials)
+            return self._thresholds
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"pruner": self.pruner, "n_trials": self.n_trials, "_scores": {}, "_thresholds": self.thresholds()}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class PercentilePruner(Pruner):
+    """Prune trials whose score falls outside the top ``percentile`` percent.
+
+    Parameters
+    ----------
+    percentile:
+        Percentage of trials kept at each step, e.g. ``25.0`` keeps the best
+        quarter.
+    n_startup_trials:
+        Never prune until this many trials have finished.
+    n_warmup_steps:
+        Never prune at or before this step.
+    """
+
+    def __init__(
+        self,
+        percentile: float,
+        *,
+        n_startup_trials: int = 5,
+        n_warmup_steps: int = 0,
+    ) -> None:
+        if not 0.0 < percentile <= 100.0:
+            raise ValueError("percentile must be in (0, 100]")
+        self.percentile = percentile
+        self.n_startup_trials = n_startup_trials
+        self.n_warmup_steps = n_warmup_steps
+
+    def thresholds(self, scores: Mapping[int, Sequence[float]], n_trials: int) -> Dict[int, float]:
+        if n_trials < self.n_startup_trials:
+            return {}
+        return {
+            step: float(np.percentile(others, 100.0 - self.percentile))
+            for step, others in scores.items()
+            if step > self.n_warmup_steps and others
+        }
+
+
+class MedianPruner(PercentilePruner):
+    """Prune trials scoring below the median of earlier trials at the same step."""
+
+    def __init__(self, *, n_startup_trials: int = 5, n_warmup_steps: int = 0) -> None:
+        super().__init__(50.0, n_startup_trials=n_startup_trials, n_warmup_steps=n_warmup_steps)
+
+
+class SuccessiveHalvingPruner(Pruner):
+    """Asynchronous successive halving over the intermediate steps.
+
+    Rungs sit at ``min_steps * reduction_factor**k``. At a rung a trial only
+    continues if its score is within the top ``1 / reduction_factor`` of all
+    scores recorded at that rung so far.
+    """
+
+    def __init__(self, *, min_steps: int = 1, reduction_factor: int = 3) -> None:
+        if min_steps < 1 or reduction_factor < 2:
+            raise ValueError("min_steps must be >= 1 and reduction_factor >= 2")
+        self.min_steps = min_steps
+        self.reduction_factor = reduction_factor
+
+    def _is_rung(self, step: int) -> bool:
+        if step < self.min_steps or step % self.min_steps:
+            return False
+        ratio = step // self.min_steps
+        k = round(math.log(ratio, self.reduction_factor))
+        return self.reduction_factor**k == ratio
+
+    def thresholds(self, scores: Mapping[int, Sequence[float]], n_trials: int) -> Dict[int, float]:
+        out = {}
+        for step, others in scores.items():
+            # A new trial makes len(others) + 1 scores at the rung; it continues
+            # if it is among the best ``keep`` of them, i.e. unless ``keep``
+            # earlier trials scored higher.
+            keep = max(1, (len(others) + 1) // self.reduction_factor)
+            if self._is_rung(step) and len(others) >= keep:
+                out[step] = heapq.nlargest(keep, others)[-1]
+        return out
+
+
+def _fit_steps(model: Any, X, y, n_steps: int) -> Iterator[int]:
+    """Fit *model* incrementally, yielding after each of up to *n_steps* steps.
+
+    The work of a full fit is spread over the steps, so a trial that is not
+    pruned trains as long as it would without a pruner. Estimators with
+    ``warm_start`` grow ``n_estimators`` or ``max_iter`` towards the
+    configured total (``max_iter`` only for the estimators listed in
+    :data:`~glassbox.core.warm_start.MAX_ITER_MODES`) and stop early once a
+    fit converges; XGBoost/LightGBM models continue boosting from the
+    previous booster. Other ``partial_fit`` estimators run ``max_iter``
+    epochs in total, or one per step without it. Anything else is fitted
+    once as a single step.
+    """
+    from glassbox.core.warm_start import warm_start_mode
+
+    params = model.get_params()
+    module = type(model).__module__.split(".")[0]
+    if module in ("xgboost", "lightgbm") and params.get("n_estimators"):
+        total = params["n_estimators"]
+        previous = 0
+        for step in range(1, n_steps + 1):
+            target = max(1, total * step // n_steps)
+            if target <= previous:
+                continue
+            model.set_params(n_estimators=target - previous)
+            if previous == 0:
+                model.fit(X, y)
+            elif module == "xgboost":
+                model.fit(X, y, xgb_model=model.get_booster())
+            else:
+                model.fit(X, y, init_model=model.booster_)
+            previous = target
+            yield step
+    elif "warm_start" in params and params.get("n_estimators"):
+        total = params["n_estimators"]
+        model.set_params(warm_start=True)
+        previous = 0
+        for step in range(1, n_steps + 1):
+            target = max(1, total * step // n_steps)
+            if target <= previous:
+                continue
+            model.set_params(n_estimators=target)
+            model.fit(X, y)
+            previous = target
+            yield step
+    elif "warm_start" in params and params.get("max_iter") and warm_start_mode(model, "max_iter"):
+        total = params["max_iter"]
+        grow = warm_start_mode(model, "max_iter") == "grow"
+        model.set_params(warm_start=True)
+        previous = 0
+        for step in range(1, n_steps + 1):
+            target = max(1, total * step // n_steps)
+            if target <= previous:
+                continue
+            model.set_params(max_iter=target if grow else target - previous)
+            model.fit(X, y)
+            # ``n_iter_`` counts the iterations of this fit (or in total when growing).
+            converged = getattr(model, "n_iter_", target) < (target if grow else target - previous)
+            previous = target
+            yield step
+            if converged:
+                return
+    elif hasattr(model, "partial_fit"):
+        from sklearn.base import is_classifier
+
+        kwargs = {"classes": np.unique(y)} if is_classifier(model) else {}
+        epochs = params.get("max_iter") or n_steps
+        done = 0
+        for step in range(1, n_steps + 1):
+            target = epochs * step // n_steps if epochs >= n_steps else min(step, epochs)
+            if target <= done:
+                continue
+            for _ in range(target - done):
+                model.partial_fit(X, y, **kwargs)
+            done = target
+            yield step
+    else:
+        model.fit(X, y)
+        yield 1
+
+
+def fit_with_pruning(
+    model: Any,
+    X,
+    y,
+    evaluator: Evaluator,
+    pruner: Pruner,
+    history: CurveHistory | None,
+    n_steps: int,
+    timer: PhaseTimer | None = None,
+    deadline: float | None = None,
+) -> Tuple[Dict[str, float], Curve, str]:
+    """Fit *model* step by step, scoring it at every checkpoint.
+
+    Returns ``(metrics, curve, state)`` where *curve* maps each step to its
+    intermediate score, *metrics* come from the last checkpoint and *state*
+    is ``"complete"``, ``"pruned"`` or ``"cancelled"`` when the wall-clock
+    *deadline* passed before the last step. Fitting and scoring time is
+    added to the ``fit`` and ``evaluate`` phases of *timer*.
+    """
+    timer = timer or PhaseTimer()
+    curve: Curve = {}
+    metrics: Dict[str, float] = {}
+    steps = _fit_steps(model, X, y, n_steps)
+    while True:
+        with timer.phase("fit"):
+            step = next(steps, None)
+        if step is None:
+            break
+        with timer.phase("evaluate"):
+            metrics = evaluator.evaluate_metrics(model, X, y)
+        curve[step] = metrics["score"]
+        thresholds = history.thresholds() if history is not None else {}
+        if pruner.should_prune(step, metrics["score"], thresholds):
+            return {**metrics, "steps": float(step)}, curve, "pruned"
+        if deadline is not None and time.time() >= deadline and step < n_steps:
+            return {**metrics, "steps": float(step)}, curve, "cancelled"
+    return {**metrics, "steps": float(max(curve))}, curve, "complete"
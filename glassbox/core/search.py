@@ -1,50 +1,267 @@
 """Search strategies for hyperparameter tuning."""
 from __future__ import annotations
 
-import itertools
+import asyncio
+import os
+import queue
 import random
 import math
-from time import perf_counter
-from typing import Any, Callable, Dict, Iterable, List, Optional
+import threading
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+import numpy as np
 
+from glassbox.core.admission import MemoryAdmission
+from glassbox.core.budget import SearchBudget
+from glassbox.core.cache import TrialCache
+from glassbox.core.journal import TrialJournal
+from glassbox.core.model_store import ModelStore
+from glassbox.core.parallel import (
+    KeepModel,
+    TrialOutcome,
+    executor_workers,
+    fit_and_score,
+    make_executor,
+    uses_processes,
+)
+from glassbox.core.profiling import TrialProfiler, phase_metrics
+from glassbox.core.pruning import CurveHistory, Pruner
+from glassbox.core.space import SearchSpace
+from glassbox.core.study import SharedStudy, optuna_storage
+from glassbox.core.trial_table import TrialTable
+from glassbox.core.warm_start import fit_chain, warm_start_chains, warm_start_dimension
 from glassbox.schemas import Evaluator, TrialResult
 from glassbox.utils.lazy_imports import optional_import
+from glassbox.utils.shared_memory import SharedArray, shared_dataset
+from glassbox.utils.threads import CoreBudget, limit_threads
 from glassbox.logger import logger
 from glassbox.plugins.manager import PluginManager
 
 
 class Search:
-    """Encapsulates different hyperparameter search strategies."""
+    """Encapsulates different hyperparameter search strategies.
+
+    Trials are dispatched to a :class:`concurrent.futures.Executor`. With the
+    default ``n_jobs=1`` they run one after another in the calling process;
+    larger values start a process (or thread) pool, and an explicit
+    ``executor`` takes precedence over both. Progress, logging and plugin
+    hooks always run in the parent process.
+
+    When trials run in worker processes, NumPy arrays and pandas objects are
+    placed in shared memory once per :meth:`run` and workers attach read-only
+    views instead of unpickling a copy per trial. ``share_data`` forces this
+    on or off; by default it is enabled for process pools only.
+
+    The ``"halving"`` and ``"hyperband"`` strategies spend a small budget on
+    many configurations and promote the best ``1/eta`` to larger budgets. The
+    budget is ``budget_param`` (e.g. ``"n_estimators"``) when given, otherwise
+    the fraction of training rows, between ``min_budget`` and ``max_budget``.
+
+    An optional :class:`~glassbox.core.cache.TrialCache` returns stored
+    outcomes for trials whose estimator, parameters, evaluator and data were
+    seen before, skipping the fit entirely.
+
+    With a ``journal`` every completed trial is appended to a JSON Lines file
+    as soon as it finishes. ``resume=True`` replays the trials recorded there:
+    grid, random and halving searches skip trial ids that already completed
+    and Optuna studies are rebuilt from the journaled trials. The journal
+    records the search's seed (drawn at random when ``seed`` is not set) and
+    a resumed run reuses it, so random and halving searches draw the same
+    configurations again.
+
+    The search space is a :class:`~glassbox.core.space.SearchSpace` addressed
+    by index, so it is never materialized. Random and halving searches draw
+    distinct configurations with a ``seed``-ed RNG and stop early once the
+    space is exhausted. ``shard=(i, n)`` restricts a grid search to every
+    ``n``-th configuration starting at ``i``. Dimensions given as
+    :class:`~glassbox.core.space.Uniform`, ``LogUniform`` or ``IntRange``
+    are sampled natively by random search and passed to Optuna as float or
+    int distributions rather than categorical choices.
+
+    With a :class:`~glassbox.core.pruning.Pruner`, iterative estimators are
+    fitted in ``pruning_steps`` increments (``partial_fit`` epochs,
+    ``warm_start`` growth or continued boosting) and scored at each one;
+    trials the pruner rejects stop early and are recorded with
+    ``state="pruned"``. ``on_epoch_end`` then fires once per step.
+
+    ``warm_start=True`` lets grid search reuse fitted state for estimators
+    with a ``warm_start`` parameter: the grid is regrouped into chains that
+    differ only along ``n_estimators``, ``max_iter`` (for estimators listed
+    in :data:`~glassbox.core.warm_start.MAX_ITER_MODES`), ``C`` or ``alpha``,
+    and each chain continues from the previous fit instead of starting over.
+
+    With a :class:`~glassbox.core.model_store.ModelStore` the fitted
+    estimators of the best full-budget trials are kept, so the winner does not
+    have to be refitted after the search.
+
+    Every trial records how long it spent constructing the estimator,
+    fitting, evaluating and in framework overhead as the ``construct_time``,
+    ``fit_time``, ``evaluate_time`` and ``overhead_time`` metrics (metrics of
+    the same name reported by the evaluator take precedence). A
+    :class:`~glassbox.core.profiling.TrialProfiler` additionally profiles
+    trials in their workers and keeps the slowest ones.
+
+    With ``resource_interval`` each worker samples its process tree (the
+    worker and any processes it spawns) from ``/proc`` during every trial and
+    reports the average ``cpu_percent``, the ``rss_mb``/``peak_rss_mb`` of
+    the trial and the ``rss_increase_mb`` its work added. Trials sharing a thread pool share a process, so their numbers
+    overlap.
+
+    Several processes, possibly on different machines sharing a file system,
+    can work on one sweep by passing the same ``storage`` (``"sqlite:///"``
+    URL or path; ``"journal:///"`` file-lock journals for Optuna) and
+    ``study_name``. Grid and random workers claim trial ids atomically from a
+    :class:`~glassbox.core.study.SharedStudy` so no trial runs twice, and
+    Optuna workers share one study of ``n_trials`` trials in total. Each
+    worker's :meth:`run` returns the trials it ran itself.
+
+    ``timeout`` (seconds), ``target_score`` and ``patience`` (completed
+    trials without improvement) bound the cost of any strategy. Once a
+    budget is used up no new trials start and queued ones are cancelled.
+    Running pruned trials stop at their next pruning step and are recorded
+    with ``state="cancelled"``; running warm-start chains finish their
+    current link and skip the rest, which, like queued trials, are not
+    recorded. The trials finished so far are returned and
+    :attr:`stop_reason` tells which budget ended the search.
+
+    ``cores`` (a :class:`~glassbox.utils.threads.CoreBudget` or a number of
+    cores) splits the CPUs between concurrent trials so estimators with
+    their own thread pools do not oversubscribe them: each trial's
+    BLAS/OpenMP threads are capped at its share, ``n_jobs``-style estimator
+    parameters are set to it and, with ``CoreBudget(pin=True)``, workers are
+    bound to disjoint CPU sets.
+
+    ``memory_limit`` (a :class:`~glassbox.core.admission.MemoryAdmission` or
+    a ceiling in MB) only starts a trial when the memory it adds to its
+    worker, estimated from earlier trials with similar parameters, fits next
+    to the trials already running. A trial whose worker runs out of memory
+    (``MemoryError`` or a killed process) is retried alone instead of
+    failing the search, and skipped if it fails again.
+
+    :meth:`run` returns a :class:`~glassbox.core.trial_table.TrialTable`,
+    which stores results as NumPy columns but can be used like a list of
+    ``TrialResult`` objects. :meth:`iter_run` (and :meth:`aiter_run` for
+    ``asyncio``) yields each result as soon as its trial completes, and
+    :meth:`ask`/:meth:`tell` let an external scheduler run the trials.
+    """
 
     def __init__(
         self,
         strategy: str,
-        search_space: Dict[str, Iterable[Any]],
+        search_space: SearchSpace | Dict[str, Iterable[Any]],
         *,
         n_trials: int = 10,
         name: str | None = None,
+        n_jobs: int = 1,
+        backend: str = "process",
+        executor: Executor | None = None,
+        share_data: bool | None = None,
+        budget_param: str | None = None,
+        min_budget: float | None = None,
+        max_budget: float | None = None,
+        eta: int = 3,
+        cache: TrialCache | None = None,
+        journal: TrialJournal | str | os.PathLike | None = None,
+        resume: bool = False,
+        seed: int | None = None,
+        shard: Tuple[int, int] | None = None,
+        pruner: Pruner | None = None,
+        pruning_steps: int = 10,
+        warm_start: bool = False,
+        model_store: ModelStore | None = None,
+        profiler: TrialProfiler | None = None,
+        resource_interval: float | None = None,
+        study_name: str | None = None,
+        storage: str | os.PathLike | None = None,
+        timeout: float | None = None,
+        target_score: float | None = None,
+        patience: int | None = None,
+        cores: CoreBudget | int | None = None,
+        memory_limit: MemoryAdmission | float | None = None,
     ) -> None:
         if not search_space:
             logger.log("search_space must be provided", level="error")
             raise ValueError("search_space must be provided")
+        if backend not in ("process", "thread"):
+            logger.log(f"Unknown executor backend: {backend}", level="error")
+            raise ValueError(f"Unknown executor backend: {backend}")
+        if eta < 2:
+            logger.log("eta must be at least 2", level="error")
+            raise ValueError("eta must be at least 2")
         self.strategy = strategy
-        self.search_space = {k: list(v) for k, v in search_space.items()}
+        self.space = search_space if isinstance(search_space, SearchSpace) else SearchSpace(search_space)
+        self.search_space = self.space.dimensions
+        self.seed = seed
+        self.shard = shard
+        self._rng = random.Random(seed)
+        self.pruner = pruner
+        self.pruning_steps = pruning_steps
+        self.warm_start = warm_start
+        self.model_store = model_store
+        self.profiler = profiler
+        self.resource_interval = resource_interval
+        self.study_name = study_name
+        self.storage = storage
+        self._study: SharedStudy | None = None
+        self._stop = threading.Event()
+        self.budget = SearchBudget(timeout, target_score, patience)
+        self.stop_reason: str | None = None
+        self._submitted = 0
+        self.cores = CoreBudget(cores) if isinstance(cores, int) else cores
+        self._threads: int | None = None
+        if memory_limit is not None and not isinstance(memory_limit, MemoryAdmission):
+            memory_limit = MemoryAdmission(memory_limit)
+        self.memory_limit = memory_limit
+        self._on_trial: Callable[[TrialResult], None] | None = None
+        self._ask_iter: Iterator[Tuple[int, Dict[str, Any]]] | None = None
+        self._asked: Dict[int, Dict[str, Any]] = {}
+        self._optuna_trials: Dict[int, Any] = {}
+        self._optuna_study: Any = None
+        self.told = TrialTable()
+        self._full_budget: float | None = None
+        self._history: CurveHistory | None = None
         self.n_trials = n_trials
         self.name = name or strategy
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.executor = executor
+        self.share_data = share_data
+        self.budget_param = budget_param
+        self.min_budget = min_budget
+        self.max_budget = max_budget
+        self.eta = eta
+        self.cache = cache
+        if journal is not None and not isinstance(journal, TrialJournal):
+            journal = TrialJournal(journal)
+        self.journal = journal
+        self.resume = resume
+        self._resumed: Dict[int, TrialResult] = {}
+        self._active_executor: Executor | None = None
+        self._data_key = ""
+        self._share = False
         self._strategies: Dict[
             str,
-            Callable[[Any, Any, Any, Evaluator, bool, Optional[PluginManager]], List[TrialResult]],
+            Callable[[Any, Any, Any, Evaluator, bool, Optional[PluginManager]], TrialTable],
         ] = {
             "grid": self._grid_search,
             "random": self._random_search,
             "optuna": self._optuna_search,
+            "halving": self._halving_search,
+            "hyperband": self._halving_search,
         }
         if strategy not in self._strategies:
             logger.log(f"Unknown search strategy: {strategy}", level="error")
             raise ValueError(f"Unknown search strategy: {strategy}")
+        if storage is not None and (strategy in ("halving", "hyperband") or shard or resume):
+            message = "Shared storage only supports grid, random and optuna searches without shard or resume"
+            logger.log(message, level="error")
+            raise ValueError(message)
+        if strategy == "grid" and not self.space.is_finite:
+            logger.log("Grid search requires discrete dimensions", level="error")
+            raise ValueError("Grid search requires discrete dimensions")
 
     def run(
         self,
@@ -55,68 +272,694 @@ class Search:
         *,
         show_progress: bool = False,
         plugin_manager: PluginManager | None = None,
-    ) -> List[TrialResult]:
-        return self._strategies[self.strategy](
+    ) -> TrialTable:
+        self._stop.clear()
+        return self._run(model, X, y, evaluator, show_progress, plugin_manager)
+
+    def stop(self) -> None:
+        """Ask a running search to finish its in-flight trials and return.
+
+        Safe to call from another thread; no new trials are started.
+        """
+        self._stop.set()
+
+    def iter_run(
+        self,
+        model,
+        X,
+        y,
+        evaluator: Evaluator,
+        *,
+        show_progress: bool = False,
+        plugin_manager: PluginManager | None = None,
+    ) -> Iterator[TrialResult]:
+        """Run the search and yield each ``TrialResult`` as it completes.
+
+        The search runs on a background thread. Closing the generator early
+        (e.g. ``break``) stops the search once its in-flight trials finish.
+        """
+        results: queue.Queue = queue.Queue()
+        thread = self._start_background(
+            model, X, y, evaluator, show_progress, plugin_manager, results.put
+        )
+        try:
+            while True:
+                kind, item = results.get()
+                if kind == "result":
+                    yield item
+                elif kind == "error":
+                    raise item
+                else:
+                    return
+        finally:
+            self._stop.set()
+            thread.join()
+
+    async def aiter_run(
+        self,
+        model,
+        X,
+        y,
+        evaluator: Evaluator,
+        *,
+        show_progress: bool = False,
+        plugin_manager: PluginManager | None = None,
+    ) -> AsyncIterator[TrialResult]:
+        """Async version of :meth:`iter_run` that never blocks the event loop."""
+        loop = asyncio.get_running_loop()
+        results: asyncio.Queue = asyncio.Queue()
+        thread = self._start_background(
             model,
             X,
             y,
             evaluator,
             show_progress,
             plugin_manager,
+            lambda event: loop.call_soon_threadsafe(results.put_nowait, event),
         )
+        try:
+            while True:
+                kind, item = await results.get()
+                if kind == "result":
+                    yield item
+                elif kind == "error":
+                    raise item
+                else:
+                    return
+        finally:
+            self._stop.set()
+            await asyncio.to_thread(thread.join)
+
+    async def arun(
+        self,
+        model,
+        X,
+        y,
+        evaluator: Evaluator,
+        *,
+        show_progress: bool = False,
+        plugin_manager: PluginManager | None = None,
+    ) -> TrialTable:
+        """Run the search on a worker thread and await its results."""
+        return await asyncio.to_thread(
+            self.run, model, X, y, evaluator, show_progress=show_progress, plugin_manager=plugin_manager
+        )
+
+    def _start_background(
+        self,
+        model,
+        X,
+        y,
+        evaluator: Evaluator,
+        show_progress: bool,
+        plugin_manager: PluginManager | None,
+        emit: Callable[[Tuple[str, Any]], None],
+    ) -> threading.Thread:
+        """Start :meth:`run` on a thread, passing every result to *emit*."""
+        self._stop.clear()
+
+        def work() -> None:
+            self._on_trial = lambda result: emit(("result", result))
+            try:
+                self._run(model, X, y, evaluator, show_progress, plugin_manager)
+            except BaseException as exc:
+                emit(("error", exc))
+            else:
+                emit(("done", None))
+            finally:
+                self._on_trial = None
+
+        thread = threading.Thread(target=work, name="glassbox-search", daemon=True)
+        thread.start()
+        return thread
+
+    def _run(
+        self,
+        model,
+        X,
+        y,
+        evaluator: Evaluator,
+        show_progress: bool,
+        plugin_manager: PluginManager | None,
+    ) -> TrialTable:
+        evaluator.prepare(X, y)
+        self.budget.start()
+        self.stop_reason = None
+        self._submitted = 0
+        self._rng = random.Random(self.seed)
+        self._history = CurveHistory(self.pruner) if self.pruner is not None else None
+        self._full_budget = None
+        if self.model_store is not None:
+            self.model_store.clear()
+        if self.profiler is not None:
+            self.profiler.reset()
+        if self.cache is not None:
+            self._data_key = self.cache.data_key(X, y)
+        if self.journal is not None:
+            seed = self.seed if self.seed is not None else random.SystemRandom().randrange(2**32)
+            stored = self.journal.read_header() if self.resume else None
+            if stored is not None and stored.get("seed") is not None:
+                # Draw the same sample as the interrupted run so trial ids match.
+                seed = stored["seed"]
+            self._rng = random.Random(seed)
+            header = {**self._journal_header(), "seed": seed}
+            resumed = self.journal.load(header) if self.resume else []
+            if self.strategy == "optuna":
+                # Rebuilt studies number the replayed trials consecutively.
+                resumed = [
+                    TrialResult(
+                        trial_id=number,
+                        params=r.params,
+                        metrics=r.metrics,
+                        duration=r.duration,
+                        budget=r.budget,
+                    )
+                    for number, r in enumerate(resumed)
+                ]
+            self.journal.start(header, resumed)
+            self._resumed = {r.trial_id: r for r in resumed}
+            if resumed:
+                logger.log(f"Resuming {self.name} search with {len(resumed)} completed trials")
+        executor = self.executor or make_executor(self.n_jobs, self.backend, self.cores)
+        share = self.share_data if self.share_data is not None else uses_processes(executor)
+        self._share = share
+        self._active_executor = executor
+        threads = cpus = None
+        if self.cores is not None:
+            workers = executor_workers(executor)
+            self._threads = self.cores.threads_per_trial(workers)
+            if not uses_processes(executor):
+                # In-process workers share the parent's thread pools.
+                threads = self._threads
+                if self.cores.pin and workers == 1:
+                    cpus = self.cores.cpu_sets(1)[0]
+        try:
+            with shared_dataset(X, y, evaluator, enabled=share) as (
+                X_task,
+                y_task,
+                evaluator_task,
+            ), limit_threads(threads, cpus):
+                if self.memory_limit is not None:
+                    # Measured after the data moved to shared memory.
+                    self.memory_limit.start()
+                results = self._strategies[self.strategy](
+                    model,
+                    X_task,
+                    y_task,
+                    evaluator_task,
+                    show_progress,
+                    plugin_manager,
+                )
+            self.stop_reason = self.budget.reason or ("stopped" if self._stop.is_set() else None)
+            if self.stop_reason is not None:
+                logger.log(
+                    f"{self.name.capitalize()} search stopped early ({self.stop_reason}) after {len(results)} trials"
+                )
+            return results
+        finally:
+            # The pool may have been replaced after losing a worker.
+            executor, self._active_executor = self._active_executor or executor, None
+            if self.executor is None:
+                executor.shutdown(wait=True, cancel_futures=True)
+            if self.cache is not None:
+                self.cache.evict()
+            if self.journal is not None:
+                self.journal.close()
+            if self._study is not None:
+                # Trials this worker claimed but did not finish go back to the study.
+                self._study.release()
+                self._study = None
+            self._resumed = {}
+
+    def _journal_header(self) -> Dict[str, Any]:
+        return {
+            "type": "header",
+            "name": self.name,
+            "strategy": self.strategy,
+            "search_space": repr(self.search_space),
+        }
 
     # ------------------------------------------------------------------
-    # Strategy implementations
+    # Trial execution
     # ------------------------------------------------------------------
-    def _iterate_grid(self):
-        keys = list(self.search_space)
-        for values in itertools.product(*(self.search_space[k] for k in keys)):
-            yield dict(zip(keys, values))
+    @contextmanager
+    def _progress(
+        self, total: int, show_progress: bool, spinner: bool = False
+    ) -> Iterator[Callable[[], None]]:
+        """Yield a callback advancing the progress bar by one trial."""
+        if not show_progress:
+            yield lambda: None
+            return
+        # rich is only needed for progress bars, so import it on demand.
+        from rich.console import Console
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 
-    def _grid_search(
+        columns = [
+            TextColumn("{task.description}"),
+            BarColumn(),
+            TextColumn("{task.completed}/{task.total}"),
+        ]
+        if spinner:
+            columns.insert(0, SpinnerColumn())
+        progress = Progress(*columns, console=Console(stderr=True))
+        progress.start()
+        task_id = progress.add_task(f"{self.name} Search", total=total)
+        try:
+            yield lambda: progress.update(task_id, advance=1)
+        finally:
+            progress.stop()
+
+    def _execute(
         self,
         model,
         X,
         y,
         evaluator: Evaluator,
-        show_progress: bool,
+        trials: Iterator[Any],
+        advance: Callable[[], None],
         plugin_manager: PluginManager | None,
-    ) -> List[TrialResult]:
-        total = math.prod(len(v) for v in self.search_space.values()) if self.search_space else 0
-        progress: Progress | None = None
-        task_id: int | None = None
-        if show_progress:
-            progress = Progress(
-                TextColumn("{task.description}"),
-                BarColumn(),
-                TextColumn("{task.completed}/{task.total}"),
-                console=Console(stderr=True),
-            )
-            progress.start()
-            task_id = progress.add_task(f"{self.name} Search", total=total)
-        results: List[TrialResult] = []
-        for i, params in enumerate(self._iterate_grid(), 1):
-            trial_model = model.__class__(**{**model.get_params(), **params})
-            start = perf_counter()
-            trial_model.fit(X, y)
-            score = evaluator.evaluate(trial_model, X, y)
-            duration = perf_counter() - start
-            if progress and task_id is not None:
-                progress.update(task_id, advance=1)
+        *,
+        warm_dimension: str | None = None,
+        on_result: Callable[[TrialResult], None] | None = None,
+        prefetch: int = 2,
+        budget: float | None = None,
+        rows: np.ndarray | None = None,
+        rows_task: SharedArray | None = None,
+    ) -> TrialTable:
+        """Run ``(trial_id, params)`` pairs from *trials* on the executor.
+
+        An item may also be a list of such pairs forming a warm-start chain
+        along *warm_dimension*; the chain runs as one task that continues
+        from the previously fitted estimator.
+
+        At most ``prefetch`` tasks per worker are in flight, so *trials* is
+        consumed lazily and adaptive strategies can react to earlier results
+        through *on_result* before proposing the next configuration. When
+        *rows* is given every trial is fitted on that subset of the data and
+        the results are tagged with *budget*; workers receive *rows_task*, a
+        shared memory handle to the same indices, when one is given.
+
+        With a memory limit a task is held back until its estimated peak
+        memory fits next to the tasks in flight, and tasks whose worker ran
+        out of memory are retried one at a time.
+        """
+        executor = self._active_executor or make_executor(1)
+        max_pending = max(1, executor_workers(executor) * prefetch)
+        pending: Dict[Future, List[Tuple[int, Dict[str, Any], str | None]]] = {}
+        results = TrialTable()
+        budget_note = f" budget={budget:g}" if budget is not None else ""
+        cache = self.cache
+        on_trial_end = plugin_manager is not None and plugin_manager.handles("on_trial_end")
+        # Only models trained on the full budget are candidates for the store.
+        store = self.model_store if budget is None or budget == self._full_budget else None
+        keep_all = cache is not None and cache.store_models
+        rows_task = rows if rows_task is None else rows_task
+
+        def keep_model() -> KeepModel | None:
+            # Workers only send back models the cache or the store would keep.
+            if keep_all:
+                return KeepModel()
+            if store is None:
+                return None
+            return KeepModel(store.threshold(), store.max_bytes, store.k)
+        profiler = self.profiler
+        profile = (profiler.cpu, profiler.memory) if profiler is not None else (False, False)
+        admission = self.memory_limit
+        sample_interval = self.resource_interval
+        if admission is not None and sample_interval is None:
+            # Peaks come from the kernel's high-water mark, so coarse sampling suffices.
+            sample_interval = 0.5
+        reserved: Dict[Future, float] = {}
+        held: List[Tuple[int, Dict[str, Any], str | None]] | None = None
+        solo: List[List[Tuple[int, Dict[str, Any], str | None]]] = []
+        solo_futures: set = set()
+
+        def complete(
+            trial_id: int, params: Dict[str, Any], outcome: TrialOutcome, note: str = ""
+        ) -> None:
+            metrics = outcome.metrics
+            if profiler is not None and outcome.timings:
+                profiler.record(trial_id, params, outcome.timings, outcome.worker, outcome.profile)
+            score = metrics["score"]
+            result = None
+            if on_result is not None or on_trial_end or self._study is not None or self._on_trial or (
+                self.journal is not None and trial_id not in self._resumed
+            ):
+                result = TrialResult(
+                    trial_id=trial_id,
+                    params=params,
+                    metrics=metrics,
+                    duration=outcome.duration,
+                    budget=budget,
+                    state=outcome.state,
+                    intermediate=outcome.intermediate,
+                )
+            if outcome.intermediate and self._history is not None:
+                self._history.add(outcome.intermediate)
+            if store is not None and outcome.state == "complete":
+                store.offer(trial_id, score, outcome.model)
+            if outcome.state in ("pruned", "cancelled"):
+                note += f" ({outcome.state} at step {max(outcome.intermediate)})"
+            if on_result is not None:
+                on_result(result)
+            advance()
             logger.log(
-                f"{self.name.capitalize()} trial {i}: params={params} score={score:.4f} duration={duration:.2f}s",
+                "%s trial %s: params=%s score=%.4f duration=%.2fs%s%s",
+                self.name.capitalize(),
+                trial_id,
+                params,
+                score,
+                outcome.duration,
+                budget_note,
+                note,
                 to=["console"],
             )
             if plugin_manager:
-                plugin_manager.trigger("on_epoch_end", metrics={"score": score})
-            results.append(
-                TrialResult(trial_id=i, params=params, metrics={"score": score}, duration=duration)
+                if on_trial_end:
+                    plugin_manager.trigger("on_trial_end", result=result)
+                if outcome.intermediate:
+                    for step, value in sorted(outcome.intermediate.items()):
+                        plugin_manager.trigger(
+                            "on_epoch_end",
+                            metrics={"score": value, "step": step, "trial_id": trial_id},
+                        )
+                else:
+                    plugin_manager.trigger("on_epoch_end", metrics={"score": score})
+            # Cancelled trials are left out so that resumed searches rerun them.
+            finished = outcome.state != "cancelled"
+            if self.journal is not None and trial_id not in self._resumed and finished:
+                self.journal.append(result)
+            if self._study is not None and finished:
+                self._study.finish(result)
+            if self._on_trial is not None:
+                self._on_trial(result)
+            results.add_trial(
+                trial_id,
+                params,
+                metrics,
+                outcome.duration,
+                budget,
+                outcome.state,
+                outcome.intermediate,
             )
-        if progress:
-            progress.stop()
-        return results
+            if admission is not None and "rss_increase_mb" in metrics:
+                admission.observe(params, metrics["rss_increase_mb"])
+            if outcome.state == "complete" and self.budget.active and self.budget.update(score):
+                self._stop.set()
 
-    def _random_search(
+        exhausted = False
+        while pending or not exhausted or solo or held:
+            while len(pending) < max_pending and not solo_futures:
+                # Always start at least one trial so there is a best-so-far result.
+                if self._stop.is_set() or (self._submitted and self.budget.expired()):
+                    self._stop.set()
+                    exhausted = True
+                    held = None
+                    solo.clear()
+                    break
+                retrying = bool(solo)
+                if solo:
+                    # Trials that ran out of memory are retried one at a time.
+                    if pending:
+                        break
+                    todo = solo.pop(0)
+                elif held is not None:
+                    todo, held = held, None
+                elif exhausted:
+                    break
+                else:
+                    task = next(trials, None)
+                    if task is None:
+                        exhausted = True
+                        continue
+                    todo = []
+                    for trial_id, params in task if isinstance(task, list) else [task]:
+                        if trial_id in self._resumed:
+                            done = self._resumed[trial_id]
+                            replay = TrialOutcome(
+                                done.metrics, done.duration, None, done.intermediate, done.state
+                            )
+                            complete(trial_id, done.params, replay, note=" (resumed)")
+                            continue
+                        key = None
+                        if cache is not None:
+                            key = cache.key(model, params, evaluator, self._data_key, rows)
+                            hit = cache.get(key)
+                            if hit is not None:
+                                complete(trial_id, params, TrialOutcome(*hit), note=" (cached)")
+                                continue
+                        todo.append((trial_id, params, key))
+                    if not todo:
+                        continue
+                estimate = 0.0
+                if admission is not None:
+                    estimate = admission.estimate([params for _, params, _ in todo])
+                    if pending and not admission.admits(estimate, sum(reserved.values())):
+                        held = todo
+                        break
+                if len(todo) > 1:
+                    future = executor.submit(
+                        fit_chain,
+                        model,
+                        [params for _, params, _ in todo],
+                        warm_dimension,
+                        X,
+                        y,
+                        evaluator,
+                        rows_task,
+                        keep_model=keep_model(),
+                        profile=profile,
+                        sample_interval=sample_interval,
+                        deadline=self.budget.deadline,
+                        threads=self._threads,
+                    )
+                else:
+                    future = executor.submit(
+                        fit_and_score,
+                        model,
+                        todo[0][1],
+                        X,
+                        y,
+                        evaluator,
+                        rows_task,
+                        keep_model=keep_model(),
+                        pruner=self.pruner,
+                        history=self._history,
+                        n_steps=self.pruning_steps,
+                        profile=profile,
+                        sample_interval=sample_interval,
+                        deadline=self.budget.deadline,
+                        threads=self._threads,
+                    )
+                self._submitted += 1
+                pending[future] = todo
+                reserved[future] = estimate
+                if retrying:
+                    solo_futures.add(future)
+            if not pending:
+                break
+            timeout = None if self._stop.is_set() else self.budget.remaining()
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            broken = admission is not None and any(
+                not f.cancelled() and isinstance(f.exception(), BrokenProcessPool) for f in done
+            )
+            if broken:
+                # A killed worker breaks the whole pool; collect every trial it held.
+                done, _ = wait(pending)
+            if self._stop.is_set() or self.budget.expired():
+                # Cancel queued trials; running ones finish or stop cooperatively.
+                self._stop.set()
+                for future in pending:
+                    future.cancel()
+            # Handle completions in submission order so runs are reproducible.
+            for future in [f for f in pending if f in done or f.cancelled()]:
+                todo = pending.pop(future)
+                reserved.pop(future, None)
+                retried = future in solo_futures
+                solo_futures.discard(future)
+                if future.cancelled():
+                    for _ in todo:
+                        advance()
+                    continue
+                try:
+                    outcomes = future.result()
+                except (MemoryError, BrokenProcessPool) as exc:
+                    if admission is None:
+                        raise
+                    ids = [trial_id for trial_id, _, _ in todo]
+                    if not retried:
+                        logger.log(f"Trials {ids} ran out of memory ({exc!r}); retrying alone", level="warning")
+                        solo.append(todo)
+                        continue
+                    logger.log(f"Trials {ids} ran out of memory when run alone; skipping", level="error")
+                    for _, params, _ in todo:
+                        # Keep similar configurations from running next to others.
+                        admission.observe(params, admission.limit)
+                        advance()
+                    continue
+                if isinstance(outcomes, TrialOutcome):
+                    outcomes = [outcomes]
+                for (trial_id, params, key), outcome in zip(todo, outcomes):
+                    # Cached trials replay the phase timings of the original fit.
+                    outcome = outcome._replace(
+                        metrics={
+                            **phase_metrics(outcome.timings),
+                            **outcome.resources,
+                            **outcome.metrics,
+                        }
+                    )
+                    if cache is not None and key is not None and outcome.state == "complete":
+                        cache.put(key, outcome.metrics, outcome.duration, outcome.model)
+                    complete(trial_id, params, outcome)
+                # Links a chain skipped after the deadline count as cancelled.
+                for _ in todo[len(outcomes) :]:
+                    advance()
+            if broken:
+                executor = self._restart_executor(executor)
+        return results.sort("trial_id")
+
+    def _restart_executor(self, executor: Executor) -> Executor:
+        """Replace a process pool that lost a worker."""
+        if self.executor is not None:
+            logger.log("A worker of the supplied executor died", level="error")
+            raise RuntimeError("A worker of the supplied executor died")
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._active_executor = make_executor(self.n_jobs, self.backend, self.cores)
+        return self._active_executor
+
+    # ------------------------------------------------------------------
+    # Shared studies
+    # ------------------------------------------------------------------
+    def _join_study(self, total: int) -> int:
+        """Create or join the shared study; return the seed all workers use."""
+        study = SharedStudy(self.storage, self.study_name or self.name)
+        seed = self.seed if self.seed is not None else random.SystemRandom().randrange(2**32)
+        stored = study.open({**self._journal_header(), "seed": seed}, total)
+        self._study = study
+        return stored["seed"]
+
+    def _claimed(
+        self, config: Callable[[int], Dict[str, Any]]
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield ``(trial_id, params)`` for trials claimed from the shared study."""
+        while True:
+            trial_id = self._study.claim()
+            if trial_id is None:
+                return
+            yield trial_id, config(trial_id)
+
+    def _create_study(self, optuna) -> Any:
+        """Create an in-memory Optuna study, or load the shared one."""
+        if self.storage is None:
+            return optuna.create_study(direction="maximize")
+        return optuna.create_study(
+            study_name=self.study_name or self.name,
+            storage=optuna_storage(optuna, self.storage),
+            load_if_exists=True,
+            direction="maximize",
+        )
+
+    # ------------------------------------------------------------------
+    # Ask/tell
+    # ------------------------------------------------------------------
+    def ask(self) -> Tuple[int, Dict[str, Any]] | None:
+        """Return the ``(trial_id, params)`` of the next trial to run.
+
+        Use with :meth:`tell` to run trials on an external scheduler; asked
+        trials can be evaluated concurrently and told in any order. Returns
+        ``None`` once the grid, the random sample or ``n_trials`` Optuna
+        trials are used up. Halving strategies need :meth:`run`.
+        """
+        if self.strategy not in ("grid", "random", "optuna"):
+            logger.log(f"ask/tell is not supported for {self.strategy} search", level="error")
+            raise ValueError(f"ask/tell is not supported for {self.strategy} search")
+        if self._ask_iter is None:
+            self._ask_iter = self._ask_trials()
+        trial = next(self._ask_iter, None)
+        if trial is not None:
+            self._asked[trial[0]] = trial[1]
+        return trial
+
+    def _ask_trials(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        if self.strategy == "grid":
+            if self.storage is None:
+                yield from self._iterate_grid()
+                return
+            self._join_study(len(self.space))
+            yield from self._claimed(lambda trial_id: self.space[trial_id - 1])
+        elif self.strategy == "random":
+            rng = self._rng
+            if self.storage is not None:
+                rng = random.Random(self._join_study(int(min(self.n_trials, self.space.size))))
+            configs = self.space.sample(self.n_trials, rng)
+            if self.storage is None:
+                yield from enumerate(configs, 1)
+                return
+            yield from self._claimed(lambda trial_id: configs[trial_id - 1])
+        else:
+            optuna = optional_import("optuna")
+            study = self._optuna_study = self._create_study(optuna)
+            distributions = self.space.to_optuna(optuna)
+            for _ in range(self.n_trials):
+                if self.storage is not None and len(study.get_trials(deepcopy=False)) >= self.n_trials:
+                    return
+                trial = study.ask(distributions)
+                self._optuna_trials[trial.number] = trial
+                yield trial.number, {name: trial.params[name] for name in self.space.keys}
+
+    def tell(
+        self,
+        trial_id: int,
+        metrics: Dict[str, float] | float,
+        *,
+        duration: float = 0.0,
+        state: str = "complete",
+        intermediate: Dict[int, float] | None = None,
+    ) -> TrialResult:
+        """Record the outcome of a trial returned by :meth:`ask`.
+
+        *metrics* must contain ``"score"``; a bare number is taken as the
+        score. Results accumulate in :attr:`told`.
+        """
+        if trial_id not in self._asked:
+            logger.log(f"Trial {trial_id} was not asked or was already told", level="error")
+            raise ValueError(f"Trial {trial_id} was not asked or was already told")
+        if not isinstance(metrics, dict):
+            metrics = {"score": float(metrics)}
+        result = TrialResult(
+            trial_id=trial_id,
+            params=self._asked.pop(trial_id),
+            metrics=metrics,
+            duration=duration,
+            state=state,
+            intermediate=intermediate or {},
+        )
+        trial = self._optuna_trials.pop(trial_id, None)
+        if trial is not None:
+            for step, value in sorted(result.intermediate.items()):
+                trial.report(value, step)
+            if state == "pruned":
+                TrialState = optional_import("optuna").trial.TrialState
+                self._optuna_study.tell(trial, state=TrialState.PRUNED)
+            else:
+                self._optuna_study.tell(trial, metrics["score"])
+        if self._study is not None:
+            self._study.finish(result)
+        self.told.append(result)
+        return result
+
+    # ------------------------------------------------------------------
+    # Strategy implementations
+    # ------------------------------------------------------------------
+    def _iterate_grid(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield ``(trial_id, params)`` for the grid, or this search's shard."""
+        if self.shard is None:
+            yield from enumerate(self.space, 1)
+            return
+        for index in self.space.shard(*self.shard):
+            yield index + 1, self.space[index]
+
+    def _grid_search(
         self,
         model,
         X,
@@ -124,41 +967,53 @@ class Search:
         evaluator: Evaluator,
         show_progress: bool,
         plugin_manager: PluginManager | None,
-    ) -> List[TrialResult]:
-        keys = list(self.search_space)
-        progress: Progress | None = None
-        task_id: int | None = None
-        if show_progress:
-            progress = Progress(
-                TextColumn("{task.description}"),
-                BarColumn(),
-                TextColumn("{task.completed}/{task.total}"),
-                console=Console(stderr=True),
+    ) -> TrialTable:
+        total = len(self.space) if self.shard is None else len(self.space.shard(*self.shard))
+        trials: Iterator[Any] = self._iterate_grid()
+        if self.storage is not None:
+            self._join_study(total)
+            trials = self._claimed(lambda trial_id: self.space[trial_id - 1])
+        dimension = None
+        if self.warm_start and self.shard is None and self.storage is None and not evaluator.fits_model:
+            dimension = warm_start_dimension(model, self.space)
+            if dimension is not None:
+                logger.log(f"Warm starting grid trials along {dimension!r}")
+                trials = warm_start_chains(self.space, dimension)
+        with self._progress(total, show_progress) as advance:
+            return self._execute(
+                model,
+                X,
+                y,
+                evaluator,
+                trials,
+                advance,
+                plugin_manager,
+                warm_dimension=dimension,
             )
-            progress.start()
-            task_id = progress.add_task(f"{self.name} Search", total=self.n_trials)
-        results: List[TrialResult] = []
-        for i in range(1, self.n_trials + 1):
-            params = {k: random.choice(self.search_space[k]) for k in keys}
-            trial_model = model.__class__(**{**model.get_params(), **params})
-            start = perf_counter()
-            trial_model.fit(X, y)
-            score = evaluator.evaluate(trial_model, X, y)
-            duration = perf_counter() - start
-            if progress and task_id is not None:
-                progress.update(task_id, advance=1)
+
+    def _random_search(
+        self,
+        model,
+        X,
+        y,
+        evaluator: Evaluator,
+        show_progress: bool,
+        plugin_manager: PluginManager | None,
+    ) -> TrialTable:
+        rng = self._rng
+        if self.storage is not None:
+            # Every worker must draw the same configurations for the same ids.
+            rng = random.Random(self._join_study(int(min(self.n_trials, self.space.size))))
+        configs = self.space.sample(self.n_trials, rng)
+        if len(configs) < self.n_trials:
             logger.log(
-                f"{self.name.capitalize()} trial {i}: params={params} score={score:.4f} duration={duration:.2f}s",
-                to=["console"],
-            )
-            if plugin_manager:
-                plugin_manager.trigger("on_epoch_end", metrics={"score": score})
-            results.append(
-                TrialResult(trial_id=i, params=params, metrics={"score": score}, duration=duration)
+                f"Search space has only {len(configs)} configurations; stopping after all of them"
             )
-        if progress:
-            progress.stop()
-        return results
+        trials: Iterator[Any] = enumerate(configs, 1)
+        if self.storage is not None:
+            trials = self._claimed(lambda trial_id: configs[trial_id - 1])
+        with self._progress(len(configs), show_progress) as advance:
+            return self._execute(model, X, y, evaluator, trials, advance, plugin_manager)
 
     def _optuna_search(
         self,
@@ -168,51 +1023,184 @@ class Search:
         evaluator: Evaluator,
         show_progress: bool,
         plugin_manager: PluginManager | None,
-    ) -> List[TrialResult]:
+    ) -> TrialTable:
         optuna = optional_import("optuna")
-        results: List[TrialResult] = []
-        progress: Progress | None = None
-        task_id: int | None = None
-        if show_progress:
-            progress = Progress(
-                SpinnerColumn(),
-                TextColumn("{task.description}"),
-                BarColumn(),
-                TextColumn("{task.completed}/{task.total}"),
-                console=Console(stderr=True),
-            )
-            progress.start()
-            task_id = progress.add_task(f"{self.name} Search", total=self.n_trials)
-
-        def objective(trial):
-            params = {}
-            for name, values in self.search_space.items():
-                params[name] = trial.suggest_categorical(name, list(values))
-            trial_model = model.__class__(**{**model.get_params(), **params})
-            start = perf_counter()
-            trial_model.fit(X, y)
-            score = evaluator.evaluate(trial_model, X, y)
-            duration = perf_counter() - start
-            logger.log(
-                f"{self.name.capitalize()} trial {trial.number}: params={params} score={score:.4f} duration={duration:.2f}s",
-                to=["console"],
-            )
-            if progress and task_id is not None:
-                progress.update(task_id, advance=1)
-            if plugin_manager:
-                plugin_manager.trigger("on_epoch_end", metrics={"score": score})
-            results.append(
-                TrialResult(
-                    trial_id=trial.number,
-                    params=params,
-                    metrics={"score": score},
-                    duration=duration,
+        study = self._create_study(optuna)
+        asked: Dict[int, Any] = {}
+
+        distributions = self.space.to_optuna(optuna)
+        resumed = [self._resumed[k] for k in sorted(self._resumed)]
+        TrialState = optuna.trial.TrialState
+        for done in resumed:
+            pruned = done.state == "pruned"
+            study.add_trial(
+                optuna.trial.create_trial(
+                    params=done.params,
+                    distributions=distributions,
+                    value=None if pruned else done.metrics["score"],
+                    intermediate_values=done.intermediate,
+                    state=TrialState.PRUNED if pruned else TrialState.COMPLETE,
                 )
             )
-            return score
 
-        study = optuna.create_study(direction="maximize")
-        study.optimize(objective, n_trials=self.n_trials)
-        if progress:
-            progress.stop()
+        def trials():
+            for done in resumed:
+                yield done.trial_id, done.params
+            for _ in range(self.n_trials - len(resumed)):
+                # A shared study stops once all workers together asked n_trials.
+                if self.storage is not None and len(study.get_trials(deepcopy=False)) >= self.n_trials:
+                    return
+                trial = study.ask(distributions)
+                params = {name: trial.params[name] for name in self.space.keys}
+                asked[trial.number] = trial
+                yield trial.number, params
+
+        def tell(result: TrialResult) -> None:
+            trial = asked.pop(result.trial_id, None)
+            if trial is None:  # replayed trials were added up front
+                return
+            for step, value in sorted(result.intermediate.items()):
+                trial.report(value, step)
+            if result.state in ("pruned", "cancelled"):
+                study.tell(trial, state=TrialState.PRUNED)
+            else:
+                study.tell(trial, result.metrics["score"])
+
+        # Only keep one proposal per worker in flight so the sampler sees as
+        # many completed trials as possible before suggesting the next one.
+        with self._progress(self.n_trials, show_progress, spinner=True) as advance:
+            results = self._execute(
+                model,
+                X,
+                y,
+                evaluator,
+                trials(),
+                advance,
+                plugin_manager,
+                on_result=tell,
+                prefetch=1,
+            )
+        # Trials cancelled before they ran must not stay RUNNING in the study.
+        for trial in asked.values():
+            study.tell(trial, state=TrialState.FAIL)
         return results
+
+    # ------------------------------------------------------------------
+    # Successive halving / Hyperband
+    # ------------------------------------------------------------------
+    def _budget_range(self, model) -> Tuple[float, float]:
+        """Return ``(min_budget, max_budget)`` for the halving strategies."""
+        if self.budget_param is None:
+            max_budget = self.max_budget if self.max_budget is not None else 1.0
+        elif self.max_budget is not None:
+            max_budget = self.max_budget
+        else:
+            max_budget = model.get_params().get(self.budget_param)
+            if not max_budget:
+                logger.log(
+                    f"max_budget is required for budget_param={self.budget_param!r}",
+                    level="error",
+                )
+                raise ValueError(
+                    f"max_budget is required for budget_param={self.budget_param!r}"
+                )
+        min_budget = self.min_budget if self.min_budget is not None else max_budget / self.eta**2
+        if self.budget_param is not None:
+            min_budget = max(1, int(round(min_budget)))
+        if not 0 < min_budget <= max_budget:
+            logger.log("Expected 0 < min_budget <= max_budget", level="error")
+            raise ValueError("Expected 0 < min_budget <= max_budget")
+        return min_budget, max_budget
+
+    def _rungs(self, n_configs: int, min_budget: float, max_budget: float) -> List[Tuple[int, float]]:
+        """Return the ``(n_configs, budget)`` schedule of one halving bracket."""
+        schedule = []
+        budget = min_budget
+        while True:
+            schedule.append((n_configs, budget))
+            if budget >= max_budget:
+                return schedule
+            n_configs = max(1, n_configs // self.eta)
+            budget = min(budget * self.eta, max_budget)
+            if math.isclose(budget, max_budget):
+                budget = max_budget
+            if self.budget_param is not None:
+                budget = int(round(budget))
+
+    def _brackets(self, min_budget: float, max_budget: float) -> List[Tuple[int, float]]:
+        """Return ``(n_configs, starting_budget)`` for every bracket to run."""
+        if self.strategy == "halving":
+            return [(int(min(self.n_trials, self.space.size)), min_budget)]
+        s_max = int(math.floor(math.log(max_budget / min_budget, self.eta) + 1e-9))
+        brackets = []
+        for s in range(s_max, -1, -1):
+            n = int(min(math.ceil((s_max + 1) / (s + 1) * self.eta**s), self.space.size))
+            budget = max(min_budget, max_budget * self.eta ** (-s))
+            if self.budget_param is not None:
+                budget = int(round(budget))
+            brackets.append((n, budget))
+        return brackets
+
+    def _halving_search(
+        self,
+        model,
+        X,
+        y,
+        evaluator: Evaluator,
+        show_progress: bool,
+        plugin_manager: PluginManager | None,
+    ) -> TrialTable:
+        """Successive halving, or Hyperband when ``strategy="hyperband"``.
+
+        Each bracket starts many configurations on a small budget and promotes
+        the top ``1/eta`` of every rung to an ``eta`` times larger budget. The
+        budget is either the value of ``budget_param`` (e.g. ``n_estimators``)
+        or, when it is ``None``, the fraction of training rows used.
+        """
+        min_budget, max_budget = self._budget_range(model)
+        self._full_budget = max_budget
+        brackets = self._brackets(min_budget, max_budget)
+        total = sum(
+            n for start_n, start_b in brackets for n, _ in self._rungs(start_n, start_b, max_budget)
+        )
+        n_rows = len(X)
+        order = np.empty(0, dtype=np.intp)
+        if self.budget_param is None:
+            order = np.random.default_rng(self._rng.getrandbits(64)).permutation(n_rows)
+        rungs: List[TrialTable] = []
+        next_id = 1
+        # Workers read the row order from shared memory instead of unpickling
+        # a slice of it with every task.
+        with shared_dataset(order, enabled=self._share) as (
+            shared_order,
+        ), self._progress(total, show_progress) as advance:
+            for n_configs, start_budget in brackets:
+                configs = self.space.sample(n_configs, self._rng)
+                for _, budget in self._rungs(n_configs, start_budget, max_budget):
+                    rows = rows_task = None
+                    if self.budget_param is not None:
+                        configs = [{**c, self.budget_param: budget} for c in configs]
+                    elif budget < 1.0:
+                        n = max(1, int(round(budget * n_rows)))
+                        rows = order[:n]
+                        if isinstance(shared_order, SharedArray):
+                            rows_task = shared_order.head(n)
+                    rung = self._execute(
+                        model,
+                        X,
+                        y,
+                        evaluator,
+                        enumerate(configs, next_id),
+                        advance,
+                        plugin_manager,
+                        budget=budget,
+                        rows=rows,
+                        rows_task=rows_task,
+                    )
+                    next_id += len(configs)
+                    rungs.append(rung)
+                    if self._stop.is_set():
+                        return TrialTable.concat(rungs)
+                    keep = max(1, len(configs) // self.eta)
+                    configs = [rung[int(i)].params for i in rung.best_indices(keep)]
+        return TrialTable.concat(rungs)
@@ -0,0 +1,270 @@
+"""Lazy, index-addressable hyperparameter search spaces."""
+from __future__ import annotations
+
+import itertools
+import math
+import random
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+
+class Distribution(ABC):
+    """Base class for parameter distributions.
+
+    Discrete distributions (``is_discrete``) also behave as sequences so they
+    can be enumerated by grid search and addressed by index; continuous ones
+    are sampled natively by random search and handed to Optuna as
+    ``suggest_float``/``suggest_int`` parameters.
+    """
+
+    is_discrete = False
+
+    @abstractmethod
+    def sample(self, rng: random.Random) -> Any:
+        """Draw one value using *rng*."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def to_optuna(self, optuna) -> Any:
+        """Return the equivalent ``optuna.distributions`` object."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        if not self.is_discrete:
+            raise TypeError(f"{self!r} is continuous and has no length")
+        return self._len()
+
+    def __getitem__(self, index: int) -> Any:
+        if not self.is_discrete:
+            raise TypeError(f"{self!r} is continuous and cannot be indexed")
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._value(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[i] for i in range(len(self)))
+
+    def _len(self) -> int:  # pragma: no cover - overridden by discrete types
+        raise NotImplementedError
+
+    def _value(self, index: int) -> Any:  # pragma: no cover - overridden
+        raise NotImplementedError
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and vars(self) == vars(other)
+
+    def __hash__(self) -> int:
+        return hash((type(self), tuple(vars(self).items())))
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{k}={v!r}" for k, v in vars(self).items())
+        return f"{type(self).__name__}({args})"
+
+
+class Uniform(Distribution):
+    """Floats drawn uniformly from ``[low, high]``, optionally on a ``step`` grid."""
+
+    def __init__(self, low: float, high: float, step: float | None = None) -> None:
+        if not low < high:
+            raise ValueError("Uniform requires low < high")
+        self.low = float(low)
+        self.high = float(high)
+        self.step = step
+
+    @property
+    def is_discrete(self) -> bool:
+        return self.step is not None
+
+    def _len(self) -> int:
+        return int(math.floor((self.high - self.low) / self.step + 1e-9)) + 1
+
+    def _value(self, index: int) -> float:
+        return self.low + index * self.step
+
+    def sample(self, rng: random.Random) -> float:
+        if self.step is not None:
+            return self[rng.randrange(len(self))]
+        return rng.uniform(self.low, self.high)
+
+    def to_optuna(self, optuna) -> Any:
+        return optuna.distributions.FloatDistribution(self.low, self.high, step=self.step)
+
+
+class LogUniform(Distribution):
+    """Floats whose logarithm is uniform on ``[log(low), log(high)]``."""
+
+    def __init__(self, low: float, high: float) -> None:
+        if not 0 < low < high:
+            raise ValueError("LogUniform requires 0 < low < high")
+        self.low = float(low)
+        self.high = float(high)
+
+    def sample(self, rng: random.Random) -> float:
+        return math.exp(rng.uniform(math.log(self.low), math.log(self.high)))
+
+    def to_optuna(self, optuna) -> Any:
+        return optuna.distributions.FloatDistribution(self.low, self.high, log=True)
+
+
+class IntRange(Distribution):
+    """Integers in ``[low, high]`` (inclusive) with a ``step``, or log-scaled."""
+
+    def __init__(self, low: int, high: int, step: int = 1, *, log: bool = False) -> None:
+        if not low <= high:
+            raise ValueError("IntRange requires low <= high")
+        if log and (low < 1 or step != 1):
+            raise ValueError("log-scaled IntRange requires low >= 1 and step=1")
+        self.low = int(low)
+        self.high = int(high)
+        self.step = int(step)
+        self.log = log
+
+    @property
+    def is_discrete(self) -> bool:
+        return not self.log
+
+    def _len(self) -> int:
+        return (self.high - self.low) // self.step + 1
+
+    def _value(self, index: int) -> int:
+        return self.low + index * self.step
+
+    def sample(self, rng: random.Random) -> int:
+        if not self.log:
+            return self[rng.randrange(len(self))]
+        value = math.exp(rng.uniform(math.log(self.low), math.log(self.high + 1)))
+        return min(self.high, int(math.floor(value)))
+
+    def to_optuna(self, optuna) -> Any:
+        return optuna.distributions.IntDistribution(
+            self.low, self.high, step=self.step, log=self.log
+        )
+
+
+def _is_discrete(values: Any) -> bool:
+    return not isinstance(values, Distribution) or values.is_discrete
+
+
+class SearchSpace:
+    """Cartesian product of hyperparameter values addressed by integer index.
+
+    Each configuration corresponds to one integer in ``range(len(space))``
+    written in a mixed-radix system whose digits are the value positions of
+    each dimension (the last dimension varies fastest, matching
+    :func:`itertools.product`). Decoding an index costs one division per
+    dimension, so spaces with billions of combinations can be sampled or
+    sharded without ever being materialized. ``range`` objects and other
+    sequences are kept as-is; one-shot iterables are converted to lists.
+
+    Dimensions may also be :class:`Distribution` objects. Discrete ones take
+    part in the index space; continuous ones (``Uniform`` without a step,
+    ``LogUniform``, log-scaled ``IntRange``) make the space infinite, in which
+    case indices only address the discrete dimensions and :meth:`sample`
+    draws the continuous ones natively.
+    """
+
+    def __init__(self, dimensions: Mapping[str, Iterable[Any]]) -> None:
+        self.dimensions: Dict[str, Any] = {
+            k: v
+            if isinstance(v, (Distribution, Sequence)) and not isinstance(v, str)
+            else list(v)
+            for k, v in dimensions.items()
+        }
+        self.keys: List[str] = list(self.dimensions)
+        self._discrete = [k for k in self.keys if _is_discrete(self.dimensions[k])]
+        self._continuous = [k for k in self.keys if k not in self._discrete]
+        self._sizes = [len(self.dimensions[k]) for k in self._discrete]
+
+    def __len__(self) -> int:
+        """Number of configurations of the discrete dimensions."""
+        if not self.keys:
+            return 0
+        return math.prod(self._sizes)
+
+    @property
+    def is_finite(self) -> bool:
+        """``True`` when every dimension is discrete."""
+        return not self._continuous
+
+    @property
+    def discrete_keys(self) -> Tuple[str, ...]:
+        """Names of the dimensions that take part in the index space."""
+        return tuple(self._discrete)
+
+    @property
+    def size(self) -> float:
+        """Number of distinct configurations, ``math.inf`` if continuous."""
+        return len(self) if self.is_finite else math.inf
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Decode the configuration at *index*."""
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(f"search space index {index} out of range")
+        params: Dict[str, Any] = {}
+        for key, radix in zip(reversed(self._discrete), reversed(self._sizes)):
+            index, digit = divmod(index, radix)
+            params[key] = self.dimensions[key][digit]
+        return {k: params[k] for k in self._discrete}
+
+    def index_of(self, params: Mapping[str, Any]) -> int:
+        """Inverse of :meth:`__getitem__` for the discrete dimensions."""
+        index = 0
+        for key, radix in zip(self._discrete, self._sizes):
+            values = self.dimensions[key]
+            if not hasattr(values, "index"):
+                values = list(values)
+            index = index * radix + values.index(params[key])
+        return index
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if not self.is_finite:
+            raise TypeError("cannot enumerate a search space with continuous dimensions")
+        for values in itertools.product(*self.dimensions.values()):
+            yield dict(zip(self.keys, values))
+
+    def __repr__(self) -> str:
+        return f"SearchSpace({self.dimensions!r})"
+
+    def shard(self, shard_index: int, num_shards: int) -> range:
+        """Return the indices owned by one of *num_shards* disjoint shards."""
+        if not 0 <= shard_index < num_shards:
+            raise ValueError("shard_index must be in range(num_shards)")
+        return range(shard_index, len(self), num_shards)
+
+    def sample_indices(self, k: int, rng: random.Random) -> List[int]:
+        """Draw up to *k* distinct indices; fewer if the space is exhausted.
+
+        Uses :meth:`random.Random.sample` over a ``range``, which keeps only
+        the drawn indices in memory when *k* is small relative to the space.
+        """
+        return rng.sample(range(len(self)), min(k, len(self)))
+
+    def sample(self, k: int, rng: random.Random) -> List[Dict[str, Any]]:
+        """Draw up to *k* configurations.
+
+        Finite spaces are sampled without replacement. Otherwise the discrete
+        dimensions are drawn by index and continuous ones from their
+        distributions, so duplicates are practically impossible.
+        """
+        if self.is_finite:
+            return [self[i] for i in self.sample_indices(k, rng)]
+        configs = []
+        for _ in range(k):
+            discrete = self[rng.randrange(len(self))]
+            continuous = {key: self.dimensions[key].sample(rng) for key in self._continuous}
+            configs.append({key: {**discrete, **continuous}[key] for key in self.keys})
+        return configs
+
+    def to_optuna(self, optuna) -> Dict[str, Any]:
+        """Map every dimension to an ``optuna.distributions`` object."""
+        return {
+            key: values.to_optuna(optuna)
+            if isinstance(values, Distribution)
+            else optuna.distributions.CategoricalDistribution(list(values))
+            for key, values in self.dimensions.items()
+        }
@@ -0,0 +1,247 @@
+"""Coordinate several search workers through shared storage."""
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from glassbox.core.journal import TrialJournal
+from glassbox.core.trial_table import TrialTable
+from glassbox.logger import logger
+from glassbox.schemas import TrialResult
+
+_SQLITE_PREFIX = "sqlite:///"
+_JOURNAL_PREFIX = "journal:///"
+
+
+def parse_storage(storage: str | os.PathLike) -> Tuple[str, Path]:
+    """Split a storage URL into ``("sqlite" | "journal", path)``.
+
+    ``sqlite:///path.db`` and bare paths name a SQLite database;
+    ``journal:///path.log`` names a file-lock based Optuna journal. As in
+    SQLAlchemy URLs, an absolute path needs a fourth slash
+    (``sqlite:////shared/sweep.db``).
+    """
+    text = os.fspath(storage)
+    if text.startswith(_JOURNAL_PREFIX):
+        return "journal", Path(text[len(_JOURNAL_PREFIX) :])
+    if text.startswith(_SQLITE_PREFIX):
+        return "sqlite", Path(text[len(_SQLITE_PREFIX) :])
+    if "://" in text:
+        logger.log(f"Unsupported storage URL: {text}", level="error")
+        raise ValueError(f"Unsupported storage URL: {text}")
+    return "sqlite", Path(text)
+
+
+def optuna_storage(optuna, storage: str | os.PathLike) -> Any:
+    """Return the Optuna storage for *storage* (RDB for SQLite, else a journal)."""
+    kind, path = parse_storage(storage)
+    if kind == "sqlite":
+        return f"{_SQLITE_PREFIX}{path}"
+    from optuna.storages.journal import JournalFileBackend
+
+    return optuna.storages.JournalStorage(JournalFileBackend(str(path)))
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedStudy:
+    """Hand out the trial ids of a grid or random sweep to cooperating workers.
+
+    Every worker of a study opens the same SQLite database and calls
+    :meth:`claim` for its next trial. Claims are made in ``BEGIN IMMEDIATE``
+    transactions, so no trial id is handed out twice, however many processes
+    (or machines sharing the file) work on the study. Finished trials are
+    recorded with :meth:`finish` and a worker that stops early gives its
+    unfinished trials back with :meth:`release`; trials claimed by processes
+    on this host that no longer exist are released when a worker joins.
+
+    The first worker stores the study's header, including the seed random
+    search draws its configurations with. Later workers must run the same
+    search and adopt that seed, so trial ids map to the same configurations
+    everywhere.
+    """
+
+    def __init__(self, storage: str | os.PathLike, study_name: str, *, timeout: float = 30.0) -> None:
+        kind, path = parse_storage(storage)
+        if kind != "sqlite":
+            logger.log("Grid and random studies require SQLite storage", level="error")
+            raise ValueError("Grid and random studies require SQLite storage")
+        self.path = path
+        self.study_name = study_name
+        self.timeout = timeout
+        self.worker = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS glassbox_studies ("
+                "name TEXT PRIMARY KEY, header TEXT, total INTEGER, next_id INTEGER, created REAL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS glassbox_trials ("
+                "study TEXT, trial_id INTEGER, worker TEXT, state TEXT, record TEXT, "
+                "claimed REAL, finished REAL, PRIMARY KEY (study, trial_id))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+        return conn
+
+    def open(self, header: Dict[str, Any], total: int | None = None) -> Dict[str, Any]:
+        """Create the study or join it; return the stored header.
+
+        ``total`` is the number of trials of the sweep and may be left out
+        by a worker that only joins an existing study.
+        """
+        encoded = json.loads(json.dumps(header, default=repr))
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT header, total FROM glassbox_studies WHERE name = ?", (self.study_name,)
+                ).fetchone()
+                if row is None:
+                    conn.execute(
+                        "INSERT INTO glassbox_studies VALUES (?, ?, ?, 1, ?)",
+                        (self.study_name, json.dumps(encoded), total, time.time()),
+                    )
+                    stored = encoded
+                else:
+                    stored = json.loads(row[0])
+                    mismatch = {k for k in encoded if k != "seed" and stored.get(k) != encoded[k]}
+                    if mismatch or (total is not None and row[1] is not None and row[1] != total):
+                        conn.execute("ROLLBACK")
+                        logger.log(
+                            f"Study {self.study_name!r} was created by a different search", level="error"
+                        )
+                        raise ValueError(f"Study {self.study_name!r} was created by a different search")
+                    if row[1] is None and total is not None:
+                        conn.execute(
+                            "UPDATE glassbox_studies SET total = ? WHERE name = ?", (total, self.study_name)
+                        )
+                self._release_dead(conn)
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+        return stored
+
+    def _release_dead(self, conn: sqlite3.Connection) -> None:
+        host = socket.gethostname()
+        rows = conn.execute(
+            "SELECT trial_id, worker FROM glassbox_trials WHERE study = ? AND state = 'running'",
+            (self.study_name,),
+        ).fetchall()
+        for trial_id, worker in rows:
+            worker_host, pid, _ = worker.rsplit(":", 2)
+            if worker_host == host and not _pid_alive(int(pid)):
+                conn.execute(
+                    "UPDATE glassbox_trials SET state = 'released' WHERE study = ? AND trial_id = ?",
+                    (self.study_name, trial_id),
+                )
+
+    def claim(self) -> int | None:
+        """Reserve the next unassigned trial id; ``None`` once all are taken."""
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT trial_id FROM glassbox_trials WHERE study = ? AND state = 'released' "
+                    "ORDER BY trial_id LIMIT 1",
+                    (self.study_name,),
+                ).fetchone()
+                if row is not None:
+                    trial_id = row[0]
+                    conn.execute(
+                        "UPDATE glassbox_trials SET state = 'running', worker = ?, claimed = ? "
+                        "WHERE study = ? AND trial_id = ?",
+                        (self.worker, time.time(), self.study_name, trial_id),
+                    )
+                else:
+                    next_id, total = conn.execute(
+                        "SELECT next_id, total FROM glassbox_studies WHERE name = ?", (self.study_name,)
+                    ).fetchone()
+                    if next_id > total:
+                        conn.execute("COMMIT")
+                        return None
+                    trial_id = next_id
+                    conn.execute(
+                        "UPDATE glassbox_studies SET next_id = ? WHERE name = ?",
+                        (next_id + 1, self.study_name),
+                    )
+                    conn.execute(
+                        "INSERT INTO glassbox_trials VALUES (?, ?, ?, 'running', NULL, ?, NULL)",
+                        (self.study_name, trial_id, self.worker, time.time()),
+                    )
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+        return trial_id
+
+    def finish(self, result: TrialResult) -> None:
+        """Record a finished trial."""
+        record = json.dumps(TrialJournal._trial_record(result), default=repr)
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE glassbox_trials SET state = ?, record = ?, finished = ? "
+                "WHERE study = ? AND trial_id = ?",
+                (result.state, record, time.time(), self.study_name, result.trial_id),
+            )
+
+    def release(self) -> int:
+        """Give this worker's unfinished trials back to the study."""
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE glassbox_trials SET state = 'released' "
+                "WHERE study = ? AND worker = ? AND state = 'running'",
+                (self.study_name, self.worker),
+            )
+            return cursor.rowcount
+
+    def results(self) -> TrialTable:
+        """Return the finished trials of every worker, ordered by trial id."""
+        table = TrialTable()
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT record FROM glassbox_trials WHERE study = ? AND record IS NOT NULL "
+                "ORDER BY trial_id",
+                (self.study_name,),
+            )
+            for (record,) in rows:
+                data = json.loads(record)
+                table.add_trial(
+                    data["trial_id"],
+                    data["params"],
+                    data["metrics"],
+                    data["duration"],
+                    data.get("budget"),
+                    data.get("state", "complete"),
+                    {int(k): v for k, v in data.get("intermediate", {}).items()},
+                )
+        return table
+
+    def counts(self) -> Dict[str, int]:
+        """Number of trials per state (``running``, ``complete``, ...)."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT state, COUNT(*) FROM glassbox_trials WHERE study = ? GROUP BY state",
+                (self.study_name,),
+            )
+            return {state: n for state, n in rows}
@@ -0,0 +1,469 @@
+"""Columnar storage of search results."""
+from __future__ import annotations
+
+import math
+import numbers
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+import numpy as np
+
+from glassbox.schemas import TrialResult
+from glassbox.utils.lazy_imports import optional_import
+
+
+class _Column:
+    """Growable 1-d NumPy buffer with amortized O(1) appends."""
+
+    def __init__(self, dtype: Any, fill: Any, size: int = 0) -> None:
+        self.fill = fill
+        self.data = np.full(max(16, size), fill, dtype=dtype)
+        self.size = size
+
+    def append(self, value: Any) -> None:
+        if self.size == len(self.data):
+            grown = np.full(2 * len(self.data), self.fill, dtype=self.data.dtype)
+            grown[: self.size] = self.data[: self.size]
+            self.data = grown
+        self.data[self.size] = value
+        self.size += 1
+
+    def pad(self, size: int) -> None:
+        while self.size < size:
+            self.append(self.fill)
+
+    def view(self) -> np.ndarray:
+        return self.data[: self.size]
+
+    @classmethod
+    def of(cls, values: np.ndarray, fill: Any) -> "_Column":
+        column = cls(values.dtype, fill, len(values))
+        column.data[: len(values)] = values
+        return column
+
+
+class _ParamColumn:
+    """Dictionary-encoded parameter values; code ``-1`` marks a missing value."""
+
+    def __init__(self) -> None:
+        self.codes = _Column(np.int32, -1)
+        self.values: List[Any] = []
+        self._lookup: Dict[Any, int] = {}
+
+    def encode(self, value: Any) -> int:
+        key = (type(value), value if _hashable(value) else repr(value))
+        code = self._lookup.get(key)
+        if code is None:
+            code = self._lookup[key] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Map *codes* to values; numeric columns use ``nan`` for ``None``/missing."""
+        numbers_only = [v for v in self.values if v is not None]
+        numeric = bool(numbers_only) and all(
+            isinstance(v, numbers.Real) and not isinstance(v, bool) for v in numbers_only
+        )
+        missing = bool((codes < 0).any())
+        if numeric:
+            if missing or len(numbers_only) < len(self.values):
+                table = np.array([np.nan if v is None else v for v in self.values] + [np.nan], float)
+            else:
+                table = np.asarray(self.values)
+        else:
+            table = np.empty(len(self.values) + 1, dtype=object)
+            table[: len(self.values)] = self.values
+            table[-1] = None
+        return table[codes]
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class TrialTable:
+    """Search results stored as NumPy columns.
+
+    Trial ids, durations, budgets, states and every metric are kept in
+    contiguous arrays, and parameters are dictionary-encoded per name, so a
+    table of a million trials costs a few arrays instead of a million
+    pydantic objects. The table still behaves like the list of
+    :class:`~glassbox.schemas.TrialResult` it replaces: ``len``, iteration and
+    indexing create ``TrialResult`` objects on access only.
+
+    Selection is vectorized: :meth:`best` ranks by a metric, :meth:`filter`
+    takes a boolean mask (e.g. ``table.column("max_depth") > 5``) and
+    :meth:`aggregate` reduces a metric per parameter value.
+    """
+
+    def __init__(self) -> None:
+        self._ids = _Column(np.int64, 0)
+        self._durations = _Column(np.float64, np.nan)
+        self._budgets = _Column(np.float64, np.nan)
+        self._states = _Column(np.int8, 0)
+        self._state_names: List[str] = ["complete"]
+        self._metrics: Dict[str, _Column] = {}
+        self._reported: Dict[str, _Column] = {}
+        self._params: Dict[str, _ParamColumn] = {}
+        self._intermediate: Dict[int, Dict[int, float]] = {}
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_results(cls, results: Iterable[TrialResult]) -> "TrialTable":
+        table = cls()
+        table.extend(results)
+        return table
+
+    def add_trial(
+        self,
+        trial_id: int,
+        params: Dict[str, Any],
+        metrics: Dict[str, float],
+        duration: float,
+        budget: float | None = None,
+        state: str = "complete",
+        intermediate: Dict[int, float] | None = None,
+    ) -> None:
+        """Add one trial."""
+        row = len(self)
+        self._ids.append(trial_id)
+        self._durations.append(duration)
+        self._budgets.append(np.nan if budget is None else budget)
+        if state not in self._state_names:
+            self._state_names.append(state)
+        self._states.append(self._state_names.index(state))
+        for name, value in metrics.items():
+            column = self._metrics.get(name)
+            if column is None:
+                column = self._metrics[name] = _Column(np.float64, np.nan)
+                self._reported[name] = _Column(np.bool_, False)
+            column.pad(row)
+            column.append(value)
+            self._reported[name].pad(row)
+            self._reported[name].append(True)
+        for name, value in params.items():
+            column = self._params.get(name)
+            if column is None:
+                column = self._params[name] = _ParamColumn()
+            column.codes.pad(row)
+            column.codes.append(column.encode(value))
+        if intermediate:
+            self._intermediate[row] = dict(intermediate)
+
+    @classmethod
+    def concat(cls, tables: Sequence["TrialTable"]) -> "TrialTable":
+        """Stack several tables without materializing their rows."""
+        out = cls()
+        for table in tables:
+            table._pad()
+        sizes = [len(t) for t in tables]
+        offsets = np.cumsum([0] + sizes)
+        total = int(offsets[-1])
+
+        def stack(get, dtype, fill):
+            parts = [get(t) for t in tables]
+            return _Column.of(np.concatenate(parts) if parts else np.empty(0, dtype), fill)
+
+        out._ids = stack(lambda t: t._ids.view(), np.int64, 0)
+        out._durations = stack(lambda t: t._durations.view(), np.float64, np.nan)
+        out._budgets = stack(lambda t: t._budgets.view(), np.float64, np.nan)
+        for table in tables:
+            for state in table._state_names:
+                if state not in out._state_names:
+                    out._state_names.append(state)
+        out._states = stack(
+            lambda t: np.asarray([out._state_names.index(n) for n in t._state_names], np.int8)[
+                t._states.view()
+            ],
+            np.int8,
+            0,
+        )
+        for name in dict.fromkeys(n for t in tables for n in t._metrics):
+            values = np.full(total, np.nan)
+            reported = np.zeros(total, dtype=bool)
+            for table, start, size in zip(tables, offsets, sizes):
+                if name in table._metrics:
+                    values[start : start + size] = table._metrics[name].view()
+                    reported[start : start + size] = table._reported[name].view()
+            out._metrics[name] = _Column.of(values, np.nan)
+            out._reported[name] = _Column.of(reported, False)
+        for name in dict.fromkeys(n for t in tables for n in t._params):
+            column = out._params[name] = _ParamColumn()
+            codes = np.full(total, -1, dtype=np.int32)
+            for table, start, size in zip(tables, offsets, sizes):
+                source = table._params.get(name)
+                if source is None:
+                    continue
+                mapping = np.asarray([column.encode(v) for v in source.values] + [-1], np.int32)
+                codes[start : start + size] = mapping[source.codes.view()]
+            column.codes = _Column.of(codes, -1)
+        for table, start in zip(tables, offsets):
+            for row, curve in table._intermediate.items():
+                out._intermediate[int(start) + row] = curve
+        return out
+
+    def append(self, result: TrialResult) -> None:
+        """Add a finished trial, like ``list.append``."""
+        self.add_trial(
+            result.trial_id,
+            result.params,
+            result.metrics,
+            result.duration,
+            result.budget,
+            result.state,
+            result.intermediate,
+        )
+
+    def extend(self, results: Iterable[TrialResult]) -> None:
+        for result in results:
+            self.append(result)
+
+    def _pad(self) -> None:
+        size = len(self)
+        for name, column in self._metrics.items():
+            column.pad(size)
+            self._reported[name].pad(size)
+        for column in self._params.values():
+            column.codes.pad(size)
+
+    # ------------------------------------------------------------------
+    # List compatibility
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._ids.size
+
+    def __iter__(self) -> Iterator[TrialResult]:
+        return (self._result(i) for i in range(len(self)))
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("trial table index out of range")
+            return self._result(int(index))
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+        return self.take(np.asarray(index))
+
+    def __repr__(self) -> str:
+        return f"TrialTable({len(self)} trials, metrics={list(self._metrics)}, params={list(self._params)})"
+
+    def _result(self, row: int) -> TrialResult:
+        self._pad()
+        budget = self._budgets.data[row]
+        params = {}
+        for name, column in self._params.items():
+            code = column.codes.data[row]
+            if code >= 0:
+                params[name] = column.values[code]
+        metrics = {
+            name: float(column.data[row])
+            for name, column in self._metrics.items()
+            if self._reported[name].data[row]
+        }
+        # Values come from validated appends, so skip pydantic validation.
+        return TrialResult.model_construct(
+            trial_id=int(self._ids.data[row]),
+            params=params,
+            metrics=metrics,
+            duration=float(self._durations.data[row]),
+            budget=None if math.isnan(budget) else float(budget),
+            state=self._state_names[self._states.data[row]],
+            intermediate=self._intermediate.get(row, {}),
+        )
+
+    def to_list(self) -> List[TrialResult]:
+        return list(self)
+
+    # ------------------------------------------------------------------
+    # Columns
+    # ------------------------------------------------------------------
+    @property
+    def trial_ids(self) -> np.ndarray:
+        return self._ids.view()
+
+    @property
+    def durations(self) -> np.ndarray:
+        return self._durations.view()
+
+    @property
+    def budgets(self) -> np.ndarray:
+        """Budget per trial, ``nan`` where none was used."""
+        return self._budgets.view()
+
+    @property
+    def states(self) -> np.ndarray:
+        return np.asarray(self._state_names, dtype=object)[self._states.view()]
+
+    @property
+    def metric_names(self) -> List[str]:
+        return list(self._metrics)
+
+    @property
+    def param_names(self) -> List[str]:
+        return list(self._params)
+
+    def metric(self, name: str) -> np.ndarray:
+        """Values of metric *name*, ``nan`` where a trial did not report it."""
+        self._pad()
+        if name not in self._metrics:
+            raise KeyError(name)
+        return self._metrics[name].view()
+
+    def param(self, name: str) -> np.ndarray:
+        """Decoded values of parameter *name* (numeric dtype when possible)."""
+        self._pad()
+        if name not in self._params:
+            raise KeyError(name)
+        return self._params[name].decode(self._params[name].codes.view())
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a metric, parameter or ``trial_id``/``duration``/``budget``/``state`` column."""
+        builtin = {
+            "trial_id": lambda: self.trial_ids,
+            "duration": lambda: self.durations,
+            "budget": lambda: self.budgets,
+            "state": lambda: self.states,
+        }
+        if name in builtin:
+            return builtin[name]()
+        if name in self._metrics:
+            return self.metric(name)
+        return self.param(name)
+
+    # ------------------------------------------------------------------
+    # Vectorized selection
+    # ------------------------------------------------------------------
+    def take(self, indices: Sequence[int] | np.ndarray) -> "TrialTable":
+        """Return a new table with the rows at *indices* (or a boolean mask)."""
+        self._pad()
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        table = TrialTable()
+        table._ids = _Column.of(self._ids.view()[indices], 0)
+        table._durations = _Column.of(self._durations.view()[indices], np.nan)
+        table._budgets = _Column.of(self._budgets.view()[indices], np.nan)
+        table._states = _Column.of(self._states.view()[indices], 0)
+        table._state_names = list(self._state_names)
+        table._metrics = {n: _Column.of(c.view()[indices], np.nan) for n, c in self._metrics.items()}
+        table._reported = {n: _Column.of(c.view()[indices], False) for n, c in self._reported.items()}
+        for name, column in self._params.items():
+            copy = _ParamColumn()
+            copy.values = list(column.values)
+            copy._lookup = dict(column._lookup)
+            copy.codes = _Column.of(column.codes.view()[indices], -1)
+            table._params[name] = copy
+        table._intermediate = {
+            new: self._intermediate[int(old)]
+            for new, old in enumerate(indices)
+            if int(old) in self._intermediate
+        }
+        return table
+
+    def filter(self, mask: np.ndarray) -> "TrialTable":
+        """Rows where the boolean *mask* is true."""
+        return self.take(np.asarray(mask, dtype=bool))
+
+    def sort(self, by: str = "trial_id", *, descending: bool = False) -> "TrialTable":
+        """Return the table ordered by a column (stable; ``nan`` last when descending)."""
+        values = self.column(by)
+        if descending and values.dtype.kind in "fiub":
+            order = np.argsort(-np.nan_to_num(values.astype(float), nan=-np.inf), kind="stable")
+        else:
+            order = np.argsort(values, kind="stable")
+            if descending:
+                order = order[::-1]
+        return self.take(order)
+
+    def best_indices(self, k: int = 1, metric: str = "score") -> np.ndarray:
+        """Row indices of the ``k`` highest values of *metric*, best first.
+
+        Ties keep table order; trials without the metric rank last.
+        """
+        if not len(self) or metric not in self._metrics:
+            return np.arange(min(k, len(self)))
+        scores = np.nan_to_num(self.metric(metric), nan=-np.inf)
+        k = min(k, len(scores))
+        if k < len(scores):
+            candidates = np.argpartition(-scores, k - 1)[:k]
+            # Include every row tied with the k-th score so ties stay stable.
+            threshold = scores[candidates].min()
+            candidates = np.flatnonzero(scores >= threshold)
+        else:
+            candidates = np.arange(len(scores))
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return order[:k]
+
+    def best(self, k: int = 1, metric: str = "score") -> "TrialTable":
+        """The ``k`` best trials by *metric*, best first."""
+        return self.take(self.best_indices(k, metric))
+
+    def aggregate(
+        self, metric: str = "score", by: str | None = None, func: str = "mean"
+    ) -> Dict[Any, float] | float:
+        """Reduce *metric* with ``mean``/``max``/``min``/``sum``/``std``/``count``.
+
+        With *by* the reduction runs per value of that parameter and a
+        ``{value: result}`` dict is returned.
+        """
+        reducers = {
+            "mean": np.nanmean,
+            "max": np.nanmax,
+            "min": np.nanmin,
+            "sum": np.nansum,
+            "std": np.nanstd,
+            "count": lambda v: float(np.count_nonzero(~np.isnan(v))),
+        }
+        if func not in reducers:
+            raise ValueError(f"Unknown aggregation: {func}")
+        values = self.metric(metric)
+        if by is None:
+            return float(reducers[func](values))
+        self._pad()
+        column = self._params[by]
+        codes = column.codes.view()
+        order = np.argsort(codes, kind="stable")
+        uniques, starts = np.unique(codes[order], return_index=True)
+        groups = np.split(values[order], starts[1:])
+        return {
+            (column.values[code] if code >= 0 else None): float(reducers[func](group))
+            for code, group in zip(uniques, groups)
+        }
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+    def _columns(self) -> Dict[str, np.ndarray]:
+        self._pad()
+        data: Dict[str, np.ndarray] = {
+            "trial_id": self.trial_ids,
+            "duration": self.durations,
+            "budget": self.budgets,
+            "state": self.states,
+        }
+        data.update({name: self.metric(name) for name in self._metrics})
+        data.update({f"params/{name}": self.param(name) for name in self._params})
+        return data
+
+    def to_pandas(self):
+        """Return a :class:`pandas.DataFrame`; numeric columns are not copied."""
+        pd = optional_import("pandas")
+        return pd.DataFrame(self._columns(), copy=False)
+
+    def to_arrow(self):
+        """Return a :class:`pyarrow.Table`; numeric columns are not copied."""
+        pa = optional_import("pyarrow")
+        columns = self._columns()
+        return pa.table(
+            {
+                name: pa.array(values.tolist()) if values.dtype == object else pa.array(values)
+                for name, values in columns.items()
+            }
+        )
@@ -0,0 +1,159 @@
+"""Reuse fitted state across grid trials that differ in one growable dimension."""
+from __future__ import annotations
+
+import copy
+import time
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from glassbox.core.parallel import KeepModel, TrialOutcome, take_rows, worker_id
+from glassbox.core.profiling import PhaseTimer, capture
+from glassbox.core.space import SearchSpace
+from glassbox.schemas import Evaluator
+from glassbox.utils.shared_memory import SharedArray, resolve
+from glassbox.utils.threads import thread_params
+
+# Dimension -> how consecutive fits continue from the previous estimator:
+# "grow" sets the cumulative size, "continue" runs only the extra iterations,
+# and "path" refits the same convex problem from the previous solution
+# (ascending for ``C``, descending for ``alpha`` so regularization weakens).
+WARM_START_DIMENSIONS: Dict[str, str] = {
+    "n_estimators": "grow",
+    "max_iter": "continue",
+    "C": "path",
+    "alpha": "path",
+}
+
+# ``max_iter`` is an increment for some estimators and a cumulative total for
+# others, so it is only warm started for these base classes.
+MAX_ITER_MODES: Dict[str, str] = {
+    "BaseMultilayerPerceptron": "continue",
+    "BaseSGD": "continue",
+    "BaseHistGradientBoosting": "grow",
+}
+
+
+def warm_start_mode(model: Any, dimension: str) -> str | None:
+    """How *model* continues along *dimension*; ``None`` if it cannot."""
+    if dimension != "max_iter":
+        return WARM_START_DIMENSIONS.get(dimension)
+    for cls in type(model).__mro__:
+        if cls.__name__ in MAX_ITER_MODES:
+            return MAX_ITER_MODES[cls.__name__]
+    return None
+
+
+def warm_start_dimension(model: Any, space: SearchSpace) -> str | None:
+    """Return the grid dimension trials can warm start along, if any."""
+    params = model.get_params()
+    if "warm_start" not in params:
+        return None
+    for name in WARM_START_DIMENSIONS:
+        if warm_start_mode(model, name) is None:
+            continue
+        if name in params and name in space.discrete_keys:
+            if len(space.dimensions[name]) > 1:
+                return name
+    return None
+
+
+def warm_start_chains(
+    space: SearchSpace, dimension: str
+) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+    """Yield the grid as chains sharing every parameter except *dimension*.
+
+    Each chain is ordered along *dimension* and holds ``(trial_id, params)``
+    pairs whose ids match those of a plain grid search.
+    """
+    values = list(space.dimensions[dimension])
+    ordered = sorted(values, reverse=dimension == "alpha")
+    others = SearchSpace({k: v for k, v in space.dimensions.items() if k != dimension})
+    for base in others:
+        chain = []
+        for value in ordered:
+            params = {k: value if k == dimension else base[k] for k in space.keys}
+            chain.append((space.index_of(params) + 1, params))
+        yield chain
+
+
+def fit_chain(
+    model: Any,
+    chain: Sequence[Dict[str, Any]],
+    dimension: str,
+    X,
+    y,
+    evaluator: Evaluator,
+    rows: Sequence[int] | SharedArray | None = None,
+    *,
+    keep_model: KeepModel | None = None,
+    profile: Tuple[bool, bool] = (False, False),
+    sample_interval: float | None = None,
+    deadline: float | None = None,
+    threads: int | None = None,
+) -> List[TrialOutcome]:
+    """Fit a chain of configurations, continuing from the previous estimator.
+
+    Runs in worker processes like :func:`~glassbox.core.parallel.fit_and_score`
+    and returns one outcome per configuration. Each duration covers only the
+    incremental work for that configuration, and data handling and
+    construction are attributed to the first one. Once the wall-clock
+    *deadline* has passed the rest of the chain is skipped, so fewer
+    outcomes than configurations may be returned.
+    """
+    timer = PhaseTimer()
+    X, y = resolve(X), resolve(y)
+    if rows is not None:
+        rows = resolve(rows)
+        X, y = take_rows(X, rows), take_rows(y, rows)
+    mode = warm_start_mode(model, dimension)
+    with timer.phase("construct"):
+        defaults = model.get_params()
+        trial_model = model.__class__(
+            **{**defaults, **thread_params(defaults, threads), **chain[0], "warm_start": True}
+        )
+    outcomes: List[TrialOutcome] = []
+    kept: List[Tuple[float, int]] = []
+    previous = 0
+    for params in chain:
+        if outcomes and deadline is not None and time.time() >= deadline:
+            break
+        value = params[dimension]
+        update = {**params}
+        if mode == "continue":
+            update[dimension] = value - previous
+        with capture(*profile, sample_interval=sample_interval) as payload:
+            with timer.phase("construct"):
+                trial_model.set_params(**update)
+            with timer.phase("fit"):
+                trial_model.fit(X, y)
+            with timer.phase("evaluate"):
+                metrics = evaluator.evaluate_metrics(trial_model, X, y)
+        resources = payload.pop("resources", {})
+        duration = timer.timings["fit"] + timer.timings["evaluate"]
+        snapshot = None
+        if keep_model is not None and keep_model.wants(trial_model, metrics["score"]):
+            # Later fits mutate the estimator, so kept models must be snapshots.
+            snapshot = trial_model if params is chain[-1] else copy.deepcopy(trial_model)
+            kept.append((metrics["score"], len(outcomes)))
+        outcomes.append(
+            TrialOutcome(
+                metrics,
+                duration,
+                snapshot,
+                {},
+                "complete",
+                timer.finish(),
+                worker_id(),
+                payload or None,
+                resources,
+            )
+        )
+        if keep_model is not None and keep_model.k is not None and len(kept) >= keep_model.k:
+            # Only models beating the chain's own k-th best can still be kept.
+            kept.sort(reverse=True)
+            for _, index in kept[keep_model.k :]:
+                outcomes[index] = outcomes[index]._replace(model=None)
+            del kept[keep_model.k :]
+            keep_model = keep_model._replace(threshold=max(keep_model.threshold, kept[-1][0]))
+        previous = value
+        timer = PhaseTimer()
+    return outcomes
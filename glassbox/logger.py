@@ -1,55 +1,240 @@
 """Unified logging for the Glassbox package."""
 from __future__ import annotations
 
-from typing import Iterable, List
+import atexit
+import sys
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+
+Record = Tuple[str, str]
+
+
+class Sink(ABC):
+    """Destination for formatted log records.
+
+    ``write`` receives a batch of ``(level, message)`` records; buffered
+    loggers call it from their flush thread with everything logged since the
+    previous flush.
+    """
+
+    @abstractmethod
+    def write(self, records: List[Record]) -> None:
+        """Write a batch of ``(level, message)`` records."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class ConsoleSink(Sink):
+    """Print records to the current ``sys.stdout``."""
+
+    def write(self, records: List[Record]) -> None:
+        stream = sys.stdout
+        stream.write("".join(f"{message}\n" for _, message in records))
+        stream.flush()
+
+
+class FileSink(Sink):
+    """Append records to a text file, one line per message."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = self.path.open("a")
+
+    def write(self, records: List[Record]) -> None:
+        self._fh.write("".join(f"{level.upper()} {message}\n" for level, message in records))
+        self._fh.flush()
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class WandbSink(Sink):
+    """Send a batch of records to the active W&B run in one ``wandb.log`` call."""
+
+    def __init__(self) -> None:
+        self._wandb: Any = None
+
+    def write(self, records: List[Record]) -> None:
+        try:
+            if self._wandb is None:
+                import wandb  # type: ignore
+
+                self._wandb = wandb
+            if len(records) == 1:
+                level, message = records[0]
+                self._wandb.log({"message": message, "level": level})
+            else:
+                self._wandb.log(
+                    {
+                        "message": "\n".join(m for _, m in records),
+                        "level": max((lvl for lvl, _ in records), key=LEVELS.get),
+                    }
+                )
+        except Exception:
+            pass
 
 
 class GlassboxLogger:
-    """Simple logger that can write to multiple backends."""
+    """Simple logger that can write to multiple backends.
+
+    Messages are only formatted when they pass the level filter: pass a
+    callable returning the text, or ``%``-style arguments after the format
+    string, so disabled log calls cost a single comparison. With
+    ``buffered=True`` records are collected per destination and written by a
+    background thread every ``flush_interval`` seconds (errors are written
+    immediately).
+    """
 
     def __init__(
         self,
         use_wandb: bool = False,
         verbose: bool = True,
+        *,
+        level: str = "info",
+        buffered: bool = False,
+        flush_interval: float = 0.5,
+        max_buffer: int = 1000,
     ) -> None:
         self.use_wandb = use_wandb
         self.verbose = verbose
+        self.level = level
+        self.sinks: Dict[str, Sink] = {"console": ConsoleSink(), "wandb": WandbSink()}
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self._buffers: Dict[str, List[Record]] = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self.buffered = False
+        if buffered:
+            self.set_buffered(True)
+
+    @property
+    def level(self) -> str:
+        return self._level_name
+
+    @level.setter
+    def level(self, level: str) -> None:
+        if level.lower() not in LEVELS:
+            raise ValueError(f"Unknown log level: {level}")
+        self._level_name = level.lower()
+        self._threshold = LEVELS[self._level_name]
 
     def set_verbose(self, verbose: bool) -> None:
         """Globally enable or disable non-error logging."""
         self.verbose = verbose
 
-    def log(self, message: str, level: str = "info", to: Iterable[str] | None = None) -> None:
+    def set_buffered(self, buffered: bool, flush_interval: float | None = None) -> None:
+        """Switch between direct writes and background-flushed batches."""
+        if flush_interval is not None:
+            self.flush_interval = flush_interval
+        if not buffered:
+            self.flush()
+        self.buffered = buffered
+        self._wake.set()
+        if buffered and (self._flusher is None or not self._flusher.is_alive()):
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="glassbox-logger", daemon=True
+            )
+            self._flusher.start()
+
+    def add_sink(self, name: str, sink: Sink) -> None:
+        """Register *sink* as the destination ``name`` (e.g. a :class:`FileSink`)."""
+        self.sinks[name] = sink
+
+    def enabled(self, level: str = "info") -> bool:
+        """Return ``True`` if a message at *level* would be emitted."""
+        value = LEVELS.get(level.lower(), LEVELS["info"])
+        if value >= LEVELS["error"]:
+            return True
+        return self.verbose and value >= self._threshold
+
+    def log(
+        self,
+        message: str | Callable[[], str],
+        *args: Any,
+        level: str = "info",
+        to: Iterable[str] | None = None,
+    ) -> None:
         """Log a message to the selected destinations.
 
         Parameters
         ----------
         message:
-            Text to log.
+            Text to log, a ``%``-style format string for *args*, or a callable
+            returning the text. Formatting only happens if the level is
+            enabled. For backwards compatibility, a message without ``%``
+            followed by a level name (and optionally the destinations) is
+            read as the older ``log(message, level, to)`` call.
         level:
-            Log level as a string. Currently unused but reserved for future
-            enhancements.
+            ``"debug"``, ``"info"``, ``"warning"`` or ``"error"``. Messages
+            below the logger's level, and all non-errors when verbosity is
+            disabled, are skipped.
         to:
-            Iterable of destinations. Supported values: ``"console"`` or
-            ``"wandb"``.
+            Iterable of destinations. Supported values: ``"console"``,
+            ``"wandb"`` and any name registered with :meth:`add_sink`.
         """
 
-        # Skip non-error logs when verbosity is disabled
-        if not self.verbose and level.lower() != "error":
+        if (
+            args
+            and len(args) <= 2
+            and isinstance(message, str)
+            and "%" not in message
+            and isinstance(args[0], str)
+            and args[0].lower() in LEVELS
+        ):
+            level, to, args = args[0], args[1] if len(args) > 1 else to, ()
+
+        if not self.enabled(level):
             return
 
-        destinations: List[str] = list(to) if to is not None else ["console"]
+        if callable(message):
+            message = message()
+        elif args:
+            message = message % args
+        record = (level.lower(), str(message))
 
-        if "console" in destinations:
-            print(message)
+        destinations: List[str] = list(to) if to is not None else ["console"]
+        names = [
+            name
+            for name in destinations
+            if name in self.sinks and (name != "wandb" or self.use_wandb)
+        ]
+        if not self.buffered or record[0] == "error":
+            self.flush()
+            for name in names:
+                self.sinks[name].write([record])
+            return
+        with self._lock:
+            for name in names:
+                self._buffers.setdefault(name, []).append(record)
+            self._pending += 1
+            if self._pending >= self.max_buffer:
+                self._wake.set()
 
-        if "wandb" in destinations and self.use_wandb:
-            try:
-                import wandb  # type: ignore
+    def flush(self) -> None:
+        """Write all buffered records now."""
+        with self._lock:
+            buffers, self._buffers, self._pending = self._buffers, {}, 0
+        for name, records in buffers.items():
+            sink = self.sinks.get(name)
+            if sink is not None and records:
+                sink.write(records)
 
-                wandb.log({"message": message, "level": level})
-            except Exception:
-                pass
+    def _flush_loop(self) -> None:
+        while self.buffered:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
 
 
 logger = GlassboxLogger(use_wandb=True)
+atexit.register(logger.flush)
@@ -1,7 +1,23 @@
 """Plugin system for Glassbox."""
 
-from glassbox.plugins.base import Plugin
-from glassbox.plugins.manager import PluginManager
-from glassbox.plugins.resource_monitor import ResourceMonitor
+from importlib import import_module
+
+_LAZY = {
+    "Plugin": "glassbox.plugins.base",
+    "PluginManager": "glassbox.plugins.manager",
+    "ResourceMonitor": "glassbox.plugins.resource_monitor",
+}
 
 __all__ = ["Plugin", "PluginManager", "ResourceMonitor"]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
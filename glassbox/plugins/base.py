@@ -7,6 +7,10 @@ class Plugin:
     Subclasses can override any of the lifecycle hooks to perform actions
     during training. Hooks should be non-blocking and avoid mutating model
     state.
+
+    When the :class:`~glassbox.plugins.manager.PluginManager` dispatches
+    asynchronously, a plugin may also define ``on_epoch_end_batch(metrics)``
+    to receive several queued ``on_epoch_end`` payloads in one call.
     """
 
     def on_training_start(self) -> None:  # pragma: no cover - simple pass methods
@@ -17,6 +21,10 @@ class Plugin:
         """Called after training ends."""
         pass
 
+    def on_trial_end(self, result) -> None:  # pragma: no cover - simple pass methods
+        """Called with the :class:`~glassbox.schemas.TrialResult` of each finished trial."""
+        pass
+
     def on_epoch_end(self, metrics: dict) -> None:  # pragma: no cover - simple pass methods
         """Called after each epoch with training metrics."""
         pass
@@ -1,19 +1,236 @@
 """Plugin manager for coordinating plugin hooks."""
+from __future__ import annotations
+
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Any, Callable, Deque, Dict, Iterable, List, Tuple
+
+from glassbox.logger import logger
+from glassbox.plugins.base import Plugin
+
+Event = Tuple[str, Dict[str, Any]]
+
+
+def _spawn(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """Run ``method(*args, **kwargs)`` on a daemon thread and return its future."""
+    future: Future = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(method(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name="glassbox-plugin-hook", daemon=True).start()
+    return future
 
 
 class PluginManager:
-    """Registers and dispatches events to plugins."""
+    """Registers and dispatches events to plugins.
+
+    By default hooks run synchronously inside :meth:`trigger`. With
+    ``async_dispatch=True`` events are put on a bounded queue and a background
+    thread calls the hooks, so a slow plugin costs the search roughly one
+    queue append per event. In async mode a hook that raises does not stop
+    the search: the exception is logged and kept in :attr:`errors`. Call
+    :meth:`close` when done; it delivers what is queued and stops the
+    background thread.
 
-    def __init__(self) -> None:
+    Parameters
+    ----------
+    async_dispatch:
+        Deliver events from a background thread.
+    max_queue:
+        Capacity of the event queue in async mode.
+    policy:
+        What to do when the queue is full: ``"block"`` waits for space,
+        ``"drop"`` discards the new event and ``"coalesce"`` replaces the
+        oldest queued event of the same hook (blocking if there is none).
+    timeout:
+        Default number of seconds a hook may run in async mode. A plugin whose
+        hook times out is skipped until that call returns. Timed hooks run
+        on daemon threads, so a stuck hook does not keep the interpreter
+        from exiting.
+    batch_size:
+        Maximum number of queued events handled per wake-up. Consecutive
+        events of a ``batched_hooks`` hook are delivered in one call to the
+        plugin's ``<hook>_batch`` method when it defines one.
+    batched_hooks:
+        High-frequency hooks eligible for batching.
+    flush_on:
+        Hooks after which :meth:`trigger` waits for the queue to drain.
+    """
+
+    def __init__(
+        self,
+        *,
+        async_dispatch: bool = False,
+        max_queue: int = 1024,
+        policy: str = "block",
+        timeout: float | None = None,
+        batch_size: int = 64,
+        batched_hooks: Iterable[str] = ("on_epoch_end",),
+        flush_on: Iterable[str] = ("on_training_end",),
+    ) -> None:
+        if policy not in ("block", "drop", "coalesce"):
+            logger.log(f"Unknown backpressure policy: {policy}", level="error")
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        if max_queue < 1 or batch_size < 1:
+            logger.log("max_queue and batch_size must be at least 1", level="error")
+            raise ValueError("max_queue and batch_size must be at least 1")
         self.plugins = []
+        self.async_dispatch = async_dispatch
+        self.max_queue = max_queue
+        self.policy = policy
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.batched_hooks = frozenset(batched_hooks)
+        self.flush_on = frozenset(flush_on)
+        self.dropped = 0
+        self.errors: List[BaseException] = []
+        self._timeouts: Dict[int, float | None] = {}
+        self._queue: Deque[Event] = deque()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._worker: threading.Thread | None = None
+        self._stuck: Dict[int, Future] = {}
 
-    def register(self, plugin: "Plugin") -> None:
-        """Register a plugin instance."""
+    def register(self, plugin: "Plugin", *, timeout: float | None = None) -> None:
+        """Register a plugin instance, optionally with its own hook timeout."""
         self.plugins.append(plugin)
+        self._timeouts[id(plugin)] = timeout
+
+    def handles(self, hook_name: str) -> bool:
+        """Return ``True`` if any plugin implements *hook_name*.
+
+        Hooks inherited unchanged from :class:`~glassbox.plugins.base.Plugin`
+        do nothing, so callers can skip building their payload.
+        """
+        for plugin in self.plugins:
+            method = getattr(type(plugin), hook_name, None)
+            if callable(method) and method is not getattr(Plugin, hook_name, None):
+                return True
+        return False
 
     def trigger(self, hook_name: str, **kwargs) -> None:
         """Trigger a hook on all registered plugins."""
-        for plugin in self.plugins:
-            method = getattr(plugin, hook_name, None)
-            if callable(method):
-                method(**kwargs)
+        if not self.async_dispatch:
+            for plugin in self.plugins:
+                method = getattr(plugin, hook_name, None)
+                if callable(method):
+                    method(**kwargs)
+            return
+        self._put((hook_name, kwargs))
+        if hook_name in self.flush_on:
+            self.flush()
+
+    # ------------------------------------------------------------------
+    # Async dispatch
+    # ------------------------------------------------------------------
+    def _put(self, event: Event) -> None:
+        with self._cond:
+            if self._worker is None or not self._worker.is_alive():
+                self._closed = False
+                self._worker = threading.Thread(
+                    target=self._run, name="glassbox-plugins", daemon=True
+                )
+                self._worker.start()
+            while len(self._queue) >= self.max_queue:
+                if self.policy == "drop":
+                    self.dropped += 1
+                    return
+                if self.policy == "coalesce":
+                    for i, (hook, _) in enumerate(self._queue):
+                        if hook == event[0]:
+                            del self._queue[i]
+                            self.dropped += 1
+                            break
+                    else:
+                        self._cond.wait()
+                        continue
+                    break
+                self._cond.wait()
+            self._queue.append(event)
+            self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event was delivered; ``False`` on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._busy, timeout)
+
+    def close(self) -> None:
+        """Flush pending events and stop the background thread."""
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                n = min(self.batch_size, len(self._queue))
+                events = [self._queue.popleft() for _ in range(n)]
+                self._busy = True
+                self._cond.notify_all()
+            try:
+                self._deliver(events)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _deliver(self, events: List[Event]) -> None:
+        i = 0
+        while i < len(events):
+            hook, kwargs = events[i]
+            j = i + 1
+            if hook in self.batched_hooks:
+                while j < len(events) and events[j][0] == hook:
+                    j += 1
+            group = [kw for _, kw in events[i:j]]
+            for plugin in self.plugins:
+                batch = getattr(plugin, f"{hook}_batch", None) if len(group) > 1 else None
+                if callable(batch):
+                    self._call(plugin, batch, [kw.get("metrics", kw) for kw in group])
+                    continue
+                method = getattr(plugin, hook, None)
+                if callable(method):
+                    for kw in group:
+                        self._call(plugin, method, **kw)
+            i = j
+
+    def _call(self, plugin: Any, method, *args, **kwargs) -> None:
+        key = id(plugin)
+        timeout = self._timeouts.get(key) or self.timeout
+        try:
+            if timeout is None:
+                method(*args, **kwargs)
+                return
+            stuck = self._stuck.get(key)
+            if stuck is not None:
+                if not stuck.done():
+                    self.dropped += 1
+                    return
+                del self._stuck[key]
+            future = _spawn(method, *args, **kwargs)
+            try:
+                future.result(timeout=timeout)
+            except FutureTimeout:
+                self._stuck[key] = future
+                logger.log(
+                    f"{type(plugin).__name__}.{method.__name__} exceeded {timeout:g}s; skipping it until it returns",
+                    level="warning",
+                )
+        except Exception as exc:
+            self.errors.append(exc)
+            logger.log(f"{type(plugin).__name__}.{method.__name__} failed: {exc}", level="error")
@@ -1,34 +1,113 @@
-"""Plugin that reports CPU time and memory usage."""
+"""Plugin that reports CPU and memory usage of a search."""
 from __future__ import annotations
 
 from time import perf_counter
-import resource
+from typing import Any, Dict, List
 
 from glassbox.plugins.base import Plugin
 from glassbox.logger import logger
+from glassbox.utils.proc import ResourceSampler, Sample, available_memory, tree_usage
+
+TRIAL_METRICS = ("cpu_percent", "rss_mb", "peak_rss_mb")
 
 
 class ResourceMonitor(Plugin):
-    """Log resource usage at key training events."""
+    """Sample CPU and memory of the search in the background.
+
+    Between ``on_training_start`` and ``on_training_end`` a
+    :class:`~glassbox.utils.proc.ResourceSampler` reads ``/proc`` every
+    ``interval`` seconds for the whole process tree, i.e. the search process,
+    its worker processes and anything they spawn. The time series is kept in
+    :attr:`samples`.
+
+    Per-trial usage is measured inside the workers when the search runs with
+    ``resource_interval`` (``ModelSearch`` sets it from this monitor); the
+    ``cpu_percent``, ``rss_mb`` and ``peak_rss_mb`` metrics of every trial
+    are collected in :attr:`trials` and used by :meth:`safe_concurrency`.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, interval: float = 0.5, *, children: bool = True) -> None:
+        self.interval = interval
+        self.children = children
+        self.trials: List[Dict[str, float]] = []
+        self._sampler: ResourceSampler | None = None
+        self._samples: List[Sample] = []
         self._start: float | None = None
 
+    @property
+    def samples(self) -> List[Sample]:
+        """``(seconds, cpu_percent, rss_mb)`` samples of the process tree."""
+        if self._sampler is not None:
+            return list(self._sampler.samples)
+        return list(self._samples)
+
     def _memory_mb(self) -> float:
-        usage = resource.getrusage(resource.RUSAGE_SELF)
-        return usage.ru_maxrss / 1024  # in MB on Linux
+        # Reuse the background sampler's latest reading instead of walking
+        # the process tree again on every epoch.
+        if self._sampler is not None and self._sampler.samples:
+            return self._sampler.samples[-1][2]
+        return tree_usage(children=self.children)[1] / 2**20
 
-    def on_training_start(self) -> None:  # pragma: no cover - simple timestamp
+    def on_training_start(self) -> None:
         self._start = perf_counter()
+        self.trials = []
+        self._sampler = ResourceSampler(self.interval, children=self.children).start()
         logger.log(f"Training started | memory={self._memory_mb():.1f}MB")
 
+    def on_trial_end(self, result) -> None:
+        usage = {k: result.metrics[k] for k in TRIAL_METRICS if k in result.metrics}
+        if usage:
+            self.trials.append({"trial_id": result.trial_id, **usage})
+
     def on_epoch_end(self, metrics: dict) -> None:
+        logger.log(lambda: f"Epoch end | memory={self._memory_mb():.1f}MB | metrics={metrics}")
+
+    def on_epoch_end_batch(self, metrics: list) -> None:
         logger.log(
-            f"Epoch end | memory={self._memory_mb():.1f}MB | metrics={metrics}"
+            lambda: f"{len(metrics)} epochs end | memory={self._memory_mb():.1f}MB | last metrics={metrics[-1]}"
         )
 
-    def on_training_end(self) -> None:  # pragma: no cover - simple timestamp
+    def on_training_end(self) -> None:
         duration = perf_counter() - self._start if self._start else 0.0
+        summary: Dict[str, float] = {}
+        if self._sampler is not None:
+            summary = self._sampler.stop()
+            self._samples = self._sampler.samples
+            self._sampler = None
         logger.log(
-            f"Training finished in {duration:.2f}s | memory={self._memory_mb():.1f}MB"
+            "Training finished in %.2fs | memory=%.1fMB | peak=%.1fMB | cpu=%.0f%%",
+            duration,
+            summary.get("rss_mb", self._memory_mb()),
+            summary.get("peak_rss_mb", 0.0),
+            summary.get("cpu_percent", 0.0),
         )
+
+    def summary(self) -> Dict[str, Any]:
+        """Peak/mean usage of the process tree and the largest per-trial peak."""
+        samples = self.samples
+        out: Dict[str, Any] = {}
+        if samples:
+            out["peak_rss_mb"] = max(s[2] for s in samples)
+            busy = [s[1] for s in samples[1:]]
+            out["mean_cpu_percent"] = sum(busy) / len(busy) if busy else 0.0
+        peaks = [t["peak_rss_mb"] for t in self.trials if "peak_rss_mb" in t]
+        if peaks:
+            out["max_trial_peak_rss_mb"] = max(peaks)
+        return out
+
+    def safe_concurrency(self, memory_mb: float | None = None, *, headroom: float = 0.8) -> int | None:
+        """How many trials like the ones seen so far fit into memory at once.
+
+        Divides ``headroom`` times *memory_mb* (by default the memory the
+        kernel reports as available) by the largest per-trial peak RSS.
+        Returns ``None`` before any trial reported its peak.
+        """
+        peaks = [t["peak_rss_mb"] for t in self.trials if "peak_rss_mb" in t]
+        if not peaks:
+            return None
+        if memory_mb is None:
+            available = available_memory()
+            if available is None:
+                return None
+            memory_mb = available / 2**20
+        return max(1, int(headroom * memory_mb // max(peaks)))
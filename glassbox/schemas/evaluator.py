@@ -3,15 +3,41 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict
 
 
 class Evaluator(ABC):
-    """Base interface for model evaluation."""
+    """Base interface for model evaluation.
+
+    By default the search loop fits each trial model on the full data and then
+    calls :meth:`evaluate`. Evaluators that set ``fits_model = True`` receive
+    the unfitted estimator instead and are responsible for fitting it
+    themselves, e.g. once per cross-validation fold.
+    """
+
+    fits_model: bool = False
 
     def __init__(self, name: str = "evaluator") -> None:
         self.name = name
 
+    def prepare(self, X, y) -> None:
+        """Hook called once per search before any trial runs."""
+
+    def shared(self, share: Callable[[Any], Any]) -> "Evaluator":
+        """Return the evaluator pickled into worker processes.
+
+        *share* copies an array into shared memory and returns a handle that
+        workers attach with :func:`glassbox.utils.shared_memory.resolve`.
+        Evaluators keeping large arrays from :meth:`prepare` override this so
+        the arrays are not pickled with every trial.
+        """
+        return self
+
     @abstractmethod
     def evaluate(self, model, X, y) -> float:
         """Return a numeric score for *model* on the provided data."""
         raise NotImplementedError
+
+    def evaluate_metrics(self, model, X, y) -> Dict[str, float]:
+        """Return the trial metrics; must include a ``"score"`` entry."""
+        return {"score": float(self.evaluate(model, X, y))}
@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from pydantic import BaseModel
 
 
 class TrialResult(BaseModel):
-    """Pydantic model capturing the outcome of a single search trial."""
+    """Pydantic model capturing the outcome of a single search trial.
+
+    ``budget`` is set by multi-fidelity strategies such as successive halving
+    and records the resource (rows fraction or iteration count) the trial used.
+    ``state`` is ``"pruned"`` for trials stopped early by a pruner, and
+    ``intermediate`` maps each checkpoint step to its score.
+    """
 
     trial_id: int
     params: Dict[str, Any]
     metrics: Dict[str, float]
     duration: float
+    budget: Optional[float] = None
+    state: str = "complete"
+    intermediate: Dict[int, float] = {}
@@ -0,0 +1,278 @@
+"""Local SQLite experiment store."""
+from __future__ import annotations
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+from glassbox.logger import logger
+
+_OPERATORS = {"=", "!=", "<", "<=", ">", ">=", "in"}
+_BASE_COLUMNS = ("run", "trial_id", "duration", "created")
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _scalar(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    item = getattr(value, "item", None)  # NumPy scalars
+    if callable(item):
+        try:
+            return item()
+        except (TypeError, ValueError):
+            pass
+    return repr(value)
+
+
+class LocalTracker:
+    """Record trials in a local SQLite database.
+
+    Each trial is one row of a ``trials`` table with one column per metric and
+    one ``params/<name>`` column per hyperparameter; columns are added as new
+    names appear. :meth:`log` only enqueues the row and a background thread
+    inserts batches in a single transaction. The database runs in WAL mode
+    with a busy timeout, so several processes (e.g. distributed workers) can
+    write to the same file while others query it.
+
+    Parameters
+    ----------
+    path:
+        Database file, created if missing.
+    run:
+        Identifier stored with every row; a random id per :meth:`start` by
+        default.
+    batch_size:
+        Maximum number of rows per insert transaction.
+    flush_interval:
+        Seconds to wait for more rows before writing a partial batch.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike = "glassbox.db",
+        *,
+        run: str | None = None,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        timeout: float = 30.0,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._run_name = run
+        self.run = run
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._active = False
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS trials ("
+                "run TEXT NOT NULL, trial_id INTEGER NOT NULL, duration REAL, created REAL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS runs (run TEXT PRIMARY KEY, config TEXT, created REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS trials_run ON trials (run, trial_id)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+        return conn
+
+    # ------------------------------------------------------------------
+    # Tracker interface
+    # ------------------------------------------------------------------
+    def start(self, config: Dict[str, Any]) -> None:
+        self.run = self._run_name or uuid.uuid4().hex
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?)",
+                (self.run, json.dumps(config, default=repr), time.time()),
+            )
+        self._active = True
+        self._worker = threading.Thread(target=self._drain, name="glassbox-local", daemon=True)
+        self._worker.start()
+
+    def log(
+        self,
+        trial_id: int,
+        metrics: Dict[str, float],
+        *,
+        params: Dict[str, Any] | None = None,
+        duration: float | None = None,
+    ) -> None:
+        if not self._active:
+            return
+        row: Dict[str, Any] = {"trial_id": trial_id, "duration": duration}
+        row.update(metrics)
+        row.update({f"params/{k}": v for k, v in (params or {}).items()})
+        self._queue.put(row)
+
+    def on_trial_end(self, result) -> None:
+        self.log(result.trial_id, result.metrics, params=result.params, duration=result.duration)
+
+    def flush(self) -> None:
+        """Block until every logged trial has been written."""
+        self._queue.join()
+
+    def finish(self) -> None:
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+        self._active = False
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def _drain(self) -> None:
+        conn = self._connect()
+        try:
+            done = False
+            while not done:
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    continue
+                batch: List[Dict[str, Any]] = []
+                while True:
+                    if item is None:
+                        done = True
+                        self._queue.task_done()
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                if batch:
+                    try:
+                        self._write(conn, batch)
+                    except sqlite3.Error as exc:
+                        logger.log("LocalTracker: failed to write %d trials: %s", len(batch), exc, level="error")
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            conn.close()
+
+    def _columns(self, conn: sqlite3.Connection) -> List[str]:
+        return [row[1] for row in conn.execute("PRAGMA table_info(trials)")]
+
+    def _write(self, conn: sqlite3.Connection, batch: List[Dict[str, Any]]) -> None:
+        names: List[str] = []
+        for row in batch:
+            names.extend(k for k in row if k not in names)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            existing = set(self._columns(conn))
+            for name in names:
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE trials ADD COLUMN {_quote(name)}")
+                    if name == "score":
+                        conn.execute("CREATE INDEX IF NOT EXISTS trials_score ON trials (score)")
+            columns = ["run", "created", *names]
+            placeholders = ", ".join("?" for _ in columns)
+            now = time.time()
+            conn.executemany(
+                f"INSERT INTO trials ({', '.join(map(_quote, columns))}) VALUES ({placeholders})",
+                [[self.run, now, *(_scalar(row.get(n)) for n in names)] for row in batch],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def _resolve(self, name: str, columns: Iterable[str]) -> str:
+        columns = set(columns)
+        for candidate in (name, f"params/{name}"):
+            if candidate in columns:
+                return candidate
+        logger.log(f"Unknown trial column: {name}", level="error")
+        raise ValueError(f"Unknown trial column: {name}")
+
+    def _where(
+        self, where: Mapping[str, Any] | None, run: str | None, columns: List[str]
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        args: List[Any] = []
+        if run is not None:
+            clauses.append("run = ?")
+            args.append(run)
+        for name, condition in (where or {}).items():
+            op, value = condition if isinstance(condition, tuple) else ("=", condition)
+            if op not in _OPERATORS:
+                logger.log(f"Unsupported operator: {op}", level="error")
+                raise ValueError(f"Unsupported operator: {op}")
+            column = _quote(self._resolve(name, columns))
+            if op == "in":
+                value = list(value)
+                clauses.append(f"{column} IN ({', '.join('?' for _ in value)})")
+                args.extend(_scalar(v) for v in value)
+            else:
+                clauses.append(f"{column} {op} ?")
+                args.append(_scalar(value))
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), args
+
+    def query(
+        self,
+        where: Mapping[str, Any] | None = None,
+        *,
+        order_by: str | None = None,
+        ascending: bool = False,
+        k: int | None = None,
+        run: str | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Return matching trials as dictionaries.
+
+        *where* maps a metric or parameter name to a value or an
+        ``(operator, value)`` pair, e.g. ``{"max_depth": (">", 5)}``.
+        """
+        if self._active:
+            self.flush()
+        with closing(self._connect()) as conn:
+            columns = self._columns(conn)
+            sql, args = self._where(where, run, columns)
+            if order_by is not None:
+                direction = "ASC" if ascending else "DESC"
+                sql += f" ORDER BY {_quote(self._resolve(order_by, columns))} {direction}"
+            if k is not None:
+                sql += " LIMIT ?"
+                args.append(int(k))
+            cursor = conn.execute(f"SELECT * FROM trials{sql}", args)
+            names = [d[0] for d in cursor.description]
+            return [
+                {n: v for n, v in zip(names, row) if v is not None or n in _BASE_COLUMNS}
+                for row in cursor
+            ]
+
+    def top(
+        self, k: int = 10, by: str = "score", where: Mapping[str, Any] | None = None, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Return the ``k`` best trials by *by*, e.g. ``top(10, where={"max_depth": (">", 5)})``."""
+        return self.query(where, order_by=by, k=k, **kwargs)
+
+    def count(self, where: Mapping[str, Any] | None = None, *, run: str | None = None) -> int:
+        """Return the number of matching trials."""
+        if self._active:
+            self.flush()
+        with closing(self._connect()) as conn:
+            sql, args = self._where(where, run, self._columns(conn))
+            return conn.execute(f"SELECT COUNT(*) FROM trials{sql}", args).fetchone()[0]
@@ -1,26 +1,116 @@
 """Weights & Biases tracking integration."""
 from __future__ import annotations
 
-from typing import Any, Dict
+import queue
+import threading
+from typing import Any, Dict, List
 
+from glassbox.logger import logger
 from glassbox.utils.lazy_imports import optional_import
 
 
 class WandbTracker:
-    """Thin wrapper around :mod:`wandb` allowing lazy import."""
+    """Thin wrapper around :mod:`wandb` allowing lazy import.
 
-    def __init__(self) -> None:
-        self._wandb = optional_import("wandb")
+    :meth:`log` only enqueues the trial; a background thread collects up to
+    ``batch_size`` trials (or whatever arrived within ``flush_interval``
+    seconds) and logs them, one step per trial, so tracking never adds to
+    trial wall-clock and per-trial charts keep every trial.
+    ``mode="offline"`` is passed to ``wandb.init``; *client* replaces the
+    :mod:`wandb` module, e.g. with a local stand-in.
+
+    Registered with a :class:`~glassbox.plugins.manager.PluginManager`, the
+    tracker receives every trial through the ``on_trial_end`` hook as soon as
+    it completes.
+    """
+
+    def __init__(
+        self,
+        *,
+        project: str = "glassbox",
+        mode: str | None = None,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+        client: Any | None = None,
+    ) -> None:
+        self._wandb = client if client is not None else optional_import("wandb")
+        self.project = project
+        self.mode = mode
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
         self._run = None
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._best: float | None = None
+        self._count = 0
 
     def start(self, config: Dict[str, Any]) -> None:
-        self._run = self._wandb.init(project="glassbox", config=config)
+        kwargs = {"mode": self.mode} if self.mode is not None else {}
+        self._run = self._wandb.init(project=self.project, config=config, **kwargs)
+        self._best = None
+        self._count = 0
+        self._worker = threading.Thread(target=self._drain, name="glassbox-wandb", daemon=True)
+        self._worker.start()
 
-    def log(self, trial_id: int, metrics: Dict[str, float]) -> None:
+    def log(
+        self,
+        trial_id: int,
+        metrics: Dict[str, float],
+        *,
+        params: Dict[str, Any] | None = None,
+        duration: float | None = None,
+    ) -> None:
         if self._run is None:
             return
-        self._wandb.log({"trial_id": trial_id, **metrics})
+        record: Dict[str, Any] = {"trial_id": trial_id, **metrics}
+        if duration is not None:
+            record["duration"] = duration
+        if params:
+            record.update({f"params/{k}": v for k, v in params.items()})
+        self._queue.put(record)
+
+    def on_trial_end(self, result) -> None:
+        self.log(result.trial_id, result.metrics, params=result.params, duration=result.duration)
 
     def finish(self) -> None:
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
         if self._run is not None:
             self._run.finish()
+            self._run = None
+
+    def _drain(self) -> None:
+        done = False
+        while not done:
+            batch: List[Dict[str, Any]] = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            done = item is None
+            if batch:
+                self._send(batch)
+
+    def _send(self, batch: List[Dict[str, Any]]) -> None:
+        """Log every trial of *batch* as its own step with the running totals."""
+        for record in batch:
+            self._count += 1
+            if "score" in record and (self._best is None or record["score"] > self._best):
+                self._best = record["score"]
+            data: Dict[str, Any] = {**record, "n_trials": self._count}
+            if self._best is not None:
+                data["best_score"] = self._best
+            try:
+                self._wandb.log(data)
+            except Exception as exc:  # pragma: no cover - network/wandb errors
+                logger.log("WandbTracker: failed to log trial %s: %s", record["trial_id"], exc, level="warning")
@@ -0,0 +1,247 @@
+"""Process CPU and memory sampling from ``/proc``."""
+from __future__ import annotations
+
+import os
+import resource
+import threading
+import time
+from typing import Dict, List, Tuple
+
+PROC = "/proc"
+_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+Sample = Tuple[float, float, float]  # (seconds since start, cpu %, rss MB)
+
+
+def proc_available() -> bool:
+    """Return ``True`` if this platform exposes a Linux-style ``/proc``."""
+    return os.path.exists(os.path.join(PROC, "self", "stat"))
+
+
+def _read_stat(pid: int) -> Tuple[int, float, int] | None:
+    """Return ``(ppid, cpu_seconds, rss_bytes)`` of *pid*, or ``None`` if it is gone.
+
+    CPU time includes the children the process has already reaped, so work
+    done by short-lived subprocesses is not lost when they exit.
+    """
+    try:
+        with open(os.path.join(PROC, str(pid), "stat"), "rb") as fh:
+            data = fh.read()
+    except OSError:
+        return None
+    # The command name may contain spaces, so split after its closing paren.
+    fields = data[data.rindex(b")") + 2 :].split()
+    cpu = sum(int(v) for v in fields[11:15]) / _TICKS
+    return int(fields[1]), cpu, int(fields[21]) * _PAGE
+
+
+def _has_children_files() -> bool:
+    """``True`` if the kernel lists child pids in ``/proc/<pid>/task/<tid>/children``."""
+    pid = os.getpid()
+    return os.path.exists(os.path.join(PROC, str(pid), "task", str(pid), "children"))
+
+
+_CHILDREN_FILES: bool | None = None
+
+
+def _children(pid: int) -> List[int]:
+    """Return the direct children of *pid* from its per-thread ``children`` files."""
+    task_dir = os.path.join(PROC, str(pid), "task")
+    try:
+        tasks = os.listdir(task_dir)
+    except OSError:
+        return []
+    found: List[int] = []
+    for tid in tasks:
+        try:
+            with open(os.path.join(task_dir, tid, "children"), "rb") as fh:
+                found.extend(int(v) for v in fh.read().split())
+        except OSError:  # the thread exited
+            continue
+    return found
+
+
+def _scan_children() -> Dict[int, List[int]]:
+    """Map every pid on the host to its children by reading all ``stat`` files."""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir(PROC):
+        if not entry.isdigit():
+            continue
+        stat = _read_stat(int(entry))
+        if stat is not None:
+            children.setdefault(stat[0], []).append(int(entry))
+    return children
+
+
+def descendants(pid: int) -> List[int]:
+    """Return the pids of all live descendants of *pid*.
+
+    The process tree is walked through ``/proc/<pid>/task/*/children``, so
+    only the descendants themselves are read. Kernels built without those
+    files fall back to scanning every process on the host.
+    """
+    global _CHILDREN_FILES
+    if _CHILDREN_FILES is None:
+        _CHILDREN_FILES = _has_children_files()
+    lookup = _children if _CHILDREN_FILES else _scan_children().get
+    found: List[int] = []
+    stack = [pid]
+    while stack:
+        for child in lookup(stack.pop()) or ():
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+def tree_usage(pid: int | None = None, *, children: bool = True) -> Tuple[float, int]:
+    """Return the ``(cpu_seconds, rss_bytes)`` of *pid* and its descendants.
+
+    Threads are part of their process, so thread pools are always included.
+    Without ``/proc`` only the current process is measured, using
+    :func:`os.times` and the lifetime peak ``ru_maxrss``.
+    """
+    pid = os.getpid() if pid is None else pid
+    if not proc_available():
+        times = os.times()
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return sum(times[:4]), usage.ru_maxrss * 1024
+    cpu, rss = 0.0, 0
+    for p in [pid, *(descendants(pid) if children else ())]:
+        stat = _read_stat(p)
+        if stat is not None:
+            cpu += stat[1]
+            rss += stat[2]
+    return cpu, rss
+
+
+def available_memory() -> int | None:
+    """Bytes of memory available to new work (``MemAvailable``), if known."""
+    try:
+        with open(os.path.join(PROC, "meminfo")) as fh:
+            for line in fh:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _reset_peak() -> bool:
+    """Reset the kernel's peak RSS (``VmHWM``) of this process."""
+    try:
+        with open(os.path.join(PROC, "self", "clear_refs"), "w") as fh:
+            fh.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _status_bytes(pid: int | str, field: str) -> int:
+    """Return a ``kB`` field of ``/proc/<pid>/status`` in bytes (0 if unknown)."""
+    try:
+        with open(os.path.join(PROC, str(pid), "status")) as fh:
+            for line in fh:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def _peak_rss() -> int:
+    return _status_bytes("self", "VmHWM")
+
+
+class ResourceSampler:
+    """Sample the CPU utilization and RSS of a process tree in the background.
+
+    A daemon thread reads ``/proc`` every ``interval`` seconds; :meth:`stop`
+    takes a final sample and returns a summary. ``samples`` holds the time
+    series as ``(seconds, cpu_percent, rss_mb)`` tuples, where CPU percent is
+    relative to one core, so a process tree keeping four cores busy reports
+    400.
+
+    When sampling the current process, its kernel peak RSS is reset on
+    :meth:`start` (where permitted) so ``peak_rss_mb`` also catches spikes
+    shorter than the interval.
+
+    ``peak_rss_mb`` is absolute and so includes the interpreter, memory
+    inherited from the parent and attached shared memory. ``rss_increase_mb``
+    is the part the sampled work added: the peak above the RSS at
+    :meth:`start`, not counting shared memory the process mapped meanwhile.
+    """
+
+    def __init__(self, interval: float = 0.1, *, pid: int | None = None, children: bool = True) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.pid = os.getpid() if pid is None else pid
+        self.children = children
+        self.samples: List[Sample] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._peak_reset = False
+        self._t0 = 0.0
+        self._cpu0 = 0.0
+        self._rss0 = 0.0
+        self._shared0 = 0
+        self._last: Tuple[float, float] = (0.0, 0.0)
+
+    def start(self) -> "ResourceSampler":
+        self.samples = []
+        self._stop.clear()
+        self._peak_reset = self.pid == os.getpid() and proc_available() and _reset_peak()
+        self._t0 = time.perf_counter()
+        self._cpu0, rss = tree_usage(self.pid, children=self.children)
+        self._rss0 = rss / 2**20
+        self._shared0 = _status_bytes(self.pid, "RssShmem")
+        self._last = (self._t0, self._cpu0)
+        self.samples.append((0.0, 0.0, self._rss0))
+        self._thread = threading.Thread(target=self._run, name="glassbox-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def sample(self) -> Sample:
+        """Take one sample now and append it to ``samples``."""
+        now = time.perf_counter()
+        cpu, rss = tree_usage(self.pid, children=self.children)
+        with self._lock:
+            last_time, last_cpu = self._last
+            elapsed = now - last_time
+            percent = 100.0 * (cpu - last_cpu) / elapsed if elapsed > 0 else 0.0
+            self._last = (now, cpu)
+            point = (now - self._t0, max(0.0, percent), rss / 2**20)
+            self.samples.append(point)
+        return point
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def stop(self) -> Dict[str, float]:
+        """Stop sampling and return ``cpu_percent``, ``rss_mb``, ``peak_rss_mb`` and ``rss_increase_mb``."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        last = self.sample()
+        elapsed = time.perf_counter() - self._t0
+        cpu = self._last[1] - self._cpu0
+        peak = max(rss for _, _, rss in self.samples)
+        if self._peak_reset:
+            peak = max(peak, _peak_rss() / 2**20)
+        shared = max(0, _status_bytes(self.pid, "RssShmem") - self._shared0) / 2**20
+        return {
+            "cpu_percent": 100.0 * cpu / elapsed if elapsed > 0 else 0.0,
+            "rss_mb": last[2],
+            "peak_rss_mb": peak,
+            "rss_increase_mb": max(0.0, peak - self._rss0 - shared),
+        }
+
+    def __enter__(self) -> "ResourceSampler":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,194 @@
+"""Share training data with worker processes without copying it.
+
+Arrays are copied once into :mod:`multiprocessing.shared_memory` segments by
+the parent and workers receive small picklable handles that attach read-only
+views. Segments are registered with the multiprocessing resource tracker, so
+they are unlinked even if the parent process dies before cleaning up.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Iterator, List, Tuple
+
+import numpy as np
+
+# Segments attached inside the current (worker) process, most recent last.
+_ATTACHED: "OrderedDict[str, shared_memory.SharedMemory]" = OrderedDict()
+_MAX_ATTACHED = 8
+# Thread pool workers share ``_ATTACHED``; a segment must not be closed
+# between looking it up and creating a view onto it.
+_ATTACH_LOCK = threading.Lock()
+
+
+class SharedArray:
+    """Picklable handle to a NumPy array stored in a shared memory segment."""
+
+    def __init__(self, name: str, shape: Tuple[int, ...], dtype: str) -> None:
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def head(self, n: int) -> "SharedArray":
+        """Handle to the first *n* rows of the same segment."""
+        return SharedArray(self.name, (min(n, self.shape[0]),) + tuple(self.shape[1:]), self.dtype)
+
+    def attach(self) -> np.ndarray:
+        """Return a read-only view onto the shared segment."""
+        with _ATTACH_LOCK:
+            shm = _ATTACHED.get(self.name)
+            if shm is None:
+                shm = _ATTACHED[self.name] = shared_memory.SharedMemory(name=self.name)
+            else:
+                _ATTACHED.move_to_end(self.name)
+            # The view keeps the segment's buffer exported, so evicting it
+            # below (or from another thread later) cannot unmap it.
+            array = np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=shm.buf)
+            _release_stale()
+        array.flags.writeable = False
+        return array
+
+
+class SharedFrame:
+    """Handle to a pandas ``DataFrame`` whose columns live in shared memory."""
+
+    def __init__(self, columns: List[Tuple[Any, Any]], index: Any, block: bool) -> None:
+        self.columns = columns
+        self.index = index
+        self.block = block
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def attach(self):
+        import pandas as pd
+
+        if self.block:
+            names, handle = self.columns[0]
+            return pd.DataFrame(handle.attach(), index=self.index, columns=names, copy=False)
+        data = {name: handle.attach() for name, handle in self.columns}
+        return pd.DataFrame(data, index=self.index, copy=False)
+
+
+class SharedSeries:
+    """Handle to a pandas ``Series`` backed by shared memory."""
+
+    def __init__(self, values: SharedArray, index: Any, name: Any) -> None:
+        self.values = values
+        self.index = index
+        self.name = name
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def attach(self):
+        import pandas as pd
+
+        return pd.Series(self.values.attach(), index=self.index, name=self.name, copy=False)
+
+
+def _release_stale() -> None:
+    """Close the least recently used segments beyond ``_MAX_ATTACHED``."""
+    while len(_ATTACHED) > _MAX_ATTACHED:
+        _, shm = _ATTACHED.popitem(last=False)
+        try:
+            shm.close()
+        except BufferError:  # pragma: no cover - a view is still referenced
+            pass
+
+
+def resolve(data: Any) -> Any:
+    """Attach *data* if it is a shared handle, otherwise return it unchanged."""
+    if isinstance(data, (SharedArray, SharedFrame, SharedSeries)):
+        return data.attach()
+    return data
+
+
+class SharedDataset:
+    """Owns the shared memory segments created for one search."""
+
+    def __init__(self) -> None:
+        self._segments: List[shared_memory.SharedMemory] = []
+
+    def _share_array(self, array: np.ndarray) -> SharedArray | np.ndarray:
+        if array.dtype.hasobject or array.nbytes == 0:
+            return array
+        shm = shared_memory.SharedMemory(create=True, size=array.nbytes)
+        self._segments.append(shm)
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+        view[...] = array
+        return SharedArray(shm.name, array.shape, array.dtype.str)
+
+    def share(self, data: Any) -> Any:
+        """Copy *data* into shared memory and return a handle for workers.
+
+        NumPy arrays and pandas frames or series with non-object dtypes are
+        shared. Evaluators return the copy built by their ``shared`` hook;
+        anything else is returned as-is and pickled as usual.
+        """
+        if isinstance(data, np.ndarray):
+            return self._share_array(data)
+        if callable(getattr(data, "shared", None)):
+            return data.shared(self.share)
+        pd = sys.modules.get("pandas")
+        if pd is None:
+            return data
+        if isinstance(data, pd.Series):
+            values = data.to_numpy()
+            shared = self._share_array(values)
+            if not isinstance(shared, SharedArray):
+                return data
+            return SharedSeries(shared, data.index, data.name)
+        if isinstance(data, pd.DataFrame):
+            dtypes = set(data.dtypes)
+            if len(dtypes) == 1:
+                shared = self._share_array(data.to_numpy())
+                if not isinstance(shared, SharedArray):
+                    return data
+                return SharedFrame([(list(data.columns), shared)], data.index, block=True)
+            columns: List[Tuple[Any, Any]] = []
+            for name in data.columns:
+                shared = self._share_array(data[name].to_numpy())
+                if not isinstance(shared, SharedArray):
+                    return data
+                columns.append((name, shared))
+            return SharedFrame(columns, data.index, block=False)
+        return data
+
+    def close(self) -> None:
+        """Release and unlink every segment created by this dataset."""
+        while self._segments:
+            shm = self._segments.pop()
+            try:
+                shm.close()
+            except BufferError:  # pragma: no cover - parent still holds a view
+                pass
+            try:
+                shm.unlink()
+            except FileNotFoundError:  # pragma: no cover - already unlinked
+                pass
+
+
+@contextmanager
+def shared_dataset(*arrays: Any, enabled: bool = True) -> Iterator[Tuple[Any, ...]]:
+    """Context manager yielding shared handles for *arrays*.
+
+    The segments are unlinked when the block exits, including when a trial
+    raises or a worker process crashes. With ``enabled=False`` the inputs are
+    yielded unchanged.
+    """
+    if not enabled:
+        yield arrays
+        return
+    dataset = SharedDataset()
+    try:
+        yield tuple(dataset.share(a) for a in arrays)
+    finally:
+        dataset.close()
+
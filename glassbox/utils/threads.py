@@ -0,0 +1,178 @@
+"""Share CPU cores between concurrently running trials."""
+from __future__ import annotations
+
+import os
+import queue
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from glassbox.logger import logger
+from glassbox.utils.lazy_imports import optional_import
+
+# Read by OpenMP, the BLAS implementations and numexpr when they load.
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+# Estimator parameters that size an estimator's own thread pool
+# (scikit-learn and the XGBoost/LightGBM wrappers, legacy XGBoost, CatBoost).
+THREAD_PARAMS = ("n_jobs", "nthread", "num_threads", "thread_count")
+
+
+def available_cpus() -> List[int]:
+    """CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def pin_cpus(cpus: Sequence[int] | None) -> Tuple[int, ...] | None:
+    """Restrict the calling thread (and threads it starts) to *cpus*.
+
+    Returns the previous CPU set, or ``None`` if affinity is not supported
+    on this platform or *cpus* is empty.
+    """
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        return None
+    previous = tuple(sorted(os.sched_getaffinity(0)))
+    os.sched_setaffinity(0, cpus)
+    return previous
+
+
+def thread_params(params: Dict[str, Any], threads: int | None) -> Dict[str, Any]:
+    """Thread-count parameters of an estimator, capped at *threads*.
+
+    *params* are the estimator's ``get_params()``. Unset (``None``) and
+    "all cores" (negative) values become *threads*; explicit counts that
+    already fit the budget are kept.
+    """
+    if threads is None:
+        return {}
+    capped = {}
+    for name in THREAD_PARAMS:
+        if name not in params:
+            continue
+        value = params[name]
+        if not isinstance(value, int) or isinstance(value, bool) or value <= 0 or value > threads:
+            capped[name] = threads
+    return capped
+
+
+def _threadpoolctl():
+    try:
+        return optional_import("threadpoolctl")
+    except ImportError:
+        return None
+
+
+@contextmanager
+def limit_threads(threads: int | None, cpus: Sequence[int] | None = None) -> Iterator[None]:
+    """Cap native thread pools at *threads* while the block runs.
+
+    Loaded BLAS/OpenMP pools are limited through ``threadpoolctl`` when it is
+    installed and the ``*_NUM_THREADS`` variables cover libraries loaded
+    later. With *cpus* the calling thread is pinned to them. Everything is
+    restored on exit.
+    """
+    if threads is None and not cpus:
+        yield
+        return
+    saved_env = {var: os.environ.get(var) for var in THREAD_ENV_VARS} if threads is not None else {}
+    for var in saved_env:
+        os.environ[var] = str(threads)
+    threadpoolctl = _threadpoolctl() if threads is not None else None
+    limiter = threadpoolctl.threadpool_limits(limits=threads) if threadpoolctl is not None else None
+    previous = pin_cpus(cpus)
+    try:
+        yield
+    finally:
+        if previous is not None:
+            pin_cpus(previous)
+        if limiter is not None:
+            limiter.restore_original_limits()
+        for var, value in saved_env.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+def init_worker(threads: int | None, cpu_sets: Any = None) -> None:
+    """Executor initializer: cap thread pools and pin the worker for good.
+
+    *cpu_sets* is a queue holding one CPU set per worker; each worker takes
+    the next one.
+    """
+    if threads is not None:
+        for var in THREAD_ENV_VARS:
+            os.environ[var] = str(threads)
+        threadpoolctl = _threadpoolctl()
+        if threadpoolctl is not None:
+            threadpoolctl.threadpool_limits(limits=threads)
+    if cpu_sets is not None:
+        try:
+            pin_cpus(cpu_sets.get(timeout=5.0))
+        except queue.Empty:
+            pass
+
+
+class CoreBudget:
+    """Split a budget of CPU cores between the trials that run at once.
+
+    With ``n`` concurrent trials every trial gets ``cores // n`` threads:
+    its BLAS/OpenMP pools are capped at that many threads and estimator
+    parameters such as ``n_jobs``, ``nthread`` or ``num_threads`` are set to
+    it (see :data:`THREAD_PARAMS`). With ``pin=True`` each worker is also
+    bound to its own, disjoint set of CPUs.
+
+    Parameters
+    ----------
+    cores:
+        Number of cores, or the CPU ids to use. Defaults to every CPU this
+        process may run on.
+    pin:
+        Bind each worker to a disjoint slice of the CPUs (Linux only).
+    """
+
+    def __init__(self, cores: int | Sequence[int] | None = None, *, pin: bool = False) -> None:
+        available = available_cpus()
+        if cores is None:
+            self.cpus = available
+            self.n_cores = len(available)
+        elif isinstance(cores, int):
+            if cores < 1:
+                logger.log("cores must be at least 1", level="error")
+                raise ValueError("cores must be at least 1")
+            self.cpus = available[:cores]
+            self.n_cores = cores
+        else:
+            self.cpus = sorted(set(cores))
+            unknown = set(self.cpus) - set(available)
+            if not self.cpus or unknown:
+                logger.log(f"CPUs not available to this process: {sorted(unknown)}", level="error")
+                raise ValueError(f"CPUs not available to this process: {sorted(unknown)}")
+            self.n_cores = len(self.cpus)
+        self.pin = pin
+
+    def threads_per_trial(self, n_workers: int) -> int:
+        """Threads each of *n_workers* concurrent trials may use."""
+        return max(1, self.n_cores // max(1, n_workers))
+
+    def cpu_sets(self, n_workers: int) -> List[Tuple[int, ...]]:
+        """Disjoint CPU sets, one per worker.
+
+        With more workers than CPUs the sets wrap around and are shared.
+        """
+        size = max(1, len(self.cpus) // max(1, n_workers))
+        if n_workers > len(self.cpus):
+            logger.log(
+                f"{n_workers} workers share {len(self.cpus)} CPUs; pinned sets overlap", level="warning"
+            )
+        return [
+            tuple(self.cpus[(i * size + j) % len(self.cpus)] for j in range(size)) for i in range(n_workers)
+        ]
@@ -0,0 +1,162 @@
+import os
+import signal
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.datasets import load_iris
+from sklearn.tree import DecisionTreeClassifier
+
+from glassbox import ModelSearch
+from glassbox.core.admission import MemoryAdmission
+from glassbox.core.evaluator import SklearnEvaluator
+from glassbox.core.search import Search
+from glassbox.schemas import Evaluator
+
+X, y = load_iris(return_X_y=True)
+
+
+class Hog(BaseEstimator, ClassifierMixin):
+    """Pretends to need ``mb`` MB; records when it ran.
+
+    A ``fragile`` hog runs out of memory when another one runs at the same time.
+    """
+
+    events = []
+    running = 0
+    lock = threading.Lock()
+
+    def __init__(self, mb=10, fragile=False):
+        self.mb = mb
+        self.fragile = fragile
+
+    def fit(self, X, y):
+        with Hog.lock:
+            Hog.running += 1
+        start = time.perf_counter()
+        time.sleep(0.1)
+        with Hog.lock:
+            crowded = Hog.running > 1
+            Hog.running -= 1
+        Hog.events.append((self.mb, start, time.perf_counter()))
+        if self.mb >= 999 or (self.fragile and crowded):
+            raise MemoryError("simulated")
+        return self
+
+    def score(self, X, y):
+        return self.mb / 100
+
+
+class PeakEvaluator(Evaluator):
+    """Reports the estimator's nominal size as its peak memory."""
+
+    def evaluate(self, model, X, y):
+        return model.score(X, y)
+
+    def evaluate_metrics(self, model, X, y):
+        return {"score": model.score(X, y), "rss_increase_mb": float(model.mb)}
+
+
+class Killer(DecisionTreeClassifier):
+    """Kills its worker on the first depth-2 fit, like the OOM killer would."""
+
+    def __init__(self, max_depth=None, marker=""):
+        super().__init__(max_depth=max_depth, random_state=0)
+        self.marker = marker
+
+    def fit(self, X, y, **kwargs):
+        if self.max_depth == 2 and not Path(self.marker).exists():
+            Path(self.marker).touch()
+            os.kill(os.getpid(), signal.SIGKILL)
+        time.sleep(0.05)
+        return super().fit(X, y, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def _reset_hog():
+    Hog.events = []
+    Hog.running = 0
+
+
+def _max_overlap(events):
+    edges = sorted([(start, 1) for _, start, _ in events] + [(end, -1) for _, _, end in events])
+    running = peak = 0
+    for _, step in edges:
+        running += step
+        peak = max(peak, running)
+    return peak
+
+
+def test_estimates_come_from_similar_trials():
+    admission = MemoryAdmission(1000, neighbours=1, margin=1.0)
+    assert admission.estimate([{"n": 5}]) == 1000
+    admission.observe({"n": 10, "kind": "a"}, 100)
+    admission.observe({"n": 1000, "kind": "a"}, 900)
+    assert admission.estimate([{"n": 900, "kind": "a"}]) == 900
+    assert admission.estimate([{"n": 20, "kind": "a"}, {"n": 800, "kind": "a"}]) == 900
+    assert admission.admits(400, 500) and not admission.admits(600, 500)
+    admission.observe({"n": 10, "kind": "a"}, 50)
+    assert len(admission._observed) == 2
+    assert admission.estimate([{"n": 10, "kind": "a"}]) == 100
+    bounded = MemoryAdmission(1000, history=2)
+    for n in range(5):
+        bounded.observe({"n": n}, n)
+    assert [params["n"] for params, _ in bounded._observed.values()] == [3, 4]
+    with pytest.raises(ValueError):
+        MemoryAdmission(0)
+
+
+def test_heavy_trials_run_alone():
+    s = Search(
+        "grid",
+        {"mb": [60, 60, 60, 10, 10, 10, 10, 10]},
+        n_jobs=4,
+        backend="thread",
+        memory_limit=100,
+    )
+    results = s.run(Hog(), X, y, PeakEvaluator())
+    assert len(results) == 8
+    assert _max_overlap([e for e in Hog.events if e[0] == 60]) == 1
+    assert _max_overlap([e for e in Hog.events if e[0] == 10]) > 1
+
+
+def test_out_of_memory_trials_are_retried_alone():
+    s = Search("grid", {"mb": [10, 20, 30, 40, 999]}, n_jobs=3, backend="thread", memory_limit=10**6)
+    results = s.run(Hog(fragile=True), X, y, PeakEvaluator())
+    # The 999 MB trial fails alone too and is skipped; the others succeed.
+    assert sorted(r.params["mb"] for r in results) == [10, 20, 30, 40]
+    assert all(r.state == "complete" for r in results)
+
+
+def test_out_of_memory_fails_without_admission():
+    s = Search("grid", {"mb": [999]})
+    with pytest.raises(MemoryError):
+        s.run(Hog(), X, y, PeakEvaluator())
+
+
+def test_killed_worker_is_retried_in_a_new_pool(tmp_path):
+    ms = ModelSearch(
+        Killer(marker=str(tmp_path / "killed")),
+        Search("grid", {"max_depth": [1, 2, 3]}, n_jobs=2),
+        SklearnEvaluator(),
+        show_progress=False,
+        memory_limit=10**6,
+    )
+    ms.search(X, y)
+    assert (tmp_path / "killed").exists()
+    assert sorted(r.params["max_depth"] for r in ms.results) == [1, 2, 3]
+
+
+def test_model_search_fails_when_every_trial_is_skipped():
+    ms = ModelSearch(
+        Hog(),
+        Search("grid", {"mb": [999, 1999]}),
+        PeakEvaluator(),
+        show_progress=False,
+        memory_limit=10**6,
+        verbose=True,
+    )
+    with pytest.raises(RuntimeError, match="No trial completed"):
+        ms.search(X, y)
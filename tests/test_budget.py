@@ -0,0 +1,125 @@
+import time
+from contextlib import contextmanager
+
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import SGDClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from glassbox import ModelSearch
+from glassbox.core.budget import SearchBudget
+from glassbox.core.evaluator import SklearnEvaluator
+from glassbox.core.pruning import PercentilePruner
+from glassbox.core.search import Search
+from glassbox.core.space import Uniform
+
+X, y = load_iris(return_X_y=True)
+EVALUATOR = SklearnEvaluator()
+
+
+class SlowTree(DecisionTreeClassifier):
+    def fit(self, X, y, **kwargs):
+        time.sleep(0.2)
+        return super().fit(X, y, **kwargs)
+
+
+class SlowForest(RandomForestClassifier):
+    def fit(self, X, y, **kwargs):
+        time.sleep(0.2)
+        return super().fit(X, y, **kwargs)
+
+
+class SlowSGD(SGDClassifier):
+    def fit(self, X, y, **kwargs):
+        time.sleep(0.05)
+        return super().fit(X, y, **kwargs)
+
+
+def test_budget_tracks_target_and_patience():
+    budget = SearchBudget(target_score=0.9, patience=2)
+    budget.start()
+    assert not budget.update(0.5)
+    assert not budget.update(0.4)
+    assert budget.update(0.3) and budget.reason == "patience"
+    budget.start()
+    assert budget.update(0.95) and budget.reason == "target_score"
+    with pytest.raises(ValueError):
+        SearchBudget(timeout=0)
+
+
+def test_target_score_stops_grid_search():
+    s = Search("grid", {"max_depth": list(range(1, 21))}, target_score=0.95)
+    results = s.run(DecisionTreeClassifier(random_state=0), X, y, EVALUATOR)
+    assert s.stop_reason == "target_score"
+    assert len(results) < 20
+    assert results.best(1)[0].metrics["score"] >= 0.95
+
+
+def test_patience_stops_random_search():
+    # Such large impurity thresholds never split, so every trial scores the same.
+    s = Search("random", {"min_impurity_decrease": Uniform(0.9, 1.0)}, n_trials=10, patience=3)
+    results = s.run(DecisionTreeClassifier(random_state=0), X, y, EVALUATOR)
+    assert s.stop_reason == "patience"
+    assert len(results) == 4
+
+
+def test_timeout_cancels_queued_trials():
+    s = Search("grid", {"max_depth": list(range(1, 21))}, n_jobs=2, backend="thread", timeout=0.5)
+    start = time.perf_counter()
+    results = s.run(SlowTree(random_state=0), X, y, EVALUATOR)
+    assert time.perf_counter() - start < 1.5
+    assert s.stop_reason == "timeout"
+    assert 1 <= len(results) < 20
+    assert all(r.state == "complete" for r in results)
+
+
+def test_timeout_stops_running_trial_at_next_step():
+    s = Search(
+        "grid",
+        {"alpha": [1e-4, 1e-3]},
+        pruner=PercentilePruner(100.0),
+        pruning_steps=20,
+        timeout=0.3,
+    )
+    results = s.run(SlowSGD(max_iter=20, tol=None, random_state=0), X, y, EVALUATOR)
+    (result,) = results
+    assert result.state == "cancelled"
+    assert 1 <= len(result.intermediate) < 20
+
+
+def test_timeout_skips_rest_of_warm_start_chain(monkeypatch):
+    advanced = []
+
+    @contextmanager
+    def progress(self, total, show_progress, spinner=False):
+        yield lambda: advanced.append(1)
+
+    monkeypatch.setattr(Search, "_progress", progress)
+    s = Search("grid", {"n_estimators": [1, 2, 3, 4, 5, 6]}, warm_start=True, timeout=0.3)
+    results = s.run(SlowForest(random_state=0), X, y, EVALUATOR)
+    assert s.stop_reason == "timeout"
+    assert 1 <= len(results) < 6
+    assert all(r.state == "complete" for r in results)
+    # Skipped links still advance the progress bar.
+    assert len(advanced) == 6
+
+
+def test_model_search_returns_best_so_far():
+    ms = ModelSearch(
+        SlowTree(random_state=0),
+        Search("grid", {"max_depth": list(range(1, 21))}),
+        EVALUATOR,
+        show_progress=False,
+        timeout=0.3,
+    )
+    model = ms.search(X, y)
+    assert ms.searcher.stop_reason == "timeout"
+    assert model.max_depth == ms.results.best(1)[0].params["max_depth"]
+
+
+def test_optuna_target_score():
+    pytest.importorskip("optuna")
+    s = Search("optuna", {"max_depth": list(range(1, 10))}, n_trials=30, target_score=0.9)
+    results = s.run(DecisionTreeClassifier(random_state=0), X, y, EVALUATOR)
+    assert s.stop_reason == "target_score" and len(results) < 30
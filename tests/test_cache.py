@@ -0,0 +1,103 @@
+import os
+import time
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from sklearn.datasets import load_iris
+
+from glassbox import ModelSearch
+from glassbox.core.cache import TrialCache, fingerprint
+from glassbox.core.evaluator import SklearnEvaluator
+from glassbox.core.model_store import ModelStore
+from glassbox.core.search import Search
+
+X, y = load_iris(return_X_y=True)
+EVALUATOR = SklearnEvaluator()
+
+FITS = []
+
+
+class CountingLR(LogisticRegression):
+    def fit(self, X, y, sample_weight=None):
+        FITS.append(len(X))
+        return super().fit(X, y, sample_weight)
+
+
+def test_fingerprint_depends_on_content():
+    a = np.arange(10.0)
+    assert fingerprint(a) == fingerprint(a.copy())
+    assert fingerprint(a) != fingerprint(a + 1)
+    assert fingerprint(a) != fingerprint(a.astype(np.float32))
+
+
+def test_repeated_search_hits_cache(tmp_path):
+    FITS.clear()
+    cache = TrialCache(tmp_path)
+    space = {"C": [0.1, 1.0]}
+    first = Search("grid", space, cache=cache).run(CountingLR(max_iter=50), X, y, EVALUATOR)
+    assert len(FITS) == 2
+    second = Search("grid", {"C": [0.1, 1.0, 10.0]}, cache=cache).run(
+        CountingLR(max_iter=50), X, y, EVALUATOR
+    )
+    assert len(FITS) == 3
+    assert cache.hits == 2
+    assert [r.metrics for r in second[:2]] == [r.metrics for r in first]
+
+
+def test_cache_returns_fitted_model(tmp_path):
+    FITS.clear()
+    cache = TrialCache(tmp_path, store_models=True)
+    ms = ModelSearch(
+        CountingLR(max_iter=50),
+        Search("grid", {"C": [0.1, 1.0]}),
+        SklearnEvaluator(),
+        cache=cache,
+        model_store=ModelStore(max_bytes=1),  # too small, so the best model comes from the cache
+        verbose=True,
+        show_progress=False,
+    )
+    hashed = []
+    data_key = cache.data_key
+    cache.data_key = lambda *args: hashed.append(1) or data_key(*args)
+    model = ms.search(X, y)
+    assert len(FITS) == 2  # no final refit
+    assert len(hashed) == 1  # the data is fingerprinted once per search
+    assert model.score(X, y) > 0
+
+
+def test_eviction_by_size_and_age(tmp_path):
+    cache = TrialCache(tmp_path, max_bytes=150)
+    for i in range(5):
+        cache.put(f"{i:02d}" * 32, {"score": float(i)}, 0.1)
+    assert cache.evict() > 0
+    assert cache.get("04" * 32) is not None
+    assert cache.get("00" * 32) is None
+
+    aged = TrialCache(tmp_path / "aged", max_age=60)
+    aged.put("ab" * 32, {"score": 1.0}, 0.1)
+    path = aged._path("ab" * 32, ".json")
+    old = time.time() - 120
+    os.utime(path, (old, old))
+    assert aged.get("ab" * 32) is None
+    assert aged.evict() == 1
+    assert not path.exists()
+
+
+def _write_entries(directory, worker):
+    cache = TrialCache(directory, max_bytes=10_000)
+    for i in range(20):
+        cache.put(f"{i % 4:02d}" * 32, {"score": float(worker)}, 0.1)
+        cache.evict()
+    return True
+
+
+def test_concurrent_writers_leave_valid_entries(tmp_path):
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=3) as pool:
+        assert all(pool.map(_write_entries, [tmp_path] * 3, range(3)))
+    cache = TrialCache(tmp_path)
+    for i in range(4):
+        metrics, _ = cache.get(f"{i:02d}" * 32)
+        assert metrics["score"] in (0.0, 1.0, 2.0)
+    assert not list(tmp_path.glob("*/.tmp-*"))
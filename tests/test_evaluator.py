@@ -11,3 +11,68 @@ def test_evaluate_returns_float():
     score = evaluator.evaluate(model, X, y)
     assert isinstance(score, float)
     assert 0 <= score <= 1
+
+
+def test_cross_validation_evaluator_reports_folds():
+    from glassbox.core.evaluator import CrossValidationEvaluator
+
+    X, y = load_iris(return_X_y=True)
+    evaluator = CrossValidationEvaluator(cv=3, n_jobs=2)
+    evaluator.prepare(X, y)
+    splits = evaluator.splits(X, y)
+    metrics = evaluator.evaluate_metrics(LogisticRegression(max_iter=200), X, y)
+    assert evaluator.splits(X, y) is splits
+    assert {"score", "score_std", "fit_time"} <= set(metrics)
+    fold_scores = [metrics[f"fold_{i}_score"] for i in range(3)]
+    assert metrics["score"] == sum(fold_scores) / 3
+    assert all(metrics[f"fold_{i}_fit_time"] >= 0 for i in range(3))
+
+
+def test_cross_validation_evaluator_skips_full_fit():
+    from glassbox.core.evaluator import CrossValidationEvaluator
+    from glassbox.core.search import Search
+
+    fits = []
+
+    class CountingLR(LogisticRegression):
+        def fit(self, X, y, sample_weight=None):
+            fits.append(len(X))
+            return super().fit(X, y, sample_weight)
+
+    X, y = load_iris(return_X_y=True)
+    results = Search("grid", {"C": [0.1, 1.0]}).run(
+        CountingLR(max_iter=200), X, y, CrossValidationEvaluator(cv=5)
+    )
+    assert len(fits) == 10
+    assert max(fits) < len(X)
+    assert "fold_4_score" in results[0].metrics
+
+
+def test_cross_validation_folds_are_pickled_compactly():
+    import pickle
+
+    import numpy as np
+    from sklearn.model_selection import ShuffleSplit
+
+    from glassbox.core.evaluator import CrossValidationEvaluator
+    from glassbox.utils.shared_memory import shared_dataset
+
+    X, y = load_iris(return_X_y=True)
+    for cv, max_bytes in [(5, len(X)), (ShuffleSplit(3, random_state=0), 3 * len(X))]:
+        evaluator = CrossValidationEvaluator(cv=cv)
+        evaluator.prepare(X, y)
+        expected = [list(map(np.sort, s)) for s in evaluator._splitter(y).split(X, y)]
+        splits = evaluator.splits(X, y)
+        assert all((a == c).all() and (b == d).all() for (a, b), (c, d) in zip(splits, expected))
+
+        restored = pickle.loads(pickle.dumps(evaluator))
+        assert restored._splits == {}
+        assert all((a == c).all() for s, t in zip(restored.splits(X, y), splits) for a, c in zip(s, t))
+        assert evaluator._folds[len(X)].nbytes <= max_bytes
+
+        with shared_dataset(evaluator) as (shared,):
+            payload = pickle.dumps(shared)
+            assert len(payload) < 2000
+            worker = pickle.loads(payload)
+            assert all((a == c).all() for s, t in zip(worker.splits(X, y), splits) for a, c in zip(s, t))
+            del worker
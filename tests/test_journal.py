@@ -0,0 +1,88 @@
+import json
+
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.datasets import load_iris
+
+from glassbox.core.evaluator import SklearnEvaluator
+from glassbox.core.journal import TrialJournal
+from glassbox.core.search import Search
+
+X, y = load_iris(return_X_y=True)
+SPACE = {"C": [0.01, 0.1, 1.0, 10.0]}
+
+
+class CrashingEvaluator(SklearnEvaluator):
+    def __init__(self, crash_after):
+        super().__init__()
+        self.calls = 0
+        self.crash_after = crash_after
+
+    def evaluate(self, model, X, y):
+        self.calls += 1
+        if self.calls > self.crash_after:
+            raise RuntimeError("worker died")
+        return super().evaluate(model, X, y)
+
+
+def test_grid_search_resumes_from_journal(tmp_path):
+    path = tmp_path / "trials.jsonl"
+    with pytest.raises(RuntimeError):
+        Search("grid", SPACE, journal=path).run(
+            LogisticRegression(max_iter=50), X, y, CrashingEvaluator(crash_after=2)
+        )
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["trial_id"] for line in lines[1:]] == [1, 2]
+
+    # simulate a torn write at the moment of the crash
+    with path.open("a") as fh:
+        fh.write('{"type": "trial", "trial_')
+
+    evaluator = CrashingEvaluator(crash_after=100)
+    results = Search("grid", SPACE, journal=path, resume=True).run(
+        LogisticRegression(max_iter=50), X, y, evaluator
+    )
+    assert evaluator.calls == 2
+    assert [r.trial_id for r in results] == [1, 2, 3, 4]
+    assert len(TrialJournal(path).load(Search("grid", SPACE, journal=path)._journal_header())) == 4
+
+
+def test_journal_rejects_other_search(tmp_path):
+    path = tmp_path / "trials.jsonl"
+    Search("grid", SPACE, journal=path).run(
+        LogisticRegression(max_iter=50), X, y, SklearnEvaluator()
+    )
+    with pytest.raises(ValueError):
+        Search("grid", {"C": [5.0]}, journal=path, resume=True).run(
+            LogisticRegression(max_iter=50), X, y, SklearnEvaluator()
+        )
+
+
+def test_optuna_study_rebuilt_from_journal(tmp_path):
+    pytest.importorskip("optuna")
+    path = tmp_path / "optuna.jsonl"
+    with pytest.raises(RuntimeError):
+        Search("optuna", SPACE, n_trials=5, journal=path).run(
+            LogisticRegression(max_iter=50), X, y, CrashingEvaluator(crash_after=3)
+        )
+    evaluator = CrashingEvaluator(crash_after=100)
+    results = Search("optuna", SPACE, n_trials=5, journal=path, resume=True).run(
+        LogisticRegression(max_iter=50), X, y, evaluator
+    )
+    assert evaluator.calls == 2
+    assert [r.trial_id for r in results] == [0, 1, 2, 3, 4]
+
+
+def test_unseeded_random_search_resumes_same_sample(tmp_path):
+    path = tmp_path / "random.jsonl"
+    space = {"C": [0.01, 0.03, 0.1, 0.3, 1.0, 3.0, 10.0, 30.0, 100.0, 300.0]}
+    with pytest.raises(RuntimeError):
+        Search("random", space, n_trials=8, journal=path).run(
+            LogisticRegression(max_iter=50), X, y, CrashingEvaluator(crash_after=3)
+        )
+    evaluator = CrashingEvaluator(crash_after=100)
+    results = Search("random", space, n_trials=8, journal=path, resume=True).run(
+        LogisticRegression(max_iter=50), X, y, evaluator
+    )
+    assert evaluator.calls == 5
+    assert len({r.params["C"] for r in results}) == 8
@@ -10,3 +10,76 @@ def test_optional_import_success():
 def test_optional_import_failure():
     with pytest.raises(ImportError):
         optional_import("definitely_missing_module")
+
+
+def _run_python(code):
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    root = Path(__file__).resolve().parents[1]
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+    )
+    return out.stdout.strip()
+
+
+def test_import_glassbox_is_lazy():
+    loaded = _run_python(
+        "import sys, glassbox, glassbox.plugins, glassbox.core\n"
+        "heavy = ('rich', 'pydantic', 'sklearn', 'numpy', 'glassbox.core.model_search')\n"
+        "print(sorted(m for m in heavy if m in sys.modules))"
+    )
+    assert loaded == "[]"
+
+
+def test_lazy_attributes_resolve():
+    import glassbox
+    import glassbox.core
+    import glassbox.plugins
+    from glassbox.core.model_search import ModelSearch
+    from glassbox.plugins.manager import PluginManager
+
+    assert glassbox.ModelSearch is ModelSearch
+    assert glassbox.plugins.PluginManager is PluginManager
+    assert glassbox.core.Search is glassbox.Search
+    assert "ModelSearch" in dir(glassbox)
+    with pytest.raises(AttributeError):
+        glassbox.missing_name
+
+
+def test_rich_only_imported_for_progress_bars():
+    # scikit-learn may import rich itself, so use a dependency-free estimator.
+    loaded = _run_python(
+        "import sys\n"
+        "from glassbox.core import Search\n"
+        "from glassbox.schemas import Evaluator\n"
+        "class Model:\n"
+        "    def __init__(self, c=1.0): self.c = c\n"
+        "    def get_params(self): return {'c': self.c}\n"
+        "    def fit(self, X, y): return self\n"
+        "class Score(Evaluator):\n"
+        "    def evaluate(self, model, X, y): return model.c\n"
+        "Search('grid', {'c': [1.0, 2.0]}).run(Model(), [[0]] * 4, [0] * 4, Score())\n"
+        "print('rich' in sys.modules, 'sklearn' in sys.modules)"
+    )
+    assert loaded.splitlines()[-1] == "False False"
+
+
+def test_import_time_budget():
+    # Cumulative microseconds reported by -X importtime for the top-level package.
+    import re
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    root = Path(__file__).resolve().parents[1]
+    timings = []
+    for _ in range(3):
+        err = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import glassbox"],
+            cwd=root, capture_output=True, text=True, check=True,
+        ).stderr
+        match = re.search(r"\|\s*(\d+) \|\s*glassbox$", err, re.M)
+        timings.append(int(match.group(1)))
+    assert min(timings) < 50_000
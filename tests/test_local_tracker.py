@@ -0,0 +1,91 @@
+import multiprocessing as mp
+import time
+
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.tree import DecisionTreeClassifier
+
+from glassbox import ModelSearch
+from glassbox.core.evaluator import SklearnEvaluator
+from glassbox.core.search import Search
+from glassbox.plugins.base import Plugin
+from glassbox.tracking.local_tracker import LocalTracker
+
+
+def _write_trials(path, worker, n):
+    tracker = LocalTracker(path, run=f"worker-{worker}", batch_size=7, flush_interval=0.01)
+    tracker.start({"worker": worker})
+    for i in range(n):
+        tracker.log(i, {"score": (worker * n + i) / 1000}, params={"max_depth": i % 10}, duration=0.01)
+    tracker.finish()
+
+
+def test_local_tracker_batches_and_queries(tmp_path):
+    tracker = LocalTracker(tmp_path / "trials.db", batch_size=16, flush_interval=0.01)
+    tracker.start({"strategy": "random"})
+    for i in range(100):
+        tracker.log(i, {"score": i / 100}, params={"max_depth": i % 10, "criterion": "gini"}, duration=0.1)
+    top = tracker.top(3, where={"max_depth": (">", 5)})
+    assert [r["trial_id"] for r in top] == [99, 98, 97]
+    assert top[0]["params/max_depth"] == 9 and top[0]["duration"] == 0.1
+    assert tracker.count({"max_depth": ("in", [0, 1])}) == 20
+    assert tracker.query({"criterion": "gini"}, order_by="score", ascending=True, k=1)[0]["trial_id"] == 0
+    with pytest.raises(ValueError):
+        tracker.top(where={"missing": 1})
+    with pytest.raises(ValueError):
+        tracker.top(where={"max_depth": ("; DROP", 1)})
+    tracker.finish()
+
+
+def test_local_tracker_concurrent_writers(tmp_path):
+    path = tmp_path / "shared.db"
+    LocalTracker(path)  # create the schema once
+    ctx = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else "spawn")
+    procs = [ctx.Process(target=_write_trials, args=(path, w, 50)) for w in range(3)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(timeout=60)
+        assert p.exitcode == 0
+    reader = LocalTracker(path)
+    assert reader.count() == 150
+    assert reader.count(run="worker-1") == 50
+    assert reader.top(1)[0]["run"] == "worker-2"
+
+
+def test_model_search_local_tracking(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    X, y = load_iris(return_X_y=True)
+    ms = ModelSearch(
+        DecisionTreeClassifier(random_state=0),
+        Search("grid", {"max_depth": [1, 2, 3, 4]}),
+        SklearnEvaluator(),
+        tracking="local",
+        verbose=True,
+        show_progress=False,
+    )
+    ms.search(X, y)
+    rows = LocalTracker(tmp_path / "glassbox.db").top(2, where={"max_depth": (">=", 3)})
+    assert len(rows) == 2
+    assert {r["params/max_depth"] for r in rows} == {3, 4}
+
+
+class SlowPlugin(Plugin):
+    def on_trial_end(self, result) -> None:
+        time.sleep(0.02)
+
+
+def test_async_plugins_deliver_all_trials_to_tracker(tmp_path):
+    X, y = load_iris(return_X_y=True)
+    tracker = LocalTracker(tmp_path / "trials.db")
+    ms = ModelSearch(
+        DecisionTreeClassifier(random_state=0),
+        Search("grid", {"max_depth": list(range(1, 11))}),
+        SklearnEvaluator(),
+        [SlowPlugin()],
+        tracking=tracker,
+        async_plugins=True,
+        show_progress=False,
+    )
+    ms.search(X, y)
+    assert tracker.count() == 10
@@ -15,3 +15,77 @@ def test_logger_respects_verbose_flag(capsys):
     captured = capsys.readouterr()
     assert "hidden" not in captured.out
     assert "oops" in captured.out
+
+
+def test_disabled_messages_are_never_formatted(capsys):
+    logger = GlassboxLogger(use_wandb=False, verbose=False)
+    calls = []
+    logger.log(lambda: calls.append(1) or "lazy")
+    logger.log("%s", type("Boom", (), {"__str__": lambda self: calls.append(2) or "x"})())
+    assert calls == []
+    logger.set_verbose(True)
+    logger.log(lambda: "lazy %d" % 1)
+    logger.log("score=%.2f", 0.5)
+    assert capsys.readouterr().out == "lazy 1\nscore=0.50\n"
+
+
+def test_positional_level_still_works(capsys):
+    logger = GlassboxLogger(use_wandb=False, verbose=False)
+    logger.log("failed", "error")
+    logger.log("hidden", "info", ["console"])
+    logger.log("level %s", "error")
+    logger.set_verbose(True)
+    logger.log("level %s", "error")
+    assert capsys.readouterr().out == "failed\nlevel error\n"
+
+
+def test_level_filtering(capsys):
+    logger = GlassboxLogger(use_wandb=False, level="warning")
+    logger.log("info")
+    logger.log("debug", level="debug")
+    logger.log("careful", level="warning")
+    assert capsys.readouterr().out == "careful\n"
+    assert not logger.enabled("info") and logger.enabled("error")
+
+
+def test_buffered_sinks_batch_and_flush(tmp_path, capsys):
+    from glassbox.logger import FileSink, Sink
+
+    class Recording(Sink):
+        def __init__(self):
+            self.batches = []
+
+        def write(self, records):
+            self.batches.append(records)
+
+    logger = GlassboxLogger(use_wandb=False, buffered=True, flush_interval=60)
+    sink = Recording()
+    logger.add_sink("memory", sink)
+    logger.add_sink("file", FileSink(tmp_path / "search.log"))
+    for i in range(3):
+        logger.log("trial %d", i, to=["memory", "file"])
+    assert sink.batches == []
+    logger.log("failed", level="error", to=["memory"])
+    assert [len(b) for b in sink.batches] == [3, 1]
+    assert (tmp_path / "search.log").read_text() == "INFO trial 0\nINFO trial 1\nINFO trial 2\n"
+    logger.set_buffered(True, flush_interval=0.01)
+    logger.log("later", to=["memory"])
+    import time
+
+    time.sleep(0.2)
+    assert sink.batches[-1] == [("info", "later")]
+    logger.set_buffered(False)
+
+
+def test_wandb_sink_logs_one_call_per_batch(monkeypatch):
+    import sys
+    import types
+
+    calls = []
+    monkeypatch.setitem(sys.modules, "wandb", types.SimpleNamespace(log=calls.append))
+    logger = GlassboxLogger(use_wandb=True, buffered=True, flush_interval=60)
+    logger.log("a", to=["wandb"])
+    logger.log("b", level="warning", to=["wandb"])
+    logger.flush()
+    assert calls == [{"message": "a\nb", "level": "warning"}]
+    logger.set_buffered(False)
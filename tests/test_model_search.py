@@ -7,6 +7,8 @@ from glassbox import ModelSearch
 from glassbox.core.search import Search
 from glassbox.core.evaluator import SklearnEvaluator
 from glassbox.core import model_search as ms_module
+from glassbox.core.model_store import ModelStore
+from glassbox.core.parallel import KeepModel, fit_and_score
 
 SEARCH_SPACE = {"C": [0.1, 1.0]}
 
@@ -55,3 +57,158 @@ def test_model_search_gpu_guard(monkeypatch, capsys):
     assert "GPU requested but none detected" in out
     from glassbox.logger import logger as global_logger
     global_logger.set_verbose(True)
+
+
+def test_model_search_passes_n_jobs_to_search():
+    X, y = load_iris(return_X_y=True)
+    search = Search("grid", SEARCH_SPACE)
+    ms = ModelSearch(
+        LogisticRegression(max_iter=50),
+        search,
+        SklearnEvaluator(),
+        n_jobs=2,
+        verbose=True,
+        show_progress=False,
+    )
+    assert ms.search(X, y).score(X, y) >= 0
+    assert search.n_jobs == 1  # only applied while searching
+
+
+def test_model_search_halving_picks_full_budget_trial(monkeypatch):
+    X, y = load_iris(return_X_y=True)
+    search = Search("halving", {"C": [0.1, 1.0, 10.0]}, n_trials=3)
+    ms = ModelSearch(
+        LogisticRegression(max_iter=50),
+        search,
+        SklearnEvaluator(),
+        verbose=True,
+        show_progress=False,
+    )
+    messages = []
+    monkeypatch.setattr(ms_module.logger, "log", lambda msg, *args, **kw: messages.append(msg % args))
+    ms.search(X, y)
+    # 3 configs on 1/9 of the rows, then the single survivor on 1/3 and all rows
+    assert any("Best trial 5 " in m for m in messages)
+
+
+class CountingRegression(LogisticRegression):
+    fits = 0
+
+    def fit(self, X, y, sample_weight=None):
+        CountingRegression.fits += 1
+        return super().fit(X, y, sample_weight)
+
+
+def test_model_search_returns_stored_model_without_refit():
+    X, y = load_iris(return_X_y=True)
+    CountingRegression.fits = 0
+    ms = ModelSearch(
+        CountingRegression(max_iter=50),
+        Search("grid", {"C": [0.1, 1.0, 10.0]}),
+        SklearnEvaluator(),
+        verbose=True,
+        show_progress=False,
+    )
+    model = ms.search(X, y)
+    assert CountingRegression.fits == 3
+    assert hasattr(model, "coef_")
+
+
+def test_model_search_overlaps_refit_with_teardown():
+    import threading
+
+    X, y = load_iris(return_X_y=True)
+    CountingRegression.fits = 0
+    fit_started = threading.Event()
+    seen = []
+
+    class Teardown(ms_module.Plugin):
+        def on_training_end(self):
+            seen.append(fit_started.wait(timeout=5))
+
+    class Signalling(CountingRegression):
+        def fit(self, X, y, sample_weight=None):
+            if threading.current_thread() is not threading.main_thread():
+                fit_started.set()
+            return super().fit(X, y, sample_weight)
+
+    ms = ModelSearch(
+        Signalling(max_iter=50),
+        Search("grid", {"C": [0.1, 1.0]}),
+        SklearnEvaluator(),
+        plugins=[Teardown()],
+        verbose=True,
+        show_progress=False,
+        model_store=ModelStore(k=1, max_bytes=1),
+    )
+    model = ms.search(X, y)
+    # The store rejected every model, so the winner was refitted once.
+    assert CountingRegression.fits == 3
+    assert hasattr(model, "coef_")
+    assert seen == [True]
+
+
+def test_model_store_keeps_top_k(tmp_path):
+    for store in (ModelStore(k=2), ModelStore(k=2, directory=tmp_path)):
+        assert store.offer(1, 0.5, {"id": 1})
+        assert store.offer(2, 0.9, {"id": 2})
+        assert store.offer(3, 0.7, {"id": 3})
+        assert not store.offer(4, 0.1, {"id": 4})
+        assert store.get(1) is None
+        assert store.get(2) == {"id": 2} and store.get(3) == {"id": 3}
+        assert len(store) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["trial-2.pkl", "trial-3.pkl"]
+    small = ModelStore(max_bytes=10)
+    assert not small.offer(1, 1.0, list(range(100)))
+
+
+def test_workers_only_return_models_the_store_keeps():
+    X, y = load_iris(return_X_y=True)
+    model, evaluator = LogisticRegression(max_iter=50), SklearnEvaluator()
+    assert fit_and_score(model, {}, X, y, evaluator, keep_model=KeepModel()).model is not None
+    assert fit_and_score(model, {}, X, y, evaluator).model is None
+    assert fit_and_score(model, {}, X, y, evaluator, keep_model=KeepModel(2.0)).model is None
+    assert fit_and_score(model, {}, X, y, evaluator, keep_model=KeepModel(max_bytes=1)).model is None
+    store = ModelStore(k=1)
+    assert store.threshold() == float("-inf")
+    store.offer(1, 0.8, object())
+    assert store.threshold() == 0.8
+
+
+def test_model_search_leaves_search_store_untouched():
+    X, y = load_iris(return_X_y=True)
+    search = Search("grid", {"C": [0.1, 1.0]})
+    ms = ModelSearch(
+        LogisticRegression(max_iter=50), search, SklearnEvaluator(), verbose=True, show_progress=False
+    )
+    model = ms.search(X, y)
+    assert search.model_store is None
+    assert ms.model_store.get(ms.results.best(1)[0].trial_id) is model
+
+
+def test_model_search_options_only_apply_during_search(tmp_path):
+    X, y = load_iris(return_X_y=True)
+    search = Search("grid", {"C": [0.1, 1.0]})
+    before = dict(vars(search))
+    ms = ModelSearch(
+        LogisticRegression(max_iter=50),
+        search,
+        SklearnEvaluator(),
+        verbose=True,
+        show_progress=False,
+        n_jobs=2,
+        journal=tmp_path / "trials.jsonl",
+        timeout=60,
+        cores=2,
+        memory_limit=10**6,
+    )
+    assert vars(search) == before
+    seen = {}
+    ms.plugin_manager.register(
+        type("Spy", (ms_module.Plugin,), {"on_training_start": lambda self: seen.update(n_jobs=search.n_jobs)})()
+    )
+    ms.search(X, y)
+    assert seen == {"n_jobs": 2}
+    assert (tmp_path / "trials.jsonl").exists()
+    for name in ("n_jobs", "journal", "budget", "cores", "memory_limit", "model_store"):
+        assert getattr(search, name) is before[name]
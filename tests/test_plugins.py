@@ -1,3 +1,5 @@
+import time
+
 from glassbox.plugins.base import Plugin
 from glassbox.plugins.manager import PluginManager
 from glassbox.plugins import knocknotifier
@@ -41,3 +43,139 @@ def test_resource_monitor_logs_memory(capsys):
     s.run(model, X, y, evaluator, show_progress=False, plugin_manager=pm)
     out = capsys.readouterr().out
     assert "memory" in out.lower()
+
+
+def test_resource_monitor_samples_search_and_trials():
+    from glassbox import ModelSearch
+
+    X, y = load_iris(return_X_y=True)
+    monitor = ResourceMonitor(interval=0.01)
+    search = Search("grid", {"C": [0.1, 1.0, 10.0]})
+    ms = ModelSearch(LogisticRegression(max_iter=50), search, SklearnEvaluator(), plugins=[monitor], show_progress=False)
+    ms.search(X, y)
+    assert search.resource_interval is None  # only set while searching
+    assert [t["trial_id"] for t in monitor.trials] == [1, 2, 3]
+    assert len(monitor.samples) >= 2
+    summary = monitor.summary()
+    assert summary["peak_rss_mb"] > 0 and summary["max_trial_peak_rss_mb"] > 0
+    assert monitor.safe_concurrency(memory_mb=summary["max_trial_peak_rss_mb"] * 10) == 8
+
+
+class Recorder(Plugin):
+    def __init__(self, delay=0.0):
+        import threading
+
+        self.delay = delay
+        self.gate = threading.Event()
+        self.gate.set()
+        self.epochs = []
+        self.batches = []
+        self.ended = False
+
+    def on_epoch_end(self, metrics):
+        self.gate.wait()
+        time.sleep(self.delay)
+        self.epochs.append(metrics["score"])
+
+    def on_training_end(self):
+        self.ended = True
+
+
+def test_async_dispatch_does_not_block_and_flushes():
+    slow = Recorder(delay=0.05)
+    pm = PluginManager(async_dispatch=True)
+    pm.register(slow)
+    start = time.perf_counter()
+    for i in range(5):
+        pm.trigger("on_epoch_end", metrics={"score": i})
+    assert time.perf_counter() - start < 0.05
+    pm.trigger("on_training_end")
+    assert slow.epochs == [0, 1, 2, 3, 4]
+    assert slow.ended
+    pm.close()
+
+
+def test_async_dispatch_batches_epoch_events():
+    class Batched(Recorder):
+        def on_epoch_end_batch(self, metrics):
+            self.batches.append([m["score"] for m in metrics])
+
+    plugin = Batched()
+    pm = PluginManager(async_dispatch=True)
+    pm.register(plugin)
+    plugin.gate.clear()
+    pm.trigger("on_epoch_end", metrics={"score": 0})
+    time.sleep(0.05)  # delivered alone, then blocks on the gate
+    for i in range(1, 5):
+        pm.trigger("on_epoch_end", metrics={"score": i})
+    plugin.gate.set()
+    pm.flush()
+    assert plugin.epochs == [0]
+    assert plugin.batches == [[1, 2, 3, 4]]
+    pm.close()
+
+
+def test_backpressure_policies():
+    for policy, expected in (("drop", [0, 1]), ("coalesce", [0, 3])):
+        plugin = Recorder()
+        plugin.gate.clear()
+        pm = PluginManager(async_dispatch=True, max_queue=1, batch_size=1, policy=policy)
+        pm.register(plugin)
+        pm.trigger("on_epoch_end", metrics={"score": 0})
+        time.sleep(0.05)  # the worker is now stuck delivering event 0
+        for i in range(1, 4):
+            pm.trigger("on_epoch_end", metrics={"score": i})
+        assert pm.dropped == 2
+        plugin.gate.set()
+        pm.flush()
+        assert plugin.epochs == expected
+        pm.close()
+
+
+def test_async_dispatch_times_out_slow_plugins():
+    slow, fast = Recorder(), Recorder()
+    slow.gate.clear()
+    pm = PluginManager(async_dispatch=True)
+    pm.register(slow, timeout=0.05)
+    pm.register(fast)
+    for i in range(3):
+        pm.trigger("on_epoch_end", metrics={"score": i})
+    assert pm.flush(timeout=2)
+    assert fast.epochs == [0, 1, 2]
+    assert pm.dropped == 2  # skipped while the first call is stuck
+    slow.gate.set()
+    pm.close()
+
+
+def test_model_search_closes_async_plugin_manager():
+    import threading
+
+    from glassbox import ModelSearch
+
+    class Failing(Plugin):
+        def on_trial_end(self, result):
+            raise RuntimeError("plugin bug")
+
+    X, y = load_iris(return_X_y=True)
+    ms = ModelSearch(
+        LogisticRegression(max_iter=50),
+        Search("grid", {"C": [0.1, 1.0]}),
+        SklearnEvaluator(),
+        plugins=[Failing()],
+        async_plugins=True,
+        verbose=True,
+        show_progress=False,
+    )
+    ms.search(X, y)
+    assert [str(e) for e in ms.plugin_manager.errors] == ["plugin bug", "plugin bug"]
+    assert not any(t.name == "glassbox-plugins" for t in threading.enumerate())
+
+    stuck = Recorder()
+    stuck.gate.clear()
+    pm = PluginManager(async_dispatch=True)
+    pm.register(stuck, timeout=0.01)
+    pm.trigger("on_epoch_end", metrics={"score": 0})
+    pm.close()
+    hooks = [t for t in threading.enumerate() if t.name == "glassbox-plugin-hook"]
+    assert hooks and all(t.daemon for t in hooks)  # cannot block interpreter exit
+    stuck.gate.set()
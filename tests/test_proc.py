@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.linear_model import LogisticRegression
+
+from glassbox.core.evaluator import SklearnEvaluator
+from glassbox.core.search import Search
+from glassbox.utils.proc import ResourceSampler, descendants, proc_available, tree_usage
+
+pytestmark = pytest.mark.skipif(not proc_available(), reason="requires /proc")
+
+BUSY = "import time\nend = time.time() + 0.6\nwhile time.time() < end: pass\n"
+
+
+def test_tree_usage_includes_child_processes():
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(2)"])
+    try:
+        time.sleep(0.2)
+        assert child.pid in descendants(os.getpid())
+        assert tree_usage()[1] > tree_usage(children=False)[1]
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_sampler_attributes_child_cpu_and_peak_memory():
+    with ResourceSampler(0.05) as sampler:
+        subprocess.run([sys.executable, "-c", BUSY], check=True)
+        block = np.ones(100 * 2**20 // 8)  # 100MB, freed before stop
+        del block
+    usage = sampler.stop()
+    assert usage["cpu_percent"] > 40
+    assert usage["peak_rss_mb"] >= usage["rss_mb"] + 60
+    assert len(sampler.samples) >= 5
+    assert all(s[1] >= 0 for s in sampler.samples)
+
+
+def test_search_reports_per_trial_resources():
+    X, y = load_iris(return_X_y=True)
+    search = Search("grid", {"C": [0.1, 1.0]}, resource_interval=0.01)
+    results = search.run(LogisticRegression(max_iter=50), X, y, SklearnEvaluator())
+    for result in results:
+        assert result.metrics["peak_rss_mb"] >= result.metrics["rss_mb"] > 0
+        assert result.metrics["cpu_percent"] >= 0
+    assert "cpu_percent" not in Search("grid", {"C": [1.0]}).run(
+        LogisticRegression(max_iter=50), X, y, SklearnEvaluator()
+    )[0].metrics
+
+
+def test_rss_increase_leaves_out_shared_memory():
+    from glassbox.utils.shared_memory import resolve, shared_dataset
+
+    with shared_dataset(np.ones(80 * 2**20 // 8)) as (handle,):
+        with ResourceSampler(0.05) as sampler:
+            assert resolve(handle).sum() > 0  # maps all 80MB of shared pages
+            block = np.ones(40 * 2**20 // 8)
+            sampler.sample()
+            del block
+        usage = sampler.stop()
+    assert 30 <= usage["rss_increase_mb"] < 70
+    assert usage["peak_rss_mb"] >= usage["rss_increase_mb"] + 80
+
+
+def test_descendants_walk_children_files(tmp_path, monkeypatch):
+    from glassbox.utils import proc
+
+    for pid, tid, children in [(100, 100, "101 102"), (100, 105, "103"), (101, 101, "104"), (104, 104, "")]:
+        task = tmp_path / str(pid) / "task" / str(tid)
+        task.mkdir(parents=True)
+        (task / "children").write_text(children)
+    (tmp_path / "999").mkdir()  # unrelated processes are never read
+    (tmp_path / "999" / "stat").write_text("garbage")
+    monkeypatch.setattr(proc, "PROC", str(tmp_path))
+    monkeypatch.setattr(proc, "_CHILDREN_FILES", True)
+    assert sorted(descendants(100)) == [101, 102, 103, 104]
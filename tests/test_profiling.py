@@ -0,0 +1,110 @@
+import json
+import pstats
+import time
+
+from sklearn.datasets import load_iris
+from sklearn.linear_model import SGDClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from glassbox.core.evaluator import SklearnEvaluator
+from glassbox.core.profiling import PhaseTimer, TrialProfiler
+from glassbox.core.pruning import MedianPruner
+from glassbox.core.search import Search
+
+X, y = load_iris(return_X_y=True)
+EVALUATOR = SklearnEvaluator()
+PHASE_METRICS = {"construct_time", "fit_time", "evaluate_time", "overhead_time"}
+
+
+class SlowTree(DecisionTreeClassifier):
+    def fit(self, X, y, **kwargs):
+        time.sleep(0.03 * self.max_depth)
+        return super().fit(X, y, **kwargs)
+
+
+def test_phase_timer_accounts_for_unnamed_time():
+    timer = PhaseTimer()
+    time.sleep(0.01)
+    with timer.phase("fit"):
+        time.sleep(0.02)
+    timings = timer.finish()
+    assert timings["fit"] >= 0.02
+    assert timings["offset"] >= 0.01
+    assert timings["overhead"] >= 0.01
+    assert timings["construct"] == timings["evaluate"] == 0.0
+
+
+def test_trials_record_phase_timings():
+    results = Search("grid", {"max_depth": [1, 2]}).run(SlowTree(), X, y, EVALUATOR)
+    for result in results:
+        assert PHASE_METRICS <= set(result.metrics)
+        assert result.metrics["fit_time"] >= 0.02 * result.params["max_depth"]
+        assert abs(result.duration - result.metrics["fit_time"] - result.metrics["evaluate_time"]) < 1e-9
+    assert (results.metric("fit_time") > results.metric("evaluate_time")).all()
+
+
+def test_pruned_trials_split_fit_and_evaluate_time():
+    search = Search(
+        "random",
+        {"alpha": [1e-4, 1e-3, 1e-2]},
+        n_trials=3,
+        seed=0,
+        pruner=MedianPruner(n_startup_trials=1),
+        pruning_steps=3,
+    )
+    for result in search.run(SGDClassifier(random_state=0), X, y, EVALUATOR):
+        assert result.metrics["fit_time"] > 0 and result.metrics["evaluate_time"] > 0
+
+
+def test_profiler_keeps_slowest_trials(tmp_path):
+    profiler = TrialProfiler(top_n=2, memory=True)
+    search = Search("grid", {"max_depth": [1, 2, 3, 4]}, profiler=profiler)
+    search.run(SlowTree(), X, y, EVALUATOR)
+    assert [tid for tid, _ in profiler.slowest()] == [4, 3]
+    assert len(profiler.spans) == 4
+
+    stats = profiler.stats(4)
+    assert isinstance(stats, pstats.Stats)
+    assert any(func[2] == "fit" for func in stats.stats)
+    assert profiler.memory_profile(4)["peak"] >= 0
+
+    written = profiler.dump(tmp_path / "profiles")
+    assert {p.name for p in written} == {
+        "trial-4.prof",
+        "trial-3.prof",
+        "trial-4.memory.json",
+        "trial-3.memory.json",
+    }
+    assert pstats.Stats(str(tmp_path / "profiles" / "trial-4.prof")).total_calls > 0
+
+
+def test_chrome_trace_has_trial_and_phase_events(tmp_path):
+    profiler = TrialProfiler(top_n=1, cpu=False)
+    search = Search("grid", {"max_depth": [1, 2, 3]}, n_jobs=2, backend="thread", profiler=profiler)
+    search.run(SlowTree(), X, y, EVALUATOR)
+    trace = json.loads(profiler.export_chrome_trace(tmp_path / "trace.json").read_text())
+    events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    trials = [e for e in events if e["name"].startswith("trial")]
+    assert len(trials) == 3
+    assert {e["name"] for e in events} >= {"construct", "fit", "evaluate"}
+    assert min(e["ts"] for e in trials) == 0
+    fits = {e["tid"]: e for e in events if e["name"] == "fit"}
+    assert len(fits) >= 1 and all(e["dur"] > 0 for e in fits.values())
+    assert profiler.slowest() == []  # nothing profiled without cpu or memory
+
+
+def test_profiler_handles_concurrent_thread_trials():
+    import tracemalloc
+
+    profiler = TrialProfiler(top_n=6, memory=True)
+    search = Search("grid", {"max_depth": [1, 2, 3, 1, 2, 3]}, n_jobs=3, backend="thread", profiler=profiler)
+    search.run(SlowTree(), X, y, EVALUATOR)
+    assert len(profiler.slowest()) == 6
+    assert all(profiler.memory_profile(tid)["peak"] >= 0 for tid, _ in profiler.slowest())
+    assert not tracemalloc.is_tracing()
+
+    memory_only = TrialProfiler(top_n=6, cpu=False, memory=True)
+    search = Search("grid", {"max_depth": [1, 2, 3, 1, 2, 3]}, n_jobs=3, backend="thread", profiler=memory_only)
+    search.run(SlowTree(), X, y, EVALUATOR)
+    assert len(memory_only.slowest()) == 6
+    assert not tracemalloc.is_tracing()
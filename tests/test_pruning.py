@@ -0,0 +1,130 @@
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import Perceptron, SGDClassifier
+from sklearn.naive_bayes import MultinomialNB
+
+from glassbox.core.evaluator import SklearnEvaluator
+from glassbox.core.pruning import CurveHistory, MedianPruner, PercentilePruner, SuccessiveHalvingPruner
+from glassbox.core.search import Search
+from glassbox.plugins.manager import PluginManager
+
+X, y = load_iris(return_X_y=True)
+
+
+CURVES = [{1: 0.5, 2: 0.6}, {1: 0.7, 2: 0.8}, {1: 0.9}]
+
+
+def _thresholds(pruner, curves=CURVES):
+    return CurveHistory(pruner, curves).thresholds()
+
+
+def test_percentile_pruner_compares_same_step():
+    pruner = MedianPruner(n_startup_trials=2)
+    thresholds = _thresholds(pruner)
+    assert pruner.should_prune(1, 0.6, thresholds) is True
+    assert pruner.should_prune(1, 0.8, thresholds) is False
+    assert pruner.should_prune(3, 0.0, thresholds) is False  # nobody reached step 3
+    percentile = PercentilePruner(90.0, n_startup_trials=2)
+    assert percentile.should_prune(2, 0.65, _thresholds(percentile)) is False
+    startup = MedianPruner(n_startup_trials=5)
+    assert startup.should_prune(1, 0.0, _thresholds(startup)) is False
+
+
+def test_successive_halving_pruner_only_acts_on_rungs():
+    pruner = SuccessiveHalvingPruner(min_steps=1, reduction_factor=2)
+    thresholds = _thresholds(pruner, [{1: 0.9, 2: 0.9}, {1: 0.8, 2: 0.8}, {1: 0.7}])
+    assert pruner.should_prune(1, 0.5, thresholds) is True
+    assert pruner.should_prune(1, 0.85, thresholds) is False
+    assert pruner.should_prune(3, 0.0, thresholds) is False
+    assert pruner.should_prune(2, 0.95, thresholds) is False
+
+
+def test_workers_receive_thresholds_not_curves():
+    import pickle
+
+    history = CurveHistory(MedianPruner(n_startup_trials=1))
+    assert history.thresholds() == {}
+    history.add({1: 0.5, 2: 0.5})
+    assert history.thresholds() == {1: 0.5, 2: 0.5}  # in-process workers see new trials
+    for i in range(2000):
+        history.add({step: i / 2000 for step in range(1, 11)})
+    payload = pickle.dumps(history)
+    assert len(payload) < 1000
+    assert pickle.loads(payload).thresholds() == history.thresholds()
+
+
+def test_partial_fit_trials_are_pruned_with_epoch_hooks():
+    epochs = []
+
+    class Recorder:
+        def on_epoch_end(self, metrics):
+            epochs.append(metrics)
+
+    pm = PluginManager()
+    pm.register(Recorder())
+    s = Search(
+        "grid",
+        {"alpha": [1e-4, 1e-3, 10.0, 100.0], "random_state": [0]},
+        pruner=MedianPruner(n_startup_trials=2, n_warmup_steps=1),
+        pruning_steps=5,
+    )
+    results = s.run(SGDClassifier(max_iter=5, tol=None), X, y, SklearnEvaluator(), plugin_manager=pm)
+    assert all(len(r.intermediate) >= 1 for r in results)
+    assert [r.state for r in results[:2]] == ["complete", "complete"]
+    assert len(results[0].intermediate) == 5
+    assert any(r.state == "pruned" for r in results[2:])
+    assert len(epochs) == sum(len(r.intermediate) for r in results)
+    assert {"step", "trial_id", "score"} <= set(epochs[0])
+
+
+def test_warm_start_estimators_report_growing_ensembles():
+    s = Search("grid", {"n_estimators": [20]}, pruner=MedianPruner(), pruning_steps=4)
+    (result,) = s.run(RandomForestClassifier(random_state=0), X, y, SklearnEvaluator())
+    assert sorted(result.intermediate) == [1, 2, 3, 4]
+    assert result.metrics["steps"] == 4
+
+
+class CountingSGD(SGDClassifier):
+    epochs = 0
+
+    def fit(self, X, y, **kwargs):
+        super().fit(X, y, **kwargs)
+        CountingSGD.epochs += self.n_iter_
+        return self
+
+
+def test_completed_trials_train_as_long_as_a_cold_fit():
+    model = HistGradientBoostingClassifier(max_iter=50, early_stopping=False, random_state=0)
+    s = Search("grid", {"random_state": [0]}, pruner=MedianPruner(), pruning_steps=10)
+    (result,) = s.run(model, X, y, SklearnEvaluator())
+    assert result.state == "complete" and len(result.intermediate) == 10
+    cold = model.__class__(**model.get_params()).fit(X, y)
+    assert result.metrics["score"] == pytest.approx(SklearnEvaluator().evaluate(cold, X, y))
+    CountingSGD.epochs = 0
+    s = Search("grid", {"random_state": [0]}, pruner=MedianPruner(), pruning_steps=10)
+    s.run(CountingSGD(max_iter=30, tol=None), X, y, SklearnEvaluator())
+    assert CountingSGD.epochs == 30
+
+
+def test_converged_fits_stop_early_and_epochs_follow_max_iter():
+    s = Search("grid", {"random_state": [0]}, pruner=MedianPruner(), pruning_steps=10)
+    (result,) = s.run(Perceptron(max_iter=1000), X, y, SklearnEvaluator())
+    assert result.state == "complete" and len(result.intermediate) < 10
+    s = Search("grid", {"alpha": [1.0]}, pruner=MedianPruner(), pruning_steps=10)
+    (result,) = s.run(MultinomialNB(), X, y, SklearnEvaluator())
+    assert sorted(result.intermediate) == list(range(1, 11))
+
+
+def test_optuna_records_pruned_state():
+    optuna = pytest.importorskip("optuna")
+    s = Search(
+        "optuna",
+        {"alpha": [1e-4, 100.0], "random_state": [0]},
+        n_trials=6,
+        pruner=MedianPruner(n_startup_trials=1),
+        pruning_steps=3,
+    )
+    results = s.run(SGDClassifier(), X, y, SklearnEvaluator())
+    assert {r.state for r in results} <= {"complete", "pruned"}
+    assert all(r.intermediate for r in results)
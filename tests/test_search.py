@@ -39,8 +39,153 @@ def test_grid_search_logs_to_console(monkeypatch):
     monkeypatch.setattr(
         search_module.logger,
         "log",
-        lambda msg, level="info", to=None: calls.append(to),
+        lambda msg, *args, level="info", to=None: calls.append(to),
     )
     s = Search("grid", SEARCH_SPACE)
     s.run(MODEL, X, y, EVALUATOR)
     assert calls and calls[0] == ["console"]
+
+
+def test_grid_search_process_pool_preserves_order():
+    s = Search("grid", {"C": [0.1, 1.0, 10.0]}, n_jobs=2)
+    results = s.run(MODEL, X, y, EVALUATOR)
+    assert [r.trial_id for r in results] == [1, 2, 3]
+    assert [r.params["C"] for r in results] == [0.1, 1.0, 10.0]
+
+
+def test_search_uses_injected_executor():
+    from concurrent.futures import ThreadPoolExecutor
+    from glassbox.plugins.manager import PluginManager
+
+    seen = []
+
+    class Recorder:
+        def on_epoch_end(self, metrics):
+            seen.append(metrics["score"])
+
+    pm = PluginManager()
+    pm.register(Recorder())
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        s = Search("random", {"C": [0.01, 0.1, 1.0, 10.0]}, n_trials=4, executor=pool)
+        results = s.run(MODEL, X, y, EVALUATOR, plugin_manager=pm)
+        # injected executors are not shut down by the search
+        assert pool.submit(lambda: 1).result() == 1
+    assert [r.trial_id for r in results] == [1, 2, 3, 4]
+    assert len(seen) == 4
+
+
+def test_optuna_search_thread_backend():
+    pytest.importorskip("optuna")
+    s = Search("optuna", SEARCH_SPACE, n_trials=3, n_jobs=2, backend="thread")
+    results = s.run(MODEL, X, y, EVALUATOR)
+    assert sorted(r.trial_id for r in results) == [0, 1, 2]
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        Search("grid", SEARCH_SPACE, backend="gpu")
+
+
+def test_halving_promotes_top_configurations_on_rows():
+    s = Search("halving", {"C": [0.001 * 2**i for i in range(12)]}, n_trials=9, eta=3, seed=0)
+    results = s.run(MODEL, X, y, EVALUATOR)
+    budgets = [r.budget for r in results]
+    assert budgets == [pytest.approx(1 / 9)] * 9 + [pytest.approx(1 / 3)] * 3 + [1.0]
+    assert [r.trial_id for r in results] == list(range(1, 14))
+
+
+def test_hyperband_uses_budget_param():
+    from sklearn.ensemble import RandomForestClassifier
+
+    s = Search(
+        "hyperband",
+        {"max_depth": [2, 4]},
+        budget_param="n_estimators",
+        min_budget=1,
+        max_budget=9,
+    )
+    results = s.run(RandomForestClassifier(random_state=0), X, y, EVALUATOR)
+    assert all(r.params["n_estimators"] == r.budget for r in results)
+    assert {r.budget for r in results} == {1, 3, 9}
+    assert max(r.budget for r in results) == 9
+
+
+def test_halving_requires_max_budget_for_unknown_param():
+    s = Search("halving", SEARCH_SPACE, budget_param="n_estimators")
+    with pytest.raises(ValueError):
+        s.run(MODEL, X, y, EVALUATOR)
+
+
+def test_ask_tell_grid_and_random():
+    s = Search("grid", {"C": [0.1, 1.0, 10.0]})
+    asked = [s.ask() for _ in range(3)]
+    assert [tid for tid, _ in asked] == [1, 2, 3]
+    assert s.ask() is None
+    s.tell(2, 0.5)
+    s.tell(1, {"score": 0.9}, duration=1.0)
+    with pytest.raises(ValueError):
+        s.tell(1, 0.1)
+    assert [r.trial_id for r in s.told] == [2, 1]
+    assert s.told.best(1)[0].params == {"C": 0.1}
+
+    r = Search("random", {"C": [0.1, 1.0, 10.0]}, n_trials=2, seed=0)
+    first, second = r.ask(), r.ask()
+    assert r.ask() is None and first[1] != second[1]
+    with pytest.raises(ValueError):
+        Search("halving", SEARCH_SPACE).ask()
+
+
+def test_ask_tell_optuna():
+    pytest.importorskip("optuna")
+    s = Search("optuna", {"C": [0.1, 1.0, 10.0]}, n_trials=4)
+    while (trial := s.ask()) is not None:
+        trial_id, params = trial
+        s.tell(trial_id, params["C"], state="pruned" if trial_id == 3 else "complete", intermediate={1: 0.0})
+    assert len(s.told) == 4
+    states = [t.state.name for t in s._optuna_study.trials]
+    assert states == ["COMPLETE", "COMPLETE", "COMPLETE", "PRUNED"]
+
+
+def test_iter_run_streams_and_stops_early():
+    s = Search("grid", {"C": [0.01, 0.1, 1.0, 10.0, 100.0]})
+    seen = []
+    for result in s.iter_run(MODEL, X, y, EVALUATOR):
+        seen.append(result.trial_id)
+        if len(seen) == 2:
+            break
+    assert seen == [1, 2]
+    # In-flight trials finish, but no new ones start after the generator closes.
+    assert len(list(s.iter_run(MODEL, X, y, EVALUATOR))) == 5
+
+
+def test_iter_run_propagates_errors():
+    class Broken(LogisticRegression):
+        def fit(self, X, y):
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        list(Search("grid", SEARCH_SPACE).iter_run(Broken(), X, y, EVALUATOR))
+
+
+def test_async_run_does_not_block_event_loop():
+    import asyncio
+
+    async def main():
+        s = Search("grid", {"C": [0.1, 1.0, 10.0]})
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        ids = [r.trial_id async for r in s.aiter_run(MODEL, X, y, EVALUATOR)]
+        table = await s.arun(MODEL, X, y, EVALUATOR)
+        task.cancel()
+        return ids, table, ticks
+
+    ids, table, ticks = asyncio.run(main())
+    assert ids == [1, 2, 3] and len(table) == 3
+    assert ticks > 3
@@ -0,0 +1,113 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.datasets import load_iris
+
+from glassbox.core.search import Search
+from glassbox.schemas import Evaluator
+from glassbox.utils.shared_memory import SharedArray, resolve, shared_dataset
+
+
+def _checksum(handle):
+    data = resolve(handle)
+    return float(np.asarray(data).sum()), bool(np.asarray(data).flags.writeable)
+
+
+def test_shared_array_round_trip_in_worker():
+    X = np.arange(12, dtype=np.float64).reshape(3, 4)
+    with shared_dataset(X) as (handle,):
+        assert isinstance(handle, SharedArray)
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            total, writeable = pool.submit(_checksum, handle).result()
+        name = handle.name
+    assert total == X.sum()
+    assert writeable is False
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def test_pandas_objects_are_rebuilt():
+    frame = pd.DataFrame({"a": [1.0, 2.0], "b": [3, 4]}, index=["x", "y"])
+    series = pd.Series([0, 1], name="target")
+    with shared_dataset(frame, series) as (frame_handle, series_handle):
+        pd.testing.assert_frame_equal(resolve(frame_handle), frame)
+        pd.testing.assert_series_equal(resolve(series_handle), series)
+
+
+def test_unsupported_data_passes_through():
+    objs = np.array(["a", "b"], dtype=object)
+    with shared_dataset(objs, [1, 2]) as (shared_objs, shared_list):
+        assert shared_objs is objs
+        assert shared_list == [1, 2]
+
+
+def test_concurrent_attach_from_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    arrays = [np.full(4096, i, dtype=np.float64) for i in range(12)]
+    with shared_dataset(*arrays) as handles:
+
+        def read(i):
+            # More segments than stay attached, so threads keep evicting each other's.
+            return float(handles[i % 12].attach()[:2].sum())
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            sums = list(pool.map(read, range(4000)))
+    assert sums == [2.0 * (i % 12) for i in range(4000)]
+
+
+class FailingEvaluator(Evaluator):
+    def evaluate(self, model, X, y):
+        raise RuntimeError("boom")
+
+
+def test_segments_released_when_trial_fails(monkeypatch):
+    created = []
+    real_init = shared_memory.SharedMemory.__init__
+
+    def tracking_init(self, *args, **kwargs):
+        real_init(self, *args, **kwargs)
+        if kwargs.get("create"):
+            created.append(self.name)
+
+    monkeypatch.setattr(shared_memory.SharedMemory, "__init__", tracking_init)
+    X, y = load_iris(return_X_y=True)
+    s = Search("grid", {"C": [0.1, 1.0]}, n_jobs=2)
+    with pytest.raises(RuntimeError):
+        s.run(LogisticRegression(max_iter=50), X, y, FailingEvaluator())
+    assert len(created) == 2
+    for name in created:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+def test_halving_workers_receive_shared_row_order():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from glassbox.core.evaluator import SklearnEvaluator
+
+    class Recording(ThreadPoolExecutor):
+        def __init__(self):
+            super().__init__(max_workers=2)
+            self.rows = []
+
+        def submit(self, fn, *args, **kwargs):
+            self.rows.append(args[5])
+            return super().submit(fn, *args, **kwargs)
+
+    X, y = load_iris(return_X_y=True)
+    executor = Recording()
+    s = Search(
+        "halving", {"C": [0.1, 1.0, 10.0]}, n_trials=3, eta=3, executor=executor, share_data=True, seed=0
+    )
+    results = s.run(LogisticRegression(max_iter=50), X, y, SklearnEvaluator(), show_progress=False)
+    executor.shutdown()
+    assert len(results) == 5
+    subsets = [rows for rows in executor.rows if rows is not None]
+    assert all(isinstance(rows, SharedArray) for rows in subsets)
+    assert [len(rows) for rows in subsets] == [17, 17, 17, 50]
+    assert len({rows.name for rows in subsets}) == 1  # one segment for the whole order
@@ -0,0 +1,114 @@
+import random
+
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.datasets import load_iris
+
+from glassbox.core.evaluator import SklearnEvaluator
+from glassbox.core.search import Search
+from glassbox.core.space import SearchSpace
+
+
+def test_index_matches_product_order():
+    space = SearchSpace({"a": [1, 2, 3], "b": ["x", "y"]})
+    assert len(space) == 6
+    assert [space[i] for i in range(len(space))] == list(space)
+    assert space[-1] == {"a": 3, "b": "y"}
+    with pytest.raises(IndexError):
+        space[6]
+
+
+def test_huge_space_is_not_materialized():
+    space = SearchSpace({f"p{i}": range(100) for i in range(6)})
+    assert len(space) == 100**6
+    assert space[len(space) - 1] == {f"p{i}": 99 for i in range(6)}
+    draws = space.sample_indices(1000, random.Random(0))
+    assert len(set(draws)) == 1000
+    shard = space.shard(3, 1000)
+    assert shard[0] == 3 and shard.step == 1000
+
+
+def test_random_search_is_seeded_and_duplicate_free():
+    X, y = load_iris(return_X_y=True)
+    space = {"C": [0.01, 0.1, 1.0], "fit_intercept": [True, False]}
+    runs = [
+        Search("random", space, n_trials=4, seed=7).run(
+            LogisticRegression(max_iter=50), X, y, SklearnEvaluator()
+        )
+        for _ in range(2)
+    ]
+    params = [[r.params for r in run] for run in runs]
+    assert params[0] == params[1]
+    assert len({tuple(p.items()) for p in params[0]}) == 4
+
+
+def test_random_search_stops_when_space_exhausted():
+    X, y = load_iris(return_X_y=True)
+    results = Search("random", {"C": [0.1, 1.0]}, n_trials=10).run(
+        LogisticRegression(max_iter=50), X, y, SklearnEvaluator()
+    )
+    assert sorted(r.params["C"] for r in results) == [0.1, 1.0]
+
+
+def test_grid_shards_are_disjoint():
+    X, y = load_iris(return_X_y=True)
+    space = {"C": [0.01, 0.1, 1.0, 10.0, 100.0]}
+    shards = [
+        Search("grid", space, shard=(i, 2)).run(
+            LogisticRegression(max_iter=50), X, y, SklearnEvaluator()
+        )
+        for i in range(2)
+    ]
+    ids = [[r.trial_id for r in shard] for shard in shards]
+    assert ids == [[1, 3, 5], [2, 4]]
+
+
+def test_distributions_sample_within_bounds():
+    from glassbox.core.space import IntRange, LogUniform, Uniform
+
+    rng = random.Random(0)
+    logs = [LogUniform(1e-4, 1e2).sample(rng) for _ in range(500)]
+    assert all(1e-4 <= v <= 1e2 for v in logs)
+    # log-uniform puts roughly a third of the mass below 1e-2
+    assert 0.2 < sum(v < 1e-2 for v in logs) / len(logs) < 0.5
+    assert list(IntRange(2, 10, step=4)) == [2, 6, 10]
+    assert list(Uniform(0.0, 1.0, step=0.5)) == [0.0, 0.5, 1.0]
+    assert all(1 <= IntRange(1, 1000, log=True).sample(rng) <= 1000 for _ in range(100))
+
+
+def test_random_search_samples_continuous_dimensions():
+    from glassbox.core.space import LogUniform
+
+    X, y = load_iris(return_X_y=True)
+    results = Search("random", {"C": LogUniform(1e-3, 1e2)}, n_trials=5, seed=0).run(
+        LogisticRegression(max_iter=50), X, y, SklearnEvaluator()
+    )
+    values = [r.params["C"] for r in results]
+    assert len(set(values)) == 5
+    assert all(1e-3 <= v <= 1e2 for v in values)
+
+
+def test_grid_search_enumerates_discrete_distributions_only():
+    from glassbox.core.space import IntRange, Uniform
+
+    space = SearchSpace({"max_iter": IntRange(10, 30, step=10), "C": [1.0]})
+    assert [p["max_iter"] for p in space] == [10, 20, 30]
+    assert SearchSpace({"C": Uniform(0.1, 1.0), "max_iter": [10, 20]}).discrete_keys == ("max_iter",)
+    with pytest.raises(ValueError):
+        Search("grid", {"C": Uniform(0.1, 1.0)})
+
+
+def test_optuna_uses_native_distributions():
+    optuna = pytest.importorskip("optuna")
+    from glassbox.core.space import IntRange, LogUniform
+
+    space = SearchSpace({"C": LogUniform(1e-3, 1e2), "max_iter": IntRange(20, 200, log=True)})
+    dists = space.to_optuna(optuna)
+    assert isinstance(dists["C"], optuna.distributions.FloatDistribution) and dists["C"].log
+    assert isinstance(dists["max_iter"], optuna.distributions.IntDistribution)
+
+    X, y = load_iris(return_X_y=True)
+    results = Search("optuna", space, n_trials=3).run(
+        LogisticRegression(), X, y, SklearnEvaluator()
+    )
+    assert all(isinstance(r.params["max_iter"], int) for r in results)
@@ -0,0 +1,103 @@
+import multiprocessing as mp
+import time
+from pathlib import Path
+
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.tree import DecisionTreeClassifier
+
+from glassbox.core.evaluator import SklearnEvaluator
+from glassbox.core.search import Search
+from glassbox.core.space import Uniform
+from glassbox.core.study import SharedStudy, parse_storage
+
+X, y = load_iris(return_X_y=True)
+CTX = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else "spawn")
+
+
+class SlowTree(DecisionTreeClassifier):
+    def fit(self, X, y, **kwargs):
+        time.sleep(0.01)
+        return super().fit(X, y, **kwargs)
+
+
+def _worker(strategy, space, storage, queue, n_trials=10):
+    search = Search(strategy, space, n_trials=n_trials, storage=storage, study_name="sweep")
+    results = search.run(SlowTree(random_state=0), X, y, SklearnEvaluator())
+    queue.put([(r.trial_id, r.params) for r in results])
+
+
+def _run_workers(strategy, space, storage, n_workers=3, **kwargs):
+    queue = CTX.Queue()
+    procs = [
+        CTX.Process(target=_worker, args=(strategy, space, storage, queue), kwargs=kwargs)
+        for _ in range(n_workers)
+    ]
+    for p in procs:
+        p.start()
+    ran = [queue.get(timeout=120) for _ in procs]
+    for p in procs:
+        p.join(timeout=60)
+        assert p.exitcode == 0
+    return ran
+
+
+def test_parse_storage():
+    assert parse_storage("sqlite:////tmp/a.db") == ("sqlite", Path("/tmp/a.db"))
+    assert parse_storage("sqlite:///a.db") == ("sqlite", Path("a.db"))
+    assert parse_storage("/tmp/a.db") == ("sqlite", Path("/tmp/a.db"))
+    assert parse_storage("journal:///a.log") == ("journal", Path("a.log"))
+    with pytest.raises(ValueError):
+        parse_storage("postgresql://host/db")
+
+
+def test_claims_are_unique_and_released(tmp_path):
+    storage = f"sqlite:///{tmp_path / 'study.db'}"
+    first, second = SharedStudy(storage, "s"), SharedStudy(storage, "s")
+    assert first.open({"strategy": "grid", "seed": 1}, total=3)["seed"] == 1
+    assert second.open({"strategy": "grid", "seed": 2})["seed"] == 1
+    assert [first.claim(), second.claim(), first.claim(), second.claim()] == [1, 2, 3, None]
+    assert first.release() == 2
+    assert second.claim() == 1
+    with pytest.raises(ValueError):
+        SharedStudy(storage, "s").open({"strategy": "random"}, total=3)
+
+
+def test_grid_workers_split_the_sweep(tmp_path):
+    space = {"max_depth": list(range(1, 11)), "min_samples_split": [2, 4, 8]}
+    ran = _run_workers("grid", space, tmp_path / "grid.db")
+    ids = [tid for worker in ran for tid, _ in worker]
+    assert sorted(ids) == list(range(1, 31))
+    assert sum(1 for worker in ran if worker) >= 2
+    table = SharedStudy(tmp_path / "grid.db", "sweep").results()
+    assert table.trial_ids.tolist() == list(range(1, 31))
+    assert table[0].params == {"max_depth": 1, "min_samples_split": 2}
+
+
+def test_random_workers_share_seed_and_configs(tmp_path):
+    space = {"max_depth": list(range(1, 20)), "min_impurity_decrease": Uniform(0.0, 0.1)}
+    ran = _run_workers("random", space, tmp_path / "random.db", n_trials=24)
+    trials = dict(t for worker in ran for t in worker)
+    assert sorted(trials) == list(range(1, 25))
+    # Distinct workers drew the same configuration list from the stored seed.
+    stored = SharedStudy(tmp_path / "random.db", "sweep").results()
+    assert [r.params for r in stored] == [trials[i] for i in range(1, 25)]
+
+
+def test_optuna_workers_share_one_study(tmp_path):
+    optuna = pytest.importorskip("optuna")
+    pytest.importorskip("sqlalchemy")
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    storage = f"sqlite:///{tmp_path / 'optuna.db'}"
+    optuna.create_study(study_name="sweep", storage=storage, direction="maximize")
+    ran = _run_workers("optuna", {"max_depth": list(range(1, 10))}, storage, n_workers=2, n_trials=12)
+    numbers = [tid for worker in ran for tid, _ in worker]
+    assert len(numbers) == len(set(numbers))
+    assert 12 <= len(numbers) <= 13  # workers may each ask once near the limit
+    study = optuna.load_study(study_name="sweep", storage=storage)
+    assert len(study.trials) == len(numbers)
+
+
+def test_shared_storage_rejects_halving(tmp_path):
+    with pytest.raises(ValueError):
+        Search("halving", {"max_depth": [1, 2]}, storage=tmp_path / "s.db")
@@ -0,0 +1,92 @@
+import os
+
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+
+from glassbox import ModelSearch
+from glassbox.core.search import Search
+from glassbox.schemas import Evaluator
+from glassbox.utils.threads import CoreBudget, available_cpus, limit_threads, thread_params
+
+X, y = load_iris(return_X_y=True)
+
+
+class ThreadsEvaluator(Evaluator):
+    """Reports the thread settings the trial ran with."""
+
+    def evaluate(self, model, X, y):
+        return model.score(X, y)
+
+    def evaluate_metrics(self, model, X, y):
+        metrics = {
+            "score": float(model.score(X, y)),
+            "n_jobs": float(model.n_jobs),
+            "omp": float(os.environ.get("OMP_NUM_THREADS", 0)),
+        }
+        if hasattr(os, "sched_getaffinity"):
+            metrics["cpu"] = float(min(os.sched_getaffinity(0)))
+        return metrics
+
+
+def _forest():
+    return RandomForestClassifier(n_estimators=5, n_jobs=-1, random_state=0)
+
+
+def test_core_budget_splits_cores():
+    budget = CoreBudget(8)
+    assert budget.threads_per_trial(3) == 2
+    assert budget.threads_per_trial(1) == 8
+    assert CoreBudget(2).threads_per_trial(4) == 1
+    with pytest.raises(ValueError):
+        CoreBudget(0)
+    with pytest.raises(ValueError):
+        CoreBudget([10**6])
+    cpus = available_cpus()
+    sets = CoreBudget(cpus, pin=True).cpu_sets(len(cpus))
+    assert sorted(c for s in sets for c in s) == cpus
+
+
+def test_thread_params_cap_estimator_threads():
+    params = {"n_jobs": -1, "nthread": None, "num_threads": 2, "C": 1.0}
+    assert thread_params(params, 4) == {"n_jobs": 4, "nthread": 4}
+    assert thread_params({"n_jobs": 8}, 4) == {"n_jobs": 4}
+    assert thread_params({"n_jobs": -1}, None) == {}
+
+
+def test_limit_threads_restores_environment(monkeypatch):
+    monkeypatch.delenv("OMP_NUM_THREADS", raising=False)
+    with limit_threads(2):
+        assert os.environ["OMP_NUM_THREADS"] == "2"
+    assert "OMP_NUM_THREADS" not in os.environ
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_search_splits_cores_between_workers(backend, monkeypatch):
+    monkeypatch.delenv("OMP_NUM_THREADS", raising=False)
+    s = Search("grid", {"max_depth": [1, 2, 3, 4]}, n_jobs=2, backend=backend, cores=4)
+    results = s.run(_forest(), X, y, ThreadsEvaluator())
+    assert all(r.metrics["n_jobs"] == 2 and r.metrics["omp"] == 2 for r in results)
+    assert "OMP_NUM_THREADS" not in os.environ
+
+
+def test_searched_thread_params_are_kept():
+    s = Search("grid", {"n_jobs": [1, 3]}, cores=4)
+    results = s.run(_forest(), X, y, ThreadsEvaluator())
+    assert [r.metrics["n_jobs"] for r in results] == [1, 3]
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="CPU affinity not supported")
+def test_pinned_workers_stay_in_budget():
+    before = os.sched_getaffinity(0)
+    budget = CoreBudget(pin=True)
+    ms = ModelSearch(
+        _forest(),
+        Search("grid", {"max_depth": [1, 2, 3]}, n_jobs=2),
+        ThreadsEvaluator(),
+        show_progress=False,
+        cores=budget,
+    )
+    ms.search(X, y)
+    assert all(r.metrics["cpu"] in budget.cpus for r in ms.results)
+    assert os.sched_getaffinity(0) == before
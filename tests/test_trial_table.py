@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.tree import DecisionTreeClassifier
+
+from glassbox.core.evaluator import SklearnEvaluator
+from glassbox.core.search import Search
+from glassbox.core.trial_table import TrialTable
+from glassbox.schemas import TrialResult
+
+
+def _table():
+    table = TrialTable()
+    for i in range(1, 11):
+        table.add_trial(
+            i,
+            {"max_depth": i % 4, "criterion": "gini" if i % 2 else "entropy"},
+            {"score": i / 10},
+            duration=0.5,
+        )
+    table.add_trial(11, {"max_depth": None}, {"score": float("nan"), "fit_time": 1.0}, 0.1, budget=3.0, state="pruned", intermediate={1: 0.2})
+    return table
+
+
+def test_trial_table_is_list_compatible():
+    table = _table()
+    assert len(table) == 11
+    first = table[0]
+    assert isinstance(first, TrialResult)
+    assert first.trial_id == 1 and first.params == {"max_depth": 1, "criterion": "gini"}
+    last = table[-1]
+    assert last.state == "pruned" and last.budget == 3.0 and last.intermediate == {1: 0.2}
+    assert last.params == {"max_depth": None}
+    assert np.isnan(last.metrics["score"]) and last.metrics["fit_time"] == 1.0
+    assert "fit_time" not in first.metrics
+    assert [r.trial_id for r in table[2:4]] == [3, 4]
+    assert [r.trial_id for r in table] == list(range(1, 12))
+    with pytest.raises(IndexError):
+        table[11]
+
+    table.append(TrialResult(trial_id=12, params={"max_depth": 2}, metrics={"score": 0.3}, duration=0.2))
+    assert len(table) == 12 and table[-1].params == {"max_depth": 2}
+    copied = TrialTable()
+    copied.extend(table)
+    assert [r.trial_id for r in copied] == list(range(1, 13))
+
+
+def test_trial_table_vectorized_queries():
+    table = _table()
+    assert [r.trial_id for r in table.best(3)] == [10, 9, 8]
+    deep = table.filter(table.column("max_depth") >= 2)
+    assert sorted(deep.trial_ids.tolist()) == [2, 3, 6, 7, 10]
+    assert table.column("criterion")[:2].tolist() == ["gini", "entropy"]
+    by_depth = table.aggregate("score", by="max_depth", func="max")
+    assert by_depth[3] == pytest.approx(0.7) and by_depth[0] == pytest.approx(0.8)
+    assert table.aggregate("score", func="count") == 10
+    assert table.sort("score", descending=True)[0].trial_id == 10
+    merged = TrialTable.concat([table.take([0, 1]), table.take([10])])
+    assert [r.params for r in merged] == [table[0].params, table[1].params, table[10].params]
+    assert merged[2].state == "pruned" and merged[2].intermediate == {1: 0.2}
+
+
+def test_trial_table_to_pandas():
+    pytest.importorskip("pandas")
+    frame = _table().to_pandas()
+    assert list(frame.columns[:4]) == ["trial_id", "duration", "budget", "state"]
+    assert frame["params/max_depth"].iloc[:4].tolist() == [1, 2, 3, 0]
+    assert frame["score"].iloc[9] == 1.0
+
+
+def test_trial_table_to_arrow():
+    pytest.importorskip("pyarrow")
+    arrow = _table().to_arrow()
+    assert arrow.num_rows == 11
+    assert arrow.column("params/criterion").to_pylist()[:2] == ["gini", "entropy"]
+
+
+def test_search_returns_trial_table():
+    X, y = load_iris(return_X_y=True)
+    search = Search("halving", {"max_depth": [1, 2, 3, 4, 5, 6, 7, 8, 9]}, n_trials=9, seed=0)
+    results = search.run(DecisionTreeClassifier(random_state=0), X, y, SklearnEvaluator())
+    assert isinstance(results, TrialTable)
+    assert results.trial_ids.tolist() == sorted(results.trial_ids.tolist())
+    assert set(results.budgets.tolist()) == {1 / 9, 1 / 3, 1.0}
+    full = results.filter(results.budgets == 1.0)
+    assert len(full) == 1
@@ -18,8 +18,9 @@ class DummyWandb:
         self.run = DummyRun()
         self.init_called = False
 
-    def init(self, project, config):
+    def init(self, project, config, mode=None):
         self.init_called = True
+        self.mode = mode
         self.project = project
         self.config = config
         return self.run
@@ -40,3 +41,58 @@ def test_wandb_tracker_integration(monkeypatch):
     assert dummy.init_called is True
     assert dummy.run.logged[0]["trial_id"] == 1
     assert dummy.run.finished is True
+
+
+def test_wandb_tracker_batches_trials_off_the_caller_thread():
+    import threading
+
+    dummy = DummyWandb()
+    release = threading.Event()
+    calls = []
+
+    def slow_log(data):
+        release.wait(timeout=5)
+        calls.append(data)
+
+    dummy.log = slow_log
+    tracker = WandbTracker(client=dummy, mode="offline", batch_size=3, flush_interval=0.01)
+    tracker.start({"strategy": "grid"})
+    for i in range(1, 8):
+        tracker.log(i, {"score": i / 10}, params={"C": i}, duration=0.1)
+    release.set()
+    tracker.finish()
+    assert [c["trial_id"] for c in calls] == [1, 2, 3, 4, 5, 6, 7]
+    assert [c["n_trials"] for c in calls] == [1, 2, 3, 4, 5, 6, 7]
+    assert [c["params/C"] for c in calls] == [1, 2, 3, 4, 5, 6, 7]
+    assert calls[-1]["best_score"] == 0.7
+    assert dummy.run.finished
+
+
+def test_model_search_streams_trials_to_tracker():
+    from sklearn.datasets import load_iris
+    from sklearn.linear_model import LogisticRegression
+
+    from glassbox import ModelSearch
+    from glassbox.core.evaluator import SklearnEvaluator
+    from glassbox.core.search import Search
+
+    dummy = DummyWandb()
+
+    X, y = load_iris(return_X_y=True)
+    tracker = WandbTracker(client=dummy, mode="offline", flush_interval=0.01)
+    ms = ModelSearch(
+        LogisticRegression(max_iter=50),
+        Search("grid", {"C": [0.1, 1.0, 10.0]}),
+        SklearnEvaluator(),
+        tracking=tracker,
+        verbose=True,
+        show_progress=False,
+    )
+    ms.search(X, y)  # finishes the tracker, so every trial has been delivered
+    assert dummy.run.finished
+    assert dummy.config == {"strategy": "grid"}
+    logged = dummy.run.logged
+    assert [entry["trial_id"] for entry in logged] == [1, 2, 3]
+    assert [entry["params/C"] for entry in logged] == [0.1, 1.0, 10.0]
+    assert logged[-1]["n_trials"] == 3
+    assert all("duration" in entry for entry in logged)
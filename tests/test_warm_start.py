@@ -0,0 +1,74 @@
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+from glassbox.core.evaluator import SklearnEvaluator
+from glassbox.core.search import Search
+from glassbox.core.space import SearchSpace
+from glassbox.core.parallel import KeepModel
+from glassbox.core.warm_start import fit_chain, warm_start_chains, warm_start_dimension
+
+X, y = load_iris(return_X_y=True)
+BUILT = []
+
+
+class CountingForest(RandomForestClassifier):
+    def fit(self, X, y, sample_weight=None):
+        BUILT.append(self.n_estimators - len(getattr(self, "estimators_", [])))
+        return super().fit(X, y, sample_weight)
+
+
+def test_chains_keep_grid_trial_ids():
+    space = SearchSpace({"max_depth": [2, 4], "n_estimators": [30, 10, 20]})
+    chains = list(warm_start_chains(space, "n_estimators"))
+    assert [[p["n_estimators"] for _, p in chain] for chain in chains] == [[10, 20, 30]] * 2
+    assert sorted(i for chain in chains for i, _ in chain) == list(range(1, 7))
+    for chain in chains:
+        for trial_id, params in chain:
+            assert space[trial_id - 1] == params
+
+
+def test_dimension_detection_requires_warm_start_param():
+    space = SearchSpace({"n_estimators": [1, 2]})
+    assert warm_start_dimension(RandomForestClassifier(), space) == "n_estimators"
+    assert warm_start_dimension(LogisticRegression(), SearchSpace({"C": [1, 2]})) == "C"
+    assert warm_start_dimension(LogisticRegression(), SearchSpace({"tol": [1, 2]})) is None
+    # LogisticRegression restarts its solver, so max_iter is not a warm-start axis.
+    assert warm_start_dimension(LogisticRegression(), SearchSpace({"max_iter": [1, 2]})) is None
+
+
+def test_warm_started_grid_builds_each_tree_once():
+    space = {"max_depth": [2, 3], "n_estimators": [5, 10, 15, 20]}
+    BUILT.clear()
+    warm = Search("grid", space, warm_start=True).run(
+        CountingForest(random_state=0), X, y, SklearnEvaluator()
+    )
+    assert sum(BUILT) == 2 * 20
+    BUILT.clear()
+    cold = Search("grid", space).run(CountingForest(random_state=0), X, y, SklearnEvaluator())
+    assert sum(BUILT) == 2 * (5 + 10 + 15 + 20)
+    assert [r.trial_id for r in warm] == [r.trial_id for r in cold]
+    assert [r.params for r in warm] == [r.params for r in cold]
+    for w, c in zip(warm, cold):
+        assert w.metrics["score"] == pytest.approx(c.metrics["score"])
+
+
+def test_cumulative_max_iter_grows_to_each_value():
+    space = {"max_iter": [20, 5, 50, 30]}
+    model = HistGradientBoostingClassifier(early_stopping=False, random_state=0)
+    warm = Search("grid", space, warm_start=True).run(model, X, y, SklearnEvaluator())
+    cold = Search("grid", space).run(model, X, y, SklearnEvaluator())
+    assert [r.params for r in warm] == [r.params for r in cold]
+    for w, c in zip(warm, cold):
+        assert w.metrics["score"] == pytest.approx(c.metrics["score"])
+
+
+def test_chains_only_return_models_that_can_be_kept():
+    chain = [{"n_estimators": n, "max_depth": 1} for n in (1, 2, 4, 8)]
+    model = RandomForestClassifier(random_state=0)
+    outcomes = fit_chain(model, chain, "n_estimators", X, y, SklearnEvaluator(), keep_model=KeepModel(k=1))
+    kept = [o for o in outcomes if o.model is not None]
+    assert len(kept) == 1
+    assert kept[0].metrics["score"] == max(o.metrics["score"] for o in outcomes)
+    assert all(o.model is None for o in fit_chain(model, chain, "n_estimators", X, y, SklearnEvaluator()))